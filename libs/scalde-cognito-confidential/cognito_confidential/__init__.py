@@ -1,7 +1,13 @@
 from .authentications import get_authorization_url, get_public_keys, get_tokens, logout, refresh_tokens
+from .caches import TokenCacheStats, VerifiedTokenCache
+from .clients import HttpClient, set_default_http_client
 from .config import AuthConfigDict
 from .exceptions import AuthError, RetryableAuthError
+from .flights import FileFlightLock, FlightLock, SingleFlight
+from .keys import JwksCache
 from .models import AccessTokenDict, IdTokenDict, PublicKey, TokenDict
+from .parsers import verify_tokens
+from .refreshers import TokenRefresher
 from .stores import AuthStore
 
 __all__ = [
@@ -10,9 +16,19 @@ __all__ = [
     "refresh_tokens",
     "get_public_keys",
     "logout",
+    "verify_tokens",
+    "set_default_http_client",
+    "HttpClient",
     "AuthConfigDict",
     "AuthError",
     "RetryableAuthError",
+    "JwksCache",
+    "SingleFlight",
+    "FlightLock",
+    "FileFlightLock",
+    "VerifiedTokenCache",
+    "TokenRefresher",
+    "TokenCacheStats",
     "AuthStore",
     "AccessTokenDict",
     "IdTokenDict",
@@ -0,0 +1,222 @@
+"""Async counterparts of the client API, for services running on asyncio.
+
+They share the validation logic and AuthStore semantics of the sync API, and send their requests
+with httpx, installed with the "async" extra. An httpx.AsyncClient can be given to reuse its
+connection pool, otherwise each call opens its own client with the default timeouts of the sync API.
+Timeouts and connection errors are raised as RetryableAuthError, except when an authorization code
+may have reached Cognito: it is single use, so those errors are then raised as AuthError.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+from .authentications import (
+    REFRESH_ERRORS,
+    clear_tokens,
+    get_raw_access_token,
+    get_stored_tokens,
+    parse_tokens,
+    resolve_public_keys,
+    store_tokens,
+)
+from .clients import (
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_READ_TIMEOUT_SECONDS,
+    logout_url,
+    public_keys_url,
+    redact_token_data,
+    refresh_token_request,
+    token_error,
+    token_request,
+)
+from .config import AuthConfigDict
+from .exceptions import AuthError, RetryableAuthError
+from .flights import SingleFlight, default_single_flight, flight_key
+from .keys import JwksCache, default_jwks_cache
+from .models import PublicKey, TokensDict
+from .stores import AuthStore
+
+if TYPE_CHECKING:
+    import httpx
+
+
+async def fetch_tokens(code: str, config: AuthConfigDict, client: "httpx.AsyncClient | None" = None) -> dict:
+    return await _post_token_request(token_request(code, config), client, single_use=True)
+
+
+async def fetch_refreshed_tokens(
+    refresh_token: str, config: AuthConfigDict, client: "httpx.AsyncClient | None" = None
+) -> dict:
+    return await _post_token_request(refresh_token_request(refresh_token, config), client, single_use=False)
+
+
+async def fetch_public_keys(config: AuthConfigDict, client: "httpx.AsyncClient | None" = None) -> list[PublicKey]:
+    import httpx
+
+    async with _client(client) as http:
+        try:
+            resp = await _request(http, "GET", public_keys_url(config))
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            logging.error(e)
+            raise AuthError("Failed to fetch public keys: http error")
+
+    return resp.json()["keys"]
+
+
+async def send_logout(config: AuthConfigDict, client: "httpx.AsyncClient | None" = None) -> None:
+    async with _client(client) as http:
+        try:
+            response = await _request(http, "GET", logout_url(config))
+            response.raise_for_status()
+        except RetryableAuthError:
+            raise
+        except Exception as e:
+            logging.error(e)
+            raise AuthError("Failed to send logout")
+
+
+async def get_public_keys(
+    config: AuthConfigDict,
+    store: AuthStore | None = None,
+    cache: JwksCache | None = None,
+    client: "httpx.AsyncClient | None" = None,
+) -> list[PublicKey]:
+    if store and "public_keys" in store:
+        logging.debug("public keys already fetched")
+        return store.public_keys
+
+    public_keys = await (cache or default_jwks_cache).get_keys_async(
+        config, lambda config: fetch_public_keys(config, client)
+    )
+
+    if store:
+        store.public_keys = public_keys
+
+    return public_keys
+
+
+async def get_tokens(
+    code: str | None,
+    config: AuthConfigDict,
+    public_keys: list[PublicKey] | None = None,
+    store: AuthStore | None = None,
+    client: "httpx.AsyncClient | None" = None,
+    flight: SingleFlight | None = None,
+) -> TokensDict:
+    public_keys = resolve_public_keys(public_keys, store)
+
+    if stored_tokens := get_stored_tokens(store):
+        return stored_tokens
+
+    if not code:
+        return await refresh_stored_tokens(config, public_keys, store, client, flight)
+
+    async def exchange_code() -> TokensDict:
+        # another process sharing the store may have exchanged the code while this one waited
+        if stored_tokens := get_stored_tokens(store):
+            return stored_tokens
+
+        tokens_resp = await fetch_tokens(code, config, client)
+        return store_tokens(parse_tokens(tokens_resp, public_keys, config), store)
+
+    return await (flight or default_single_flight).do_async(flight_key("code", code), exchange_code)
+
+
+async def refresh_tokens(
+    config: AuthConfigDict,
+    public_keys: list[PublicKey] | None = None,
+    store: AuthStore | None = None,
+    refresh_token: str | None = None,
+    client: "httpx.AsyncClient | None" = None,
+    flight: SingleFlight | None = None,
+) -> TokensDict:
+    """Get new tokens with the refresh token grant, from the given refresh token or the one of the store."""
+    public_keys = resolve_public_keys(public_keys, store)
+    refresh_token = refresh_token or (store.refresh_token["raw"] if store and "refresh_token" in store else None)
+    if not refresh_token:
+        raise AuthError("Failed to refresh tokens: no refresh token")
+
+    refreshed_access_token = get_raw_access_token(store)
+
+    async def refresh() -> TokensDict:
+        # another process sharing the store may have refreshed the tokens while this one waited
+        if get_raw_access_token(store) != refreshed_access_token and (stored_tokens := get_stored_tokens(store)):
+            return stored_tokens
+
+        # Cognito only sends a new refresh token when rotation is enabled
+        tokens_resp = {"refresh_token": refresh_token} | await fetch_refreshed_tokens(refresh_token, config, client)
+        return store_tokens(parse_tokens(tokens_resp, public_keys, config), store)
+
+    return await (flight or default_single_flight).do_async(flight_key("refresh", refresh_token), refresh)
+
+
+async def refresh_stored_tokens(
+    config: AuthConfigDict,
+    public_keys: list[PublicKey],
+    store: AuthStore | None,
+    client: "httpx.AsyncClient | None" = None,
+    flight: SingleFlight | None = None,
+) -> TokensDict:
+    if not store or "refresh_token" not in store:
+        return {}
+
+    try:
+        return await refresh_tokens(config, public_keys, store, client=client, flight=flight)
+    except REFRESH_ERRORS as e:
+        logging.warning(f"Failed to refresh expired tokens, a new authorization is needed: {e}")
+        return {}
+
+
+async def logout(
+    config: AuthConfigDict, store: AuthStore | None = None, client: "httpx.AsyncClient | None" = None
+) -> None:
+    await send_logout(config, client)
+    clear_tokens(store)
+
+
+async def _post_token_request(
+    request: tuple[str, dict, tuple[str, str]], client: "httpx.AsyncClient | None", single_use: bool
+) -> dict:
+    import httpx
+
+    url, data, auth = request
+    async with _client(client) as http:
+        try:
+            resp = await _request(http, "POST", url, idempotent=not single_use, data=data, auth=auth)
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logging.error(f"{e}; query data={redact_token_data(data)}; response={resp.text}")
+            raise token_error(resp.json, resp.status_code, single_use)
+
+    return resp.json()
+
+
+@asynccontextmanager
+async def _client(client: "httpx.AsyncClient | None") -> AsyncIterator["httpx.AsyncClient"]:
+    if client is not None:
+        yield client
+        return
+
+    import httpx
+
+    timeout = httpx.Timeout(DEFAULT_READ_TIMEOUT_SECONDS, connect=DEFAULT_CONNECT_TIMEOUT_SECONDS)
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        yield client
+
+
+async def _request(
+    http: "httpx.AsyncClient", method: str, url: str, idempotent: bool = True, **kwargs: Any
+) -> "httpx.Response":
+    import httpx
+
+    try:
+        return await http.request(method, url, **kwargs)
+    except httpx.TransportError as e:
+        logging.error(e)
+        message = f"Cognito request failed: {e.__class__.__name__}"
+        # like the sync client, a non idempotent request is only retried when it never reached Cognito
+        if idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)):
+            raise RetryableAuthError(message) from e
+        raise AuthError(message) from e
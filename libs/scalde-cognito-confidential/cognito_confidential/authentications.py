@@ -2,28 +2,28 @@ import datetime as dt
 import logging
 from urllib.parse import quote_plus
 
-from .clients import fetch_public_keys, fetch_tokens, send_logout
+from .clients import fetch_refreshed_tokens, fetch_tokens, send_logout
 from .config import AuthConfigDict
-from .exceptions import AuthError
+from .exceptions import AuthError, AuthValidationError, TokenExpired
+from .flights import SingleFlight, default_single_flight, flight_key
+from .keys import JwksCache, default_jwks_cache
 from .models import PublicKey, TokensDict
 from .parsers import map_access_token, map_id_token, parse_token
 from .stores import AuthStore
 from .validations import validate_access_token_payload, validate_id_token_payload
 
+# a refresh failing with these won't succeed by sending the same refresh token again
+REFRESH_ERRORS = (AuthError, AuthValidationError, TokenExpired)
 
-def get_public_keys(config: AuthConfigDict, store: AuthStore | None = None) -> list[PublicKey]:
+
+def get_public_keys(
+    config: AuthConfigDict, store: AuthStore | None = None, cache: JwksCache | None = None
+) -> list[PublicKey]:
     if store and "public_keys" in store:
-        print("public keys already fetched")
+        logging.debug("public keys already fetched")
         return store.public_keys
 
-    try:
-        public_keys = fetch_public_keys(config=config)
-    except Exception as e:
-        logging.error(e)
-        raise AuthError("Failed to fetch public keys")
-
-    if not public_keys:
-        raise AuthError("Failed to fetch public keys: empty response")
+    public_keys = (cache or default_jwks_cache).get_keys(config)
 
     if store:
         store.public_keys = public_keys
@@ -44,12 +44,35 @@ def get_tokens(
     config: AuthConfigDict,
     public_keys: list[PublicKey] | None = None,
     store: AuthStore | None = None,
+    flight: SingleFlight | None = None,
 ) -> TokensDict:
+    public_keys = resolve_public_keys(public_keys, store)
+
+    if stored_tokens := get_stored_tokens(store):
+        return stored_tokens
+
+    if not code:
+        return refresh_stored_tokens(config, public_keys, store, flight)
+
+    def exchange_code() -> TokensDict:
+        # another process sharing the store may have exchanged the code while this one waited
+        if stored_tokens := get_stored_tokens(store):
+            return stored_tokens
+
+        tokens_resp = fetch_tokens(code, config=config)
+        return store_tokens(parse_tokens(tokens_resp, public_keys, config), store)
+
+    return (flight or default_single_flight).do(flight_key("code", code), exchange_code)
+
+
+def resolve_public_keys(public_keys: list[PublicKey] | None, store: AuthStore | None) -> list[PublicKey]:
     if not public_keys and not store:
         raise ValueError("Either public_keys or store must be provided")
-    if not public_keys:
-        public_keys = store.public_keys
 
+    return public_keys or store.public_keys
+
+
+def get_stored_tokens(store: AuthStore | None) -> TokensDict | None:
     existing_access_token = store.access_token if store and "access_token" in store else None
     if existing_access_token and existing_access_token["expire_at"] > dt.datetime.now():
         logging.debug("tokens already exists in store and still valid")
@@ -59,11 +82,10 @@ def get_tokens(
             "refresh_token": store.refresh_token,
         }
 
-    if not code:
-        return {}
+    return None
 
-    tokens_resp = fetch_tokens(code, config=config)
 
+def parse_tokens(tokens_resp: dict, public_keys: list[PublicKey], config: AuthConfigDict) -> TokensDict:
     access_token = parse_token(
         token=tokens_resp["access_token"],
         public_keys=public_keys,
@@ -84,11 +106,6 @@ def get_tokens(
         "raw": tokens_resp["refresh_token"],
     }
 
-    if store:
-        store.access_token = access_token
-        store.id_token = id_token
-        store.refresh_token = refresh_token
-
     return {
         "access_token": access_token,
         "id_token": id_token,
@@ -96,12 +113,65 @@ def get_tokens(
     }
 
 
-def refresh_tokens(config: AuthConfigDict) -> None:
-    raise NotImplementedError("refresh_tokens not implemented yet")
+def store_tokens(tokens: TokensDict, store: AuthStore | None) -> TokensDict:
+    if store:
+        store.access_token = tokens["access_token"]
+        store.id_token = tokens["id_token"]
+        store.refresh_token = tokens["refresh_token"]
+
+    return tokens
+
+
+def refresh_tokens(
+    config: AuthConfigDict,
+    public_keys: list[PublicKey] | None = None,
+    store: AuthStore | None = None,
+    refresh_token: str | None = None,
+    flight: SingleFlight | None = None,
+) -> TokensDict:
+    """Get new tokens with the refresh token grant, from the given refresh token or the one of the store."""
+    public_keys = resolve_public_keys(public_keys, store)
+    refresh_token = refresh_token or (store.refresh_token["raw"] if store and "refresh_token" in store else None)
+    if not refresh_token:
+        raise AuthError("Failed to refresh tokens: no refresh token")
+
+    refreshed_access_token = get_raw_access_token(store)
+
+    def refresh() -> TokensDict:
+        # another process sharing the store may have refreshed the tokens while this one waited
+        if get_raw_access_token(store) != refreshed_access_token and (stored_tokens := get_stored_tokens(store)):
+            return stored_tokens
+
+        # Cognito only sends a new refresh token when rotation is enabled
+        tokens_resp = {"refresh_token": refresh_token} | fetch_refreshed_tokens(refresh_token, config=config)
+        return store_tokens(parse_tokens(tokens_resp, public_keys, config), store)
+
+    return (flight or default_single_flight).do(flight_key("refresh", refresh_token), refresh)
+
+
+def refresh_stored_tokens(
+    config: AuthConfigDict, public_keys: list[PublicKey], store: AuthStore | None, flight: SingleFlight | None
+) -> TokensDict:
+    if not store or "refresh_token" not in store:
+        return {}
+
+    try:
+        return refresh_tokens(config, public_keys, store, flight=flight)
+    except REFRESH_ERRORS as e:
+        logging.warning(f"Failed to refresh expired tokens, a new authorization is needed: {e}")
+        return {}
+
+
+def get_raw_access_token(store: AuthStore | None) -> str | None:
+    return store.access_token["raw"] if store and "access_token" in store else None
 
 
 def logout(config: AuthConfigDict, store: AuthStore | None = None) -> None:
     send_logout(config=config)
+    clear_tokens(store)
+
+
+def clear_tokens(store: AuthStore | None) -> None:
     if store:
         del store.access_token
         del store.id_token
@@ -0,0 +1,116 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Hashable
+
+from .config import AuthConfigDict
+from .models import PublicKey
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_EXPIRY_MARGIN_SECONDS = 30.0
+
+
+@dataclass
+class TokenCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of already verified tokens, keyed by a hash of the raw token.
+
+    A cached result is served until expiry_margin seconds before the token expires, and while the key
+    that verified its signature is still among the given public keys, unchanged. Other claims don't depend
+    on time once verified, so a hit skips decoding, claims validation and signature verification.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        expiry_margin: float = DEFAULT_EXPIRY_MARGIN_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("Max size must be positive")
+
+        self.max_size = max_size
+        self.expiry_margin = expiry_margin
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[dict, float, PublicKey]] = OrderedDict()
+        self._stats = TokenCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> TokenCacheStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def get(
+        self, token: str, config: AuthConfigDict, *validators: Any, public_keys: dict[str, PublicKey]
+    ) -> dict | None:
+        key = _cache_key(token, config, validators)
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self._stats.misses += 1
+                return None
+
+            result, expire_at, public_key = entry
+            if public_keys.get(public_key["kid"]) != public_key:
+                # the verifying key was rotated out or replaced, the signature has to be checked again
+                del self._entries[key]
+                self._stats.misses += 1
+                return None
+
+            if self._clock() >= expire_at - self.expiry_margin:
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return dict(result)
+
+    def put(
+        self,
+        token: str,
+        config: AuthConfigDict,
+        *validators: Any,
+        result: dict,
+        expire_at: float,
+        public_key: PublicKey,
+    ) -> None:
+        key = _cache_key(token, config, validators)
+        with self._lock:
+            self._entries[key] = (dict(result), expire_at, dict(public_key))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _cache_key(token: str, config: AuthConfigDict, validators: tuple) -> Hashable:
+    # the same token validated against another client, issuer or validator is another entry
+    return (
+        hashlib.sha256(token.encode()).digest(),
+        config.get("issuer"),
+        config.get("google_client_id"),
+        config.get("algorithm"),
+        validators,
+    )
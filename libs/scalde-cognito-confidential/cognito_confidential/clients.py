@@ -1,44 +1,177 @@
 import json
 import logging
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 from urllib.parse import quote_plus
 
-import requests
-
 from .config import AuthConfigDict
 from .exceptions import AuthError, RetryableAuthError
 from .models import PublicKey
 
+if TYPE_CHECKING:
+    import requests
 
-def fetch_tokens(code: str, config: AuthConfigDict) -> dict:
-    data = {
-        "grant_type": "authorization_code",
-        "code": code,
-        "redirect_uri": config["redirect_uri"],
-    }
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 3.05
+DEFAULT_READ_TIMEOUT_SECONDS = 10.0
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF_SECONDS = 0.2
+DEFAULT_MAX_BACKOFF_SECONDS = 2.0
+
+# OAuth errors of a grant that will be rejected again, like a revoked refresh token
+REJECTED_TOKEN_ERRORS = ("invalid_grant", "invalid_client", "unauthorized_client")
+# OAuth errors of Cognito itself failing, that any grant can be sent again for
+TRANSIENT_TOKEN_ERRORS = ("temporarily_unavailable", "server_error")
+
+T = TypeVar("T")
+
+
+class HttpClient:
+    """Shared http session of the Cognito calls.
+
+    Connections are pooled and kept alive between calls, every request has a connect and a read timeout,
+    and calls failing with a RetryableAuthError are retried with an exponential backoff and jitter.
+    Timeouts and connection errors are raised as RetryableAuthError, except for requests that are not
+    idempotent: those are only retried when they could not have reached Cognito.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = DEFAULT_READ_TIMEOUT_SECONDS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF_SECONDS,
+        max_backoff: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("Max retries must be positive or zero")
+
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self._session: "requests.Session | None" = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._new_session()
+        return self._session
+
+    def request(self, method: str, url: str, idempotent: bool = True, **kwargs: Any) -> "requests.Response":
+        import requests
+
+        try:
+            return self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except (requests.Timeout, requests.ConnectionError) as e:
+            logging.error(e)
+            message = f"Cognito request failed: {e.__class__.__name__}"
+            if idempotent or not _may_have_been_sent(e):
+                raise RetryableAuthError(message) from e
+            raise AuthError(message) from e
+
+    def retry(self, call: Callable[[], T]) -> T:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return call()
+            except RetryableAuthError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = min(self.backoff * 2**attempt, self.max_backoff) * random.uniform(0.5, 1)
+                logging.warning(f"{e}, retrying in {delay:.2f}s")
+                self._sleep(delay)
+
+    def close(self) -> None:
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _new_session(self) -> "requests.Session":
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+
+def _may_have_been_sent(error: Exception) -> bool:
+    import requests
+    from urllib3.exceptions import NewConnectionError
+
+    if isinstance(error, requests.ConnectTimeout):
+        return False
+    # a connection refused or a failed name resolution happen before anything is sent
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return not isinstance(reason, NewConnectionError)
+
+
+default_http_client = HttpClient()
+
+
+def set_default_http_client(client: HttpClient) -> None:
+    """Replace the http client used by the calls not given one, closing the previous one."""
+    global default_http_client
+    previous, default_http_client = default_http_client, client
+    previous.close()
+
+
+def fetch_tokens(code: str, config: AuthConfigDict, http: HttpClient | None = None) -> dict:
+    http = http or default_http_client
+    return http.retry(lambda: _fetch_tokens(code, config, http))
+
+
+def fetch_refreshed_tokens(refresh_token: str, config: AuthConfigDict, http: HttpClient | None = None) -> dict:
+    http = http or default_http_client
+    return http.retry(lambda: _post_token_request(refresh_token_request(refresh_token, config), http, single_use=False))
+
+
+def fetch_public_keys(config: AuthConfigDict, http: HttpClient | None = None) -> list[PublicKey]:
+    http = http or default_http_client
+    return http.retry(lambda: _fetch_public_keys(config, http))
+
+
+def send_logout(config: AuthConfigDict, http: HttpClient | None = None) -> None:
+    http = http or default_http_client
+    http.retry(lambda: _send_logout(config, http))
+
+
+def _fetch_tokens(code: str, config: AuthConfigDict, http: HttpClient) -> dict:
+    # an authorization code can only be used once, so it is only sent again when Cognito never got it
+    return _post_token_request(token_request(code, config), http, single_use=True)
+
+
+def _post_token_request(request: tuple[str, dict, tuple[str, str]], http: HttpClient, single_use: bool) -> dict:
+    import requests
+
+    url, data, auth = request
     try:
-        url = config["url"]
-        resp = requests.post(
-            f"{url}/oauth2/token",
-            data=data,
-            auth=(config["google_client_id"], config["google_client_secret"]),
-        )
+        resp = http.request("POST", url, idempotent=not single_use, data=data, auth=auth)
         resp.raise_for_status()
     except requests.HTTPError as e:
-        logging.error(f"{e}; query data={data}; response={resp.text}")
-        try:
-            error = resp.json()["error"]
-            raise RetryableAuthError(f"Failed to fetch tokens: {error}")
-        except (KeyError, TypeError, json.JSONDecodeError):
-            pass
-        raise AuthError("Failed to fetch tokens")
+        logging.error(f"{e}; query data={redact_token_data(data)}; response={resp.text}")
+        raise token_error(resp.json, resp.status_code, single_use)
 
     return resp.json()
 
 
-def fetch_public_keys(config: AuthConfigDict) -> list[PublicKey]:
+def _fetch_public_keys(config: AuthConfigDict, http: HttpClient) -> list[PublicKey]:
+    import requests
+
     try:
-        url = config["issuer"]
-        resp = requests.get(f"{url}/.well-known/jwks.json")
+        resp = http.request("GET", public_keys_url(config))
         resp.raise_for_status()
     except requests.HTTPError as e:
         logging.error(e)
@@ -47,13 +180,67 @@ def fetch_public_keys(config: AuthConfigDict) -> list[PublicKey]:
     return resp.json()["keys"]
 
 
-def send_logout(config: AuthConfigDict) -> None:
+def _send_logout(config: AuthConfigDict, http: HttpClient) -> None:
     try:
-        client_id = quote_plus(config["google_client_id"])
-        redirect_uri = quote_plus(config["redirect_uri"])
-        url = config["url"]
-        response = requests.get(f"{url}/logout?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code")
+        response = http.request("GET", logout_url(config))
         response.raise_for_status()
+    except RetryableAuthError:
+        raise
     except Exception as e:
         logging.error(e)
         raise AuthError("Failed to send logout")
+
+
+def token_request(code: str, config: AuthConfigDict) -> tuple[str, dict, tuple[str, str]]:
+    """Url, form data and basic auth of the authorization code grant, whatever the http client."""
+    data = {
+        "grant_type": "authorization_code",
+        "code": code,
+        "redirect_uri": config["redirect_uri"],
+    }
+    url = config["url"]
+    return f"{url}/oauth2/token", data, (config["google_client_id"], config["google_client_secret"])
+
+
+def refresh_token_request(refresh_token: str, config: AuthConfigDict) -> tuple[str, dict, tuple[str, str]]:
+    """Url, form data and basic auth of the refresh token grant, whatever the http client."""
+    data = {
+        "grant_type": "refresh_token",
+        "client_id": config["google_client_id"],
+        "refresh_token": refresh_token,
+    }
+    url = config["url"]
+    return f"{url}/oauth2/token", data, (config["google_client_id"], config["google_client_secret"])
+
+
+def redact_token_data(data: dict) -> dict:
+    """Form data of a token request safe to log, without its code or refresh token."""
+    return {key: "<redacted>" if key in ("code", "refresh_token") else value for key, value in data.items()}
+
+
+def token_error(read_json: Callable[[], Any], status_code: int = 400, single_use: bool = False) -> AuthError:
+    # Cognito failing can always be retried. Other OAuth errors mean Cognito answered, so a reusable grant
+    # can be sent again unless the grant itself is rejected, while a single use code is never sent twice.
+    try:
+        error = read_json()["error"]
+    except (KeyError, TypeError, json.JSONDecodeError):
+        error = None
+
+    message = f"Failed to fetch tokens: {error}" if error else "Failed to fetch tokens"
+    if status_code >= 500 or error in TRANSIENT_TOKEN_ERRORS:
+        return RetryableAuthError(message)
+    if error is None or single_use or error in REJECTED_TOKEN_ERRORS:
+        return AuthError(message)
+    return RetryableAuthError(message)
+
+
+def public_keys_url(config: AuthConfigDict) -> str:
+    url = config["issuer"]
+    return f"{url}/.well-known/jwks.json"
+
+
+def logout_url(config: AuthConfigDict) -> str:
+    client_id = quote_plus(config["google_client_id"])
+    redirect_uri = quote_plus(config["redirect_uri"])
+    url = config["url"]
+    return f"{url}/logout?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code"
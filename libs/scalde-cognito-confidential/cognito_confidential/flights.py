@@ -0,0 +1,188 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Hashable, TypeVar
+
+from .exceptions import RetryableAuthError
+
+if TYPE_CHECKING:
+    import asyncio
+
+DEFAULT_LOCK_TIMEOUT_SECONDS = 30.0
+DEFAULT_POLL_INTERVAL_SECONDS = 0.05
+
+T = TypeVar("T")
+
+
+class FlightLock(ABC):
+    """Lock shared by the processes using the same AuthStore, so that only one of them runs a flight."""
+
+    @abstractmethod
+    def acquire(self, key: str, timeout: float) -> bool:
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        pass
+
+
+class FileFlightLock(FlightLock):
+    """Flight lock shared by the processes of one host, through lock files of a directory.
+
+    A lock file is removed by the holder releasing it, so that the directory doesn't grow with each
+    single use code. A waiter that locked a removed file tries again on the current one.
+    """
+
+    def __init__(self, directory: str, poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self._fds: dict[str, tuple[int, str]] = {}
+
+    def acquire(self, key: str, timeout: float) -> bool:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        path = os.path.join(self.directory, f"{name}.lock")
+        deadline = time.monotonic() + timeout
+        while True:
+            fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o600)
+            if not self._lock(fd, deadline):
+                os.close(fd)
+                return False
+            if _is_same_file(fd, path):
+                self._fds[key] = (fd, path)
+                return True
+            os.close(fd)
+
+    def release(self, key: str) -> None:
+        import fcntl
+
+        fd, path = self._fds.pop(key)
+        os.unlink(path)
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    def _lock(self, fd: int, deadline: float) -> bool:
+        import fcntl
+
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(self.poll_interval)
+
+
+def _is_same_file(fd: int, path: str) -> bool:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return False
+    fd_stat = os.fstat(fd)
+    return (stat.st_dev, stat.st_ino) == (fd_stat.st_dev, fd_stat.st_ino)
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+
+
+class SingleFlight:
+    """Run a single call at a time for each key, concurrent callers of the same key waiting for its result.
+
+    Threads and asyncio tasks are coordinated separately within the process. With a FlightLock,
+    the call also runs under that lock, so that processes sharing an AuthStore run it once: a call
+    must then check the store before doing its work, since another process may have done it already.
+    """
+
+    def __init__(self, lock: FlightLock | None = None, lock_timeout: float = DEFAULT_LOCK_TIMEOUT_SECONDS) -> None:
+        self.lock = lock
+        self.lock_timeout = lock_timeout
+        self._flights: dict[Hashable, _Flight] = {}
+        self._async_flights: dict[tuple[int, Hashable], "asyncio.Task"] = {}
+        self._flights_lock = threading.Lock()
+
+    def do(self, key: str, call: Callable[[], T]) -> T:
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+
+        if not is_leader:
+            logging.debug(f"waiting for flight {key}")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._call_locked(key, call)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def do_async(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        if (task := self._async_flights.get(flight_key)) is None:
+            task = self._async_flights[flight_key] = loop.create_task(self._call_locked_async(key, call))
+            task.add_done_callback(lambda done: self._land_async_flight(flight_key, done))
+        else:
+            logging.debug(f"waiting for flight {key}")
+
+        # the call runs in a task of its own, so that a cancelled caller leaves it running for the others
+        return await asyncio.shield(task)
+
+    def _land_async_flight(self, flight_key: tuple[int, Hashable], task: "asyncio.Task") -> None:
+        del self._async_flights[flight_key]
+        if not task.cancelled():
+            task.exception()  # retrieved even when every caller was cancelled
+
+    def _call_locked(self, key: str, call: Callable[[], T]) -> T:
+        if self.lock is None:
+            return call()
+
+        self._check_acquired(self.lock.acquire(key, self.lock_timeout), key)
+        try:
+            return call()
+        finally:
+            self.lock.release(key)
+
+    async def _call_locked_async(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        if self.lock is None:
+            return await call()
+
+        import asyncio
+
+        self._check_acquired(await asyncio.to_thread(self.lock.acquire, key, self.lock_timeout), key)
+        try:
+            return await call()
+        finally:
+            self.lock.release(key)
+
+    def _check_acquired(self, acquired: bool, key: str) -> None:
+        if not acquired:
+            raise RetryableAuthError(f"Timed out waiting for flight {key}")
+
+
+def flight_key(kind: str, secret: str) -> str:
+    # flights are keyed by a hash, so that codes and tokens don't leak into lock files or logs
+    return f"{kind}:{hashlib.sha256(secret.encode()).hexdigest()}"
+
+
+default_single_flight = SingleFlight()
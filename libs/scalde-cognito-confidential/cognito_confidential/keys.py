@@ -0,0 +1,235 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from .clients import fetch_public_keys
+from .config import AuthConfigDict
+from .exceptions import AuthError
+from .flights import SingleFlight, flight_key
+from .models import PublicKey
+
+if TYPE_CHECKING:
+    import asyncio
+
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_REFRESH_AHEAD_RATIO = 0.8
+DEFAULT_MIN_REFETCH_INTERVAL_SECONDS = 30.0
+
+FetchPublicKeys = Callable[[AuthConfigDict], list[PublicKey]]
+FetchPublicKeysAsync = Callable[[AuthConfigDict], Awaitable[list[PublicKey]]]
+
+
+@dataclass
+class _JwksEntry:
+    keys: list[PublicKey]
+    keys_by_kid: dict[str, PublicKey]
+    fetched_at: float
+    refreshing: bool = False
+
+
+@dataclass
+class _IssuerState:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    entry: _JwksEntry | None = None
+    last_fetch_at: float | None = None
+
+
+class JwksCache:
+    """Process-wide cache of the public keys of each issuer.
+
+    Keys are fetched once for all concurrent callers, refreshed in a background thread once
+    refresh_ahead_ratio of their TTL is elapsed, and fetched again synchronously once expired.
+    An unknown key id triggers a refetch, at most once every min_refetch_interval seconds per issuer,
+    to pick up rotated keys. The async methods give the same guarantees to the tasks of an event loop,
+    refreshing ahead in a task of their own.
+    """
+
+    def __init__(
+        self,
+        fetch: FetchPublicKeys | None = None,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        refresh_ahead_ratio: float = DEFAULT_REFRESH_AHEAD_RATIO,
+        min_refetch_interval: float = DEFAULT_MIN_REFETCH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0 or not 0 < refresh_ahead_ratio <= 1:
+            raise ValueError("TTL must be positive and refresh ahead ratio between 0 and 1")
+
+        self._fetch = fetch or (lambda config: fetch_public_keys(config=config))
+        self.ttl = ttl
+        self.refresh_ahead_ratio = refresh_ahead_ratio
+        self.min_refetch_interval = min_refetch_interval
+        self._clock = clock
+        self._issuers: dict[str, _IssuerState] = {}
+        self._issuers_lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._refresh_tasks: set["asyncio.Task"] = set()
+
+    def get_keys(self, config: AuthConfigDict) -> list[PublicKey]:
+        return self._get_entry(config).keys
+
+    def get_keys_by_kid(self, config: AuthConfigDict) -> dict[str, PublicKey]:
+        return self._get_entry(config).keys_by_kid
+
+    def get_key(self, config: AuthConfigDict, kid: str) -> PublicKey:
+        entry = self._get_entry(config)
+        if kid in entry.keys_by_kid:
+            return entry.keys_by_kid[kid]
+
+        state = self._get_state(config["issuer"])
+        with state.lock:
+            if state.entry is None or (kid not in state.entry.keys_by_kid and self._can_refetch(state)):
+                logging.debug(f"unknown key id {kid}, fetching public keys again")
+                self._fetch_entry(state, config)
+
+            if kid not in state.entry.keys_by_kid:
+                raise AuthError("Invalid token key id")
+            return state.entry.keys_by_kid[kid]
+
+    async def get_keys_async(self, config: AuthConfigDict, fetch: FetchPublicKeysAsync) -> list[PublicKey]:
+        """Async counterpart of get_keys, fetching keys with the given coroutine function."""
+        return (await self._get_entry_async(config, fetch)).keys
+
+    async def get_key_async(self, config: AuthConfigDict, kid: str, fetch: FetchPublicKeysAsync) -> PublicKey:
+        """Async counterpart of get_key, fetching keys with the given coroutine function."""
+        entry = await self._get_entry_async(config, fetch)
+        if kid in entry.keys_by_kid:
+            return entry.keys_by_kid[kid]
+
+        state = self._get_state(config["issuer"])
+        if state.entry is None or (kid not in state.entry.keys_by_kid and self._can_refetch(state)):
+            logging.debug(f"unknown key id {kid}, fetching public keys again")
+            await self._fetch_entry_async(state, config, fetch)
+
+        if kid not in state.entry.keys_by_kid:
+            raise AuthError("Invalid token key id")
+        return state.entry.keys_by_kid[kid]
+
+    def invalidate(self, issuer: str | None = None) -> None:
+        with self._issuers_lock:
+            if issuer is None:
+                self._issuers.clear()
+            else:
+                self._issuers.pop(issuer, None)
+
+    def _get_entry(self, config: AuthConfigDict) -> _JwksEntry:
+        state = self._get_state(config["issuer"])
+        entry = state.entry
+        if entry is None or self._age(entry) >= self.ttl:
+            with state.lock:
+                # another caller may have fetched the keys while this one was waiting
+                if state.entry is None or self._age(state.entry) >= self.ttl:
+                    self._fetch_entry(state, config)
+                return state.entry
+
+        if (
+            self._age(entry) >= self.ttl * self.refresh_ahead_ratio
+            and not entry.refreshing
+            and self._can_refetch(state)
+        ):
+            self._refresh_in_background(state, entry, config)
+
+        return entry
+
+    async def _get_entry_async(self, config: AuthConfigDict, fetch: FetchPublicKeysAsync) -> _JwksEntry:
+        state = self._get_state(config["issuer"])
+        entry = state.entry
+        if entry is None or self._age(entry) >= self.ttl:
+            await self._fetch_entry_async(state, config, fetch)
+            return state.entry
+
+        if (
+            self._age(entry) >= self.ttl * self.refresh_ahead_ratio
+            and not entry.refreshing
+            and self._can_refetch(state)
+        ):
+            self._refresh_in_task(state, entry, config, fetch)
+
+        return entry
+
+    def _get_state(self, issuer: str) -> _IssuerState:
+        with self._issuers_lock:
+            return self._issuers.setdefault(issuer, _IssuerState())
+
+    def _fetch_entry(self, state: _IssuerState, config: AuthConfigDict) -> None:
+        state.last_fetch_at = self._clock()
+        try:
+            keys = self._fetch(config)
+        except Exception as e:
+            logging.error(e)
+            raise AuthError("Failed to fetch public keys")
+
+        if not keys:
+            raise AuthError("Failed to fetch public keys: empty response")
+
+        state.entry = self._new_entry(keys)
+
+    async def _fetch_entry_async(
+        self, state: _IssuerState, config: AuthConfigDict, fetch: FetchPublicKeysAsync
+    ) -> None:
+        async def fetch_entry() -> None:
+            state.last_fetch_at = self._clock()
+            try:
+                keys = await fetch(config)
+            except Exception as e:
+                logging.error(e)
+                raise AuthError("Failed to fetch public keys")
+
+            if not keys:
+                raise AuthError("Failed to fetch public keys: empty response")
+
+            state.entry = self._new_entry(keys)
+
+        # concurrent tasks of an issuer wait for a single fetch
+        await self._flight.do_async(flight_key("jwks", config["issuer"]), fetch_entry)
+
+    def _new_entry(self, keys: list[PublicKey]) -> _JwksEntry:
+        return _JwksEntry(keys=keys, keys_by_kid={key["kid"]: key for key in keys}, fetched_at=self._clock())
+
+    def _refresh_in_background(self, state: _IssuerState, entry: _JwksEntry, config: AuthConfigDict) -> None:
+        with state.lock:
+            if entry.refreshing or state.entry is not entry:
+                return
+            entry.refreshing = True
+
+        def refresh() -> None:
+            with state.lock:
+                try:
+                    self._fetch_entry(state, config)
+                except AuthError as e:
+                    # the current keys stay in use until they expire
+                    logging.warning(f"Background refresh of public keys failed: {e}")
+                    entry.refreshing = False
+
+        threading.Thread(target=refresh, name="jwks-refresh", daemon=True).start()
+
+    def _refresh_in_task(
+        self, state: _IssuerState, entry: _JwksEntry, config: AuthConfigDict, fetch: FetchPublicKeysAsync
+    ) -> None:
+        import asyncio
+
+        entry.refreshing = True
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_entry_async(state, config, fetch)
+            except AuthError as e:
+                # the current keys stay in use until they expire
+                logging.warning(f"Background refresh of public keys failed: {e}")
+                entry.refreshing = False
+
+        # tasks are only weakly referenced by the event loop
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    def _can_refetch(self, state: _IssuerState) -> bool:
+        return state.last_fetch_at is None or self._clock() - state.last_fetch_at >= self.min_refetch_interval
+
+    def _age(self, entry: _JwksEntry) -> float:
+        return self._clock() - entry.fetched_at
+
+
+default_jwks_cache = JwksCache()
@@ -1,14 +1,25 @@
 import base64
 import datetime as dt
-import json
-from typing import Protocol
-
-from jose import jws
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Protocol
 
+from .caches import VerifiedTokenCache
 from .config import AuthConfigDict
-from .exceptions import AuthError
+from .exceptions import AuthError, AuthValidationError
 from .models import AccessTokenDict, IdTokenDict, PublicKey
-from .validations import ValidateTokenPayload, validate_raw_token, validate_token_header, validate_token_signature
+from .validations import ValidateTokenPayload, validate_token_header, verify_token_signature
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+class DecodedToken(NamedTuple):
+    header: dict
+    payload: dict
+    signing_input: bytes
+    signature: bytes
 
 
 class MapToken(Protocol):
@@ -18,28 +29,123 @@ class MapToken(Protocol):
 
 def parse_token(
     token: str | None,
-    public_keys: list[PublicKey],
+    public_keys: list[PublicKey] | dict[str, PublicKey],
     validate_payload: ValidateTokenPayload,
     map_token: MapToken,
     config: AuthConfigDict,
+    cache: VerifiedTokenCache | None = None,
 ) -> AccessTokenDict:
+    keys_by_kid = _index_public_keys(public_keys)
+    if (
+        cache is not None
+        and token
+        and (cached := cache.get(token, config, validate_payload, map_token, public_keys=keys_by_kid))
+    ):
+        return cached
 
-    validate_raw_token(token)
+    return _verify_decoded_token(token, decode_token(token), keys_by_kid, validate_payload, map_token, config, cache)
 
-    payload = _parse_token_payload(token)
-    validate_payload(payload, config=config)
 
-    header = _parse_token_header(token)
-    validate_token_header(header, config=config)
+def verify_tokens(
+    tokens: Iterable[str],
+    public_keys: list[PublicKey] | dict[str, PublicKey],
+    validate_payload: ValidateTokenPayload,
+    map_token: MapToken,
+    config: AuthConfigDict,
+    max_workers: int | None = None,
+    cache: VerifiedTokenCache | None = None,
+) -> list[AccessTokenDict | Exception]:
+    """Verify a batch of tokens, without stopping at the first invalid one.
+
+    Tokens are decoded once, grouped by key id so that each group reuses its verification key, and
+    verified on a thread pool when max_workers is greater than 1.
+
+    Returns:
+        list[AccessTokenDict | Exception]: for each token, in order, its mapped token or the error rejecting it
+    """
+    tokens = list(tokens)
+    keys_by_kid = _index_public_keys(public_keys)
+    results, groups = _decode_tokens_by_kid(tokens, keys_by_kid, validate_payload, map_token, config, cache)
+
+    def verify_group(group: list[tuple[int, DecodedToken]]) -> None:
+        for position, decoded in group:
+            try:
+                results[position] = _verify_decoded_token(
+                    tokens[position], decoded, keys_by_kid, validate_payload, map_token, config, cache
+                )
+            except Exception as e:  # a token breaking a custom validator or mapper only fails itself
+                results[position] = e
+
+    if max_workers is None or max_workers <= 1:
+        for group in groups.values():
+            verify_group(group)
+    else:
+        # large groups are split so that a single key id still spreads over all workers
+        chunks = [group[i::max_workers] for group in groups.values() for i in range(min(max_workers, len(group)))]
+        with ThreadPoolExecutor(max_workers) as executor:
+            list(executor.map(verify_group, chunks))
+
+    return results
+
+
+def _decode_tokens_by_kid(
+    tokens: list[str],
+    keys_by_kid: dict[str, PublicKey],
+    validate_payload: ValidateTokenPayload,
+    map_token: MapToken,
+    config: AuthConfigDict,
+    cache: VerifiedTokenCache | None,
+) -> tuple[list, dict[str | None, list[tuple[int, DecodedToken]]]]:
+    """Decode tokens, filling the results of cached and malformed ones and grouping the others by key id."""
+    results: list[AccessTokenDict | Exception | None] = [None] * len(tokens)
+    groups: dict[str | None, list[tuple[int, DecodedToken]]] = {}
+    for position, token in enumerate(tokens):
+        if (
+            cache is not None
+            and token
+            and (cached := cache.get(token, config, validate_payload, map_token, public_keys=keys_by_kid))
+        ):
+            results[position] = cached
+            continue
+        try:
+            decoded = decode_token(token)
+        except Exception as e:
+            results[position] = e
+            continue
+        # an invalid key id is grouped with missing ones, and rejected on verification
+        kid = decoded.header.get("kid")
+        groups.setdefault(kid if isinstance(kid, str) else None, []).append((position, decoded))
+
+    return results, groups
+
+
+def _verify_decoded_token(
+    token: str,
+    decoded: DecodedToken,
+    keys_by_kid: dict[str, PublicKey],
+    validate_payload: ValidateTokenPayload,
+    map_token: MapToken,
+    config: AuthConfigDict,
+    cache: VerifiedTokenCache | None,
+) -> AccessTokenDict:
+    validate_payload(decoded.payload, config=config)
+    validate_token_header(decoded.header, config=config)
 
-    key_id = header.get("kid")
-    try:
-        public_key = [key for key in public_keys if key["kid"] == key_id][0]
-    except KeyError:
+    kid = decoded.header.get("kid")
+    if not isinstance(kid, str) or (public_key := keys_by_kid.get(kid)) is None:
         raise AuthError("Invalid token key id")
-    validate_token_signature(token, public_key)
+    verify_token_signature(decoded.signing_input, decoded.signature, public_key)
+
+    result = map_token(token, decoded.payload, decoded.header)
+    # a custom validator may accept tokens without expiry, those are verified on every call
+    if cache is not None and isinstance(expire_at := decoded.payload.get("exp"), (int, float)):
+        cache.put(token, config, validate_payload, map_token, result=result, expire_at=expire_at, public_key=public_key)
 
-    return map_token(token, payload, header)
+    return result
+
+
+def _index_public_keys(public_keys: list[PublicKey] | dict[str, PublicKey]) -> dict[str, PublicKey]:
+    return public_keys if isinstance(public_keys, dict) else {key["kid"]: key for key in public_keys}
 
 
 def map_access_token(raw_token: str, payload: dict, header: dict) -> AccessTokenDict:
@@ -61,25 +167,39 @@ def map_id_token(raw_token: str, payload: dict, header: dict) -> IdTokenDict:
     }
 
 
-def _parse_token_payload(token: str) -> dict:
-    raw_payload = token.split(".")[1]
-    try:
-        payload = base64.b64decode(raw_payload + "=" * (4 - len(raw_payload) % 4))
-    except Exception as e:
-        raise AuthError("Invalid token payload") from e
+def decode_token(token: str | None) -> DecodedToken:
+    """Split a token once and decode its header, payload and signature, without verifying anything."""
+    if not token:
+        raise AuthValidationError("Token is empty")
+    if (nb_parts := len(parts := token.split("."))) != 3:
+        raise AuthValidationError(f"Invalid token format: expected 3 parts, got {nb_parts}")
 
+    raw_header, raw_payload, raw_signature = parts
+    payload = _decode_json_part(raw_payload, "Invalid token payload")
+    header = _decode_json_part(raw_header, "Invalid token header")
     try:
-        payload = json.loads(payload)
-    except Exception as e:
-        raise AuthError("Invalid token payload") from e
+        signature = _b64url_decode(raw_signature)
+    except ValueError as e:
+        raise AuthError("Invalid token signature encoding") from e
 
-    return payload
+    return DecodedToken(
+        header=header,
+        payload=payload,
+        signing_input=f"{raw_header}.{raw_payload}".encode(),
+        signature=signature,
+    )
 
 
-def _parse_token_header(token: str) -> dict:
+def _decode_json_part(part: str, error_message: str) -> dict:
     try:
-        header = jws.get_unverified_header(token)
-    except Exception as e:
-        raise AuthError("Invalid token header") from e
+        decoded = _json_loads(_b64url_decode(part))
+    except ValueError as e:  # binascii and JSON decoding errors derive from it
+        raise AuthError(error_message) from e
+
+    if not isinstance(decoded, dict):
+        raise AuthError(error_message)
+    return decoded
+
 
-    return header
+def _b64url_decode(part: str) -> bytes:
+    return base64.urlsafe_b64decode(part + "=" * (-len(part) % 4))
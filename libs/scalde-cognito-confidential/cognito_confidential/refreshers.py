@@ -0,0 +1,159 @@
+import datetime as dt
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+from .authentications import REFRESH_ERRORS, get_public_keys, refresh_tokens
+from .config import AuthConfigDict
+from .exceptions import RetryableAuthError
+from .flights import SingleFlight
+from .models import PublicKey
+from .stores import AuthStore
+
+DEFAULT_MARGIN_SECONDS = 60.0
+DEFAULT_JITTER_SECONDS = 30.0
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_INTERVAL_SECONDS = 5.0
+DEFAULT_MAX_RETRY_DELAY_SECONDS = 300.0
+
+
+@dataclass
+class _Registration:
+    store: AuthStore
+    access_token: str | None = None
+    refresh_at: dt.datetime | None = None
+    refreshing: bool = False
+    nb_failures: int = 0
+    retry_at: dt.datetime | None = None
+
+
+class TokenRefresher:
+    """Refresh the tokens of registered stores in a background thread, shortly before they expire.
+
+    A store is refreshed between margin and margin + jitter seconds before its access token expires,
+    the jitter spreading the refreshes of tokens issued together. At most max_concurrency refreshes
+    run at once. A store whose refresh fails for a non retryable reason is unregistered, otherwise its
+    refresh is retried after interval seconds, doubled on each consecutive failure up to max_retry_delay.
+    """
+
+    def __init__(
+        self,
+        config: AuthConfigDict,
+        public_keys: list[PublicKey] | None = None,
+        margin: float = DEFAULT_MARGIN_SECONDS,
+        jitter: float = DEFAULT_JITTER_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY_SECONDS,
+        flight: SingleFlight | None = None,
+        clock: Callable[[], dt.datetime] = dt.datetime.now,
+    ) -> None:
+        if margin < 0 or jitter < 0 or max_concurrency <= 0:
+            raise ValueError("Margin and jitter must be positive or zero, and max concurrency positive")
+
+        self.config = config
+        self.public_keys = public_keys
+        self.margin = margin
+        self.jitter = jitter
+        self.interval = interval
+        self.max_retry_delay = max_retry_delay
+        self.flight = flight
+        self._clock = clock
+        self._registrations: dict[int, _Registration] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="token-refresh")
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, store: AuthStore) -> None:
+        with self._lock:
+            self._registrations.setdefault(id(store), _Registration(store))
+
+    def remove(self, store: AuthStore) -> None:
+        with self._lock:
+            self._registrations.pop(id(store), None)
+
+    def __len__(self) -> int:
+        return len(self._registrations)
+
+    def start(self) -> "TokenRefresher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="token-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "TokenRefresher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def refresh_due(self) -> int:
+        """Schedule the refresh of the stores due, returning their number."""
+        now = self._clock()
+        with self._lock:
+            due = [registration for registration in self._registrations.values() if self._is_due(registration, now)]
+            for registration in due:
+                registration.refreshing = True
+
+        for registration in due:
+            self._executor.submit(self._refresh, registration)
+        return len(due)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.refresh_due()
+            except Exception as e:
+                logging.error(f"Failed to schedule token refreshes: {e}")
+
+    def _is_due(self, registration: _Registration, now: dt.datetime) -> bool:
+        store = registration.store
+        if registration.refreshing or "access_token" not in store or "refresh_token" not in store:
+            return False
+
+        access_token = store.access_token
+        if access_token["raw"] != registration.access_token:
+            # the jitter is drawn once per access token, so that each one gets a stable refresh time
+            delay = self.margin + random.uniform(0, self.jitter)
+            registration.access_token = access_token["raw"]
+            registration.refresh_at = access_token["expire_at"] - dt.timedelta(seconds=delay)
+
+        if registration.retry_at is not None and now < registration.retry_at:
+            return False
+
+        return now >= registration.refresh_at
+
+    def _refresh(self, registration: _Registration) -> None:
+        try:
+            public_keys = self.public_keys or get_public_keys(self.config)
+            refresh_tokens(self.config, public_keys, registration.store, flight=self.flight)
+        except RetryableAuthError as e:
+            delay = self._retry_later(registration)
+            logging.warning(f"Failed to refresh tokens, retrying in {delay:.0f}s: {e}")
+        except REFRESH_ERRORS as e:
+            logging.warning(f"Failed to refresh tokens, unregistering the store: {e}")
+            self.remove(registration.store)
+        except Exception as e:
+            delay = self._retry_later(registration)
+            logging.error(f"Failed to refresh tokens, retrying in {delay:.0f}s: {e}")
+        else:
+            registration.nb_failures = 0
+            registration.retry_at = None
+        finally:
+            registration.refreshing = False
+
+    def _retry_later(self, registration: _Registration) -> float:
+        delay = min(self.interval * 2**registration.nb_failures, self.max_retry_delay)
+        registration.nb_failures += 1
+        registration.retry_at = self._clock() + dt.timedelta(seconds=delay)
+        return delay
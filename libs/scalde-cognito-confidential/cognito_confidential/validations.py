@@ -1,13 +1,17 @@
+import base64
 import datetime as dt
-from typing import Protocol
-
-from jose import jwk
-from jose.utils import base64url_decode
+import functools
+import importlib.util
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Protocol
 
 from .config import AuthConfigDict
 from .exceptions import AuthValidationError, TokenExpired
 from .models import PublicKey
 
+KEY_CACHE_SIZE = 64
+
 
 class ValidateTokenPayload(Protocol):
     def __call__(self, payload: dict, config: AuthConfigDict) -> None:
@@ -27,15 +31,133 @@ def validate_token_header(header: dict, config: AuthConfigDict) -> None:
 
 
 def validate_token_signature(token: str, public_key: PublicKey) -> None:
+    from jose.utils import base64url_decode
+
     message, signature = token.rsplit(".", 1)
+    verify_token_signature(message.encode(), base64url_decode(signature.encode()), public_key)
 
-    key = jwk.construct(public_key)
-    decoded_signature = base64url_decode(signature.encode())
 
-    if not key.verify(message.encode(), decoded_signature):
+def verify_token_signature(signing_input: bytes, signature: bytes, public_key: PublicKey) -> None:
+    if not construct_key(public_key).verify(signing_input, signature):
         raise AuthValidationError("Invalid token signature")
 
 
+class VerificationKey(Protocol):
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        pass
+
+
+class SignatureBackend(ABC):
+    name: str
+
+    def supports(self, public_key: PublicKey) -> bool:
+        return True
+
+    @abstractmethod
+    def load_key(self, public_key: PublicKey) -> VerificationKey:
+        pass
+
+
+class CryptographyBackend(SignatureBackend):
+    """Verify RSA signatures with the native primitives of the cryptography package."""
+
+    name = "cryptography"
+
+    _HASHES = {"RS256": "SHA256", "RS384": "SHA384", "RS512": "SHA512"}
+
+    def supports(self, public_key: PublicKey) -> bool:
+        return public_key.get("kty") == "RSA" and public_key.get("alg", "RS256") in self._HASHES
+
+    def load_key(self, public_key: PublicKey) -> VerificationKey:
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+
+        numbers = RSAPublicNumbers(e=_b64url_to_int(public_key["e"]), n=_b64url_to_int(public_key["n"]))
+        hash_algorithm = getattr(hashes, self._HASHES[public_key.get("alg", "RS256")])()
+        return _CryptographyRSAKey(numbers.public_key(), hash_algorithm)
+
+
+class JoseBackend(SignatureBackend):
+    """Verify signatures with python-jose, whatever its own backend is."""
+
+    name = "python-jose"
+
+    def load_key(self, public_key: PublicKey) -> VerificationKey:
+        from jose import jwk
+
+        return jwk.construct(dict(public_key))
+
+
+class _CryptographyRSAKey:
+    def __init__(self, key: Any, hash_algorithm: Any) -> None:
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        self._key = key
+        self._hash_algorithm = hash_algorithm
+        self._padding = padding.PKCS1v15()
+        self._invalid_signature = InvalidSignature
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        try:
+            self._key.verify(sig, msg, self._padding, self._hash_algorithm)
+        except self._invalid_signature:
+            return False
+        return True
+
+
+_JOSE_BACKEND = JoseBackend()
+_signature_backend: SignatureBackend | None = None
+
+
+def get_signature_backend() -> SignatureBackend:
+    """Backend verifying signatures, the native cryptography one when it is installed."""
+    global _signature_backend
+    if _signature_backend is None:
+        has_cryptography = importlib.util.find_spec("cryptography") is not None
+        _signature_backend = CryptographyBackend() if has_cryptography else _JOSE_BACKEND
+        logging.debug(f"verifying token signatures with {_signature_backend.name}")
+
+    return _signature_backend
+
+
+def set_signature_backend(backend: SignatureBackend | str | None) -> None:
+    """Force the backend verifying signatures, by instance or name. None restores the automatic choice."""
+    global _signature_backend
+    if isinstance(backend, str):
+        backends = {backend.name: backend for backend in (CryptographyBackend(), _JOSE_BACKEND)}
+        if backend not in backends:
+            raise ValueError(f"Unknown signature backend '{backend}', expected one of {', '.join(backends)}")
+        backend = backends[backend]
+
+    _signature_backend = backend
+
+
+def construct_key(public_key: PublicKey, backend: SignatureBackend | None = None) -> VerificationKey:
+    """Build the verification key of a public key, once for each kid and key material.
+
+    A key rotated under the same kid has other material, so it is never served from a stale entry.
+    Keys the backend doesn't support are built by python-jose.
+    """
+    backend = backend or get_signature_backend()
+    if not backend.supports(public_key):
+        backend = _JOSE_BACKEND
+
+    try:
+        return _construct_key(backend, tuple(sorted(public_key.items())))
+    except TypeError:  # unhashable members, like x5c certificate chains
+        return backend.load_key(public_key)
+
+
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def _construct_key(backend: SignatureBackend, public_key_items: tuple[tuple[str, str], ...]) -> VerificationKey:
+    return backend.load_key(dict(public_key_items))
+
+
+def _b64url_to_int(value: str) -> int:
+    return int.from_bytes(base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)), "big")
+
+
 def validate_access_token_payload(payload: dict, config: AuthConfigDict) -> None:
     # validate expiration date
     expiration = payload.get("exp")
@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jws
+
+KEY_ID = "key-1"
+
+
+@pytest.fixture(scope="session")
+def private_key_pem():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+
+
+@pytest.fixture(scope="session")
+def public_key(private_key_pem):
+    return jwk.construct(private_key_pem, "RS256").public_key().to_dict() | {"kid": KEY_ID, "use": "sig"}
+
+
+@pytest.fixture
+def config():
+    return {
+        "url": "https://auth.example.com",
+        "issuer": "https://cognito-idp.eu-west-1.amazonaws.com/pool",
+        "google_client_id": "client-id",
+        "google_client_secret": "client-secret",
+        "redirect_uri": "https://app.example.com/callback",
+        "algorithm": "RS256",
+    }
+
+
+@pytest.fixture
+def make_token(private_key_pem, config):
+    def make(kid: str = KEY_ID, signing_key: bytes | None = None, **claims) -> str:
+        now = int(time.time())
+        payload = {
+            "sub": "user",
+            "iss": config["issuer"],
+            "client_id": config["google_client_id"],
+            "exp": now + 3600,
+            "iat": now - 10,
+            "jti": "jwt-id",
+        } | claims
+        return jws.sign(payload, signing_key or private_key_pem, headers={"kid": kid}, algorithm="RS256")
+
+    return make
+
+
+class StubCognito:
+    """Local http server answering like Cognito, with canned responses by path."""
+
+    def __init__(self) -> None:
+        self.responses: dict[str, tuple[int, dict | str, float]] = {}
+        self.requests: list[tuple[str, str, bytes]] = []
+        self.client_ports: list[int] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def respond(self, path: str, body: dict | str, status: int = 200, delay: float = 0) -> None:
+        self.responses[path] = (status, body, delay)
+
+    def start(self) -> None:
+        threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                self._answer(b"")
+
+            def do_POST(self) -> None:
+                self._answer(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+
+            def _answer(self, body: bytes) -> None:
+                path = self.path.split("?", 1)[0]
+                stub.requests.append((self.command, self.path, body))
+                stub.client_ports.append(self.client_address[1])
+                status, response, delay = stub.responses.get(path, (404, {"error": "not_found"}, 0))
+                time.sleep(delay)
+                content = response.encode() if isinstance(response, str) else json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def cognito():
+    stub = StubCognito()
+    stub.start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def cognito_config(config, cognito):
+    return config | {"url": cognito.url, "issuer": f"{cognito.url}/pool"}
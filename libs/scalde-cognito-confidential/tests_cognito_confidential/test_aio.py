@@ -0,0 +1,211 @@
+import asyncio
+import datetime as dt
+from unittest.mock import MagicMock
+
+import pytest
+
+from cognito_confidential.exceptions import AuthError, RetryableAuthError
+from cognito_confidential.keys import JwksCache
+
+httpx = pytest.importorskip("httpx")
+aio = pytest.importorskip("cognito_confidential.aio")
+
+
+@pytest.fixture
+def make_tokens_resp(make_token, cognito_config):
+    def make() -> dict:
+        claims = {"iss": cognito_config["issuer"]}
+        return {
+            "access_token": make_token(**claims),
+            "id_token": make_token(aud=cognito_config["google_client_id"], email="user@example.com", **claims),
+            "refresh_token": "refresh-token",
+        }
+
+    return make
+
+
+class TestGetTokens:
+    @pytest.mark.asyncio
+    async def test_should_exchange_code_for_tokens(self, cognito, cognito_config, public_key, make_tokens_resp):
+        # Given
+        cognito.respond("/oauth2/token", make_tokens_resp())
+        store = MagicMock()
+
+        # When
+        res = await aio.get_tokens("code", cognito_config, [public_key], store)
+
+        # Then
+        assert res["access_token"]["subject"] == "user"
+        assert res["id_token"]["email"] == "user@example.com"
+        assert res["refresh_token"] == {"raw": "refresh-token"}
+        assert store.access_token == res["access_token"]
+        method, path, body = cognito.requests[0]
+        assert (method, path) == ("POST", "/oauth2/token")
+        assert b"grant_type=authorization_code" in body and b"code=code" in body
+
+    @pytest.mark.asyncio
+    async def test_should_return_stored_tokens_while_valid(self, cognito, cognito_config, public_key):
+        # Given
+        store = MagicMock()
+        store.__contains__.return_value = True
+        store.access_token = {"raw": "access", "expire_at": dt.datetime.now() + dt.timedelta(hours=1)}
+
+        # When
+        res = await aio.get_tokens("code", cognito_config, [public_key], store)
+
+        # Then
+        assert res["access_token"] == store.access_token
+        assert cognito.requests == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body,error",
+        [
+            ({"error": "temporarily_unavailable"}, RetryableAuthError),
+            ({"error": "invalid_grant"}, AuthError),
+            ("Internal Server Error", AuthError),
+        ],
+    )
+    async def test_should_raise_on_token_endpoint_error(self, cognito, cognito_config, public_key, body, error):
+        # Given
+        cognito.respond("/oauth2/token", body, status=400)
+
+        # When
+        with pytest.raises(AuthError, match="Failed to fetch tokens") as exc_info:
+            await aio.get_tokens("code", cognito_config, [public_key])
+
+        # Then
+        assert exc_info.type is error
+
+    @pytest.mark.asyncio
+    async def test_should_refresh_expired_tokens_without_code(
+        self, cognito, cognito_config, public_key, make_tokens_resp
+    ):
+        # Given
+        cognito.respond("/oauth2/token", make_tokens_resp() | {"refresh_token": "rotated-token"})
+        store = MagicMock()
+        store.__contains__.return_value = True
+        store.access_token = {"raw": "access", "expire_at": dt.datetime.now() - dt.timedelta(hours=1)}
+        store.refresh_token = {"raw": "refresh-token"}
+
+        # When
+        res = await aio.get_tokens(None, cognito_config, [public_key], store)
+
+        # Then
+        assert res["access_token"]["subject"] == "user"
+        assert store.refresh_token == {"raw": "rotated-token"}
+        method, path, body = cognito.requests[0]
+        assert (method, path) == ("POST", "/oauth2/token")
+        assert b"grant_type=refresh_token" in body and b"refresh_token=refresh-token" in body
+
+    @pytest.mark.asyncio
+    async def test_should_return_no_tokens_when_refresh_is_rejected(self, cognito, cognito_config, public_key):
+        # Given
+        cognito.respond("/oauth2/token", {"error": "invalid_grant"}, status=400)
+        store = MagicMock()
+        store.__contains__.return_value = True
+        store.access_token = {"raw": "access", "expire_at": dt.datetime.now() - dt.timedelta(hours=1)}
+        store.refresh_token = {"raw": "refresh-token"}
+
+        # When
+        res = await aio.get_tokens(None, cognito_config, [public_key], store)
+
+        # Then
+        assert res == {}
+
+    @pytest.mark.asyncio
+    async def test_should_return_no_tokens_when_refreshed_tokens_are_invalid(
+        self, cognito, cognito_config, public_key, make_token
+    ):
+        # Given
+        token = make_token(iss="https://other-issuer")
+        cognito.respond("/oauth2/token", {"access_token": token, "id_token": token})
+        store = MagicMock()
+        store.__contains__.return_value = True
+        store.access_token = {"raw": "access", "expire_at": dt.datetime.now() - dt.timedelta(hours=1)}
+        store.refresh_token = {"raw": "refresh-token"}
+
+        # When
+        res = await aio.get_tokens(None, cognito_config, [public_key], store)
+
+        # Then
+        assert res == {}
+
+    @pytest.mark.asyncio
+    async def test_should_not_retry_code_that_may_have_reached_cognito(self, cognito, cognito_config, public_key):
+        # Given
+        cognito.respond("/oauth2/token", {"error": "too late"}, delay=0.5)
+
+        # When
+        async with httpx.AsyncClient(timeout=0.05) as client:
+            with pytest.raises(AuthError, match="Cognito request failed: ReadTimeout") as exc_info:
+                await aio.get_tokens("code", cognito_config, [public_key], client=client)
+
+        # Then
+        assert exc_info.type is AuthError
+
+    @pytest.mark.asyncio
+    async def test_should_retry_code_that_never_reached_cognito(self, cognito_config, public_key):
+        # When & Then
+        with pytest.raises(RetryableAuthError, match="Cognito request failed: ConnectError"):
+            await aio.get_tokens("code", cognito_config | {"url": "http://127.0.0.1:1"}, [public_key])
+
+
+class TestGetPublicKeys:
+    @pytest.mark.asyncio
+    async def test_should_fetch_keys_once(self, cognito, cognito_config, public_key):
+        # Given
+        cognito.respond("/pool/.well-known/jwks.json", {"keys": [public_key]})
+        cache = JwksCache()
+
+        # When
+        async with httpx.AsyncClient() as client:
+            first = await aio.get_public_keys(cognito_config, cache=cache, client=client)
+            second = await aio.get_public_keys(cognito_config, cache=cache, client=client)
+
+        # Then
+        assert first == second == [public_key]
+        assert len(cognito.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_keys_once_for_concurrent_tasks(self, cognito, cognito_config, public_key):
+        # Given
+        cognito.respond("/pool/.well-known/jwks.json", {"keys": [public_key]}, delay=0.05)
+
+        cache = JwksCache()
+
+        # When
+        results = await asyncio.gather(*[aio.get_public_keys(cognito_config, cache=cache) for _ in range(5)])
+
+        # Then
+        assert results == [[public_key]] * 5
+        assert len(cognito.requests) == 1
+
+        assert cache.get_key(cognito_config, public_key["kid"]) == public_key
+
+    @pytest.mark.asyncio
+    async def test_should_raise_auth_error_on_http_error(self, cognito, cognito_config):
+        # When & Then
+        with pytest.raises(AuthError, match="Failed to fetch public keys"):
+            await aio.get_public_keys(cognito_config, cache=JwksCache())
+
+
+class TestLogout:
+    @pytest.mark.asyncio
+    async def test_should_send_logout_and_clear_store(self, cognito, cognito_config):
+        # Given
+        cognito.respond("/logout", "")
+        store = MagicMock()
+
+        # When
+        await aio.logout(cognito_config, store)
+
+        # Then
+        assert cognito.requests[0][1].startswith("/logout?client_id=client-id")
+        assert not hasattr(store, "access_token")
+
+    @pytest.mark.asyncio
+    async def test_should_raise_auth_error_when_logout_fails(self, cognito, cognito_config):
+        # When & Then
+        with pytest.raises(AuthError, match="Failed to send logout"):
+            await aio.logout(cognito_config)
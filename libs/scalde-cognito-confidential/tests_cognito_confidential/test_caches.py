@@ -0,0 +1,125 @@
+from unittest.mock import patch
+
+import pytest
+
+from cognito_confidential.caches import VerifiedTokenCache
+from cognito_confidential.parsers import map_access_token, map_id_token, parse_token
+from cognito_confidential.validations import validate_access_token_payload
+
+RESULT = {"subject": "user"}
+KEY = {"kid": "kid-1", "kty": "RSA", "n": "modulus", "e": "AQAB"}
+KEYS = {"kid-1": KEY}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestVerifiedTokenCache:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        return VerifiedTokenCache(max_size=2, expiry_margin=30, clock=clock)
+
+    def test_should_return_copy_of_cached_result(self, cache, config):
+        # Given
+        cache.put("token", config, map_access_token, result=RESULT, expire_at=2000, public_key=KEY)
+
+        # When
+        res = cache.get("token", config, map_access_token, public_keys=KEYS)
+        res["subject"] = "other"
+
+        # Then
+        assert cache.get("token", config, map_access_token, public_keys=KEYS) == RESULT
+        assert cache.stats.hits == 2
+
+    def test_should_miss_for_other_validators_or_config(self, cache, config):
+        # Given
+        cache.put("token", config, map_access_token, result=RESULT, expire_at=2000, public_key=KEY)
+
+        # When & Then
+        assert cache.get("token", config, map_id_token, public_keys=KEYS) is None
+        assert cache.get("token", config | {"google_client_id": "other"}, map_access_token, public_keys=KEYS) is None
+        assert cache.get("other", config, map_access_token, public_keys=KEYS) is None
+        assert cache.stats.misses == 3
+
+    def test_should_expire_entries_before_token_expiry(self, cache, clock, config):
+        # Given
+        cache.put("token", config, map_access_token, result=RESULT, expire_at=2000, public_key=KEY)
+
+        # When
+        clock.now = 1969
+        before_margin = cache.get("token", config, map_access_token, public_keys=KEYS)
+        clock.now = 1970
+        within_margin = cache.get("token", config, map_access_token, public_keys=KEYS)
+
+        # Then
+        assert before_margin == RESULT
+        assert within_margin is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_should_evict_least_recently_used_entries(self, cache, config):
+        # Given
+        cache.put("token-1", config, map_access_token, result=RESULT, expire_at=2000, public_key=KEY)
+        cache.put("token-2", config, map_access_token, result=RESULT, expire_at=2000, public_key=KEY)
+        cache.get("token-1", config, map_access_token, public_keys=KEYS)
+
+        # When
+        cache.put("token-3", config, map_access_token, result=RESULT, expire_at=2000, public_key=KEY)
+
+        # Then
+        assert cache.get("token-1", config, map_access_token, public_keys=KEYS) == RESULT
+        assert cache.get("token-2", config, map_access_token, public_keys=KEYS) is None
+        assert cache.stats.evictions == 1
+
+    def test_should_miss_when_verifying_key_changed(self, cache, config):
+        # Given
+        cache.put("token", config, map_access_token, result=RESULT, expire_at=2000, public_key=KEY)
+
+        # When
+        rotated_key = cache.get("token", config, map_access_token, public_keys={"kid-1": KEY | {"n": "other"}})
+        after_rotation = cache.get("token", config, map_access_token, public_keys=KEYS)
+
+        # Then
+        assert rotated_key is None
+        assert after_rotation is None
+        assert len(cache) == 0
+
+
+class TestParseTokenWithCache:
+    def test_should_verify_signature_once_per_token(self, make_token, public_key, config):
+        # Given
+        cache = VerifiedTokenCache()
+        token = make_token()
+
+        # When
+        with patch("cognito_confidential.parsers.verify_token_signature") as verify_token_signature:
+            first = parse_token(token, [public_key], validate_access_token_payload, map_access_token, config, cache)
+            second = parse_token(token, [public_key], validate_access_token_payload, map_access_token, config, cache)
+
+        # Then
+        assert first == second
+        verify_token_signature.assert_called_once()
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_should_not_cache_tokens_without_expiry(self, make_token, public_key, config):
+        # Given
+        cache = VerifiedTokenCache()
+        token = make_token(exp=None)
+
+        # When
+        res = parse_token(
+            token, [public_key], lambda payload, config: None, lambda raw, payload, header: {"raw": raw}, config, cache
+        )
+
+        # Then
+        assert res == {"raw": token}
+        assert len(cache) == 0
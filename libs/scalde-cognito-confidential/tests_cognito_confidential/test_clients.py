@@ -0,0 +1,131 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from cognito_confidential.clients import (
+    HttpClient,
+    fetch_public_keys,
+    fetch_refreshed_tokens,
+    fetch_tokens,
+    send_logout,
+)
+from cognito_confidential.exceptions import AuthError, RetryableAuthError
+
+
+@pytest.fixture
+def sleep():
+    return MagicMock()
+
+
+@pytest.fixture
+def http(sleep):
+    client = HttpClient(connect_timeout=1, read_timeout=0.2, max_retries=2, backoff=0.1, sleep=sleep)
+    yield client
+    client.close()
+
+
+class TestHttpClient:
+    def test_should_keep_connection_alive_between_calls(self, http, cognito, cognito_config, public_key):
+        # Given
+        cognito.respond("/pool/.well-known/jwks.json", {"keys": [public_key]})
+
+        # When
+        for _ in range(3):
+            fetch_public_keys(cognito_config, http)
+
+        # Then
+        assert len(set(cognito.client_ports)) == 1
+
+    def test_should_retry_timeouts_with_backoff(self, http, sleep, cognito, cognito_config):
+        # Given
+        cognito.respond("/pool/.well-known/jwks.json", {}, delay=0.5)
+
+        # When
+        with pytest.raises(RetryableAuthError, match="Cognito request failed: ReadTimeout"):
+            fetch_public_keys(cognito_config, http)
+
+        # Then
+        assert len(cognito.requests) == 3
+        first, second = (call.args[0] for call in sleep.call_args_list)
+        assert 0.05 <= first <= 0.1
+        assert 0.1 <= second <= 0.2
+
+    @pytest.mark.parametrize(
+        "body,status", [({"error": "temporarily_unavailable"}, 400), ({"error": "server_error"}, 500), ("", 503)]
+    )
+    def test_should_retry_code_grant_when_cognito_fails(self, http, cognito, cognito_config, body, status):
+        # Given
+        cognito.respond("/oauth2/token", body, status=status)
+
+        # When
+        with pytest.raises(RetryableAuthError, match="Failed to fetch tokens"):
+            fetch_tokens("code", cognito_config, http)
+
+        # Then
+        assert len(cognito.requests) == 3
+
+    @pytest.mark.parametrize("error", ["invalid_grant", "invalid_client", "invalid_request"])
+    def test_should_not_retry_code_grant_on_oauth_error(self, http, cognito, cognito_config, error):
+        # Given
+        cognito.respond("/oauth2/token", {"error": error}, status=400)
+
+        # When
+        with pytest.raises(AuthError, match=f"Failed to fetch tokens: {error}") as exc_info:
+            fetch_tokens("code", cognito_config, http)
+
+        # Then
+        assert exc_info.type is AuthError
+        assert len(cognito.requests) == 1
+
+    def test_should_not_send_code_again_after_read_timeout(self, http, cognito, cognito_config):
+        # Given
+        cognito.respond("/oauth2/token", {}, delay=0.5)
+
+        # When
+        with pytest.raises(AuthError, match="Cognito request failed: ReadTimeout") as exc_info:
+            fetch_tokens("code", cognito_config, http)
+
+        # Then
+        assert exc_info.type is AuthError
+        assert len(cognito.requests) == 1
+
+    def test_should_retry_refresh_grant_on_read_timeout(self, http, cognito, cognito_config):
+        # Given
+        cognito.respond("/oauth2/token", {}, delay=0.5)
+
+        # When
+        with pytest.raises(RetryableAuthError, match="Cognito request failed: ReadTimeout"):
+            fetch_refreshed_tokens("refresh-token", cognito_config, http)
+
+        # Then
+        assert len(cognito.requests) == 3
+
+    def test_should_not_retry_other_errors(self, http, sleep, cognito, cognito_config):
+        # Given
+        cognito.respond("/logout", "Internal Server Error", status=500)
+
+        # When
+        with pytest.raises(AuthError, match="Failed to send logout"):
+            send_logout(cognito_config, http)
+
+        # Then
+        assert len(cognito.requests) == 1
+        sleep.assert_not_called()
+
+    def test_should_retry_code_grant_when_connection_is_refused(self, http, sleep, config):
+        # When & Then
+        with pytest.raises(RetryableAuthError, match="Cognito request failed: ConnectionError"):
+            fetch_tokens("code", config | {"url": "http://127.0.0.1:9"}, http)
+        assert sleep.call_count == 2
+
+    def test_should_stop_after_success(self, http, sleep):
+        # Given
+        call = MagicMock(side_effect=[RetryableAuthError("boom"), "tokens"])
+
+        # When
+        res = http.retry(call)
+
+        # Then
+        assert res == "tokens"
+        assert call.call_count == 2
+        sleep.assert_called_once()
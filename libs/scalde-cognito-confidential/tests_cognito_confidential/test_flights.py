@@ -0,0 +1,225 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cognito_confidential.authentications import get_tokens
+from cognito_confidential.exceptions import AuthError, RetryableAuthError
+from cognito_confidential.flights import FileFlightLock, SingleFlight
+
+NB_CALLERS = 10
+
+
+def run_concurrently(function, nb_callers=NB_CALLERS):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(function())) for _ in range(nb_callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class BlockingCall:
+    """Call blocking until released, once all concurrent callers had the time to join its flight."""
+
+    def __init__(self, result="tokens", error=None) -> None:
+        self.release = threading.Event()
+        self.call_count = 0
+        self.result = result
+        self.error = error
+
+    def __call__(self):
+        self.call_count += 1
+        self.release.wait(timeout=5)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    def test_should_run_call_once_for_concurrent_callers(self):
+        # Given
+        flight = SingleFlight()
+        call = BlockingCall()
+        threading.Timer(0.1, call.release.set).start()
+
+        # When
+        results = run_concurrently(lambda: flight.do("key", call))
+
+        # Then
+        assert results == ["tokens"] * NB_CALLERS
+        assert call.call_count == 1
+
+    def test_should_raise_error_of_call_to_all_callers(self):
+        # Given
+        flight = SingleFlight()
+        call = BlockingCall(error=AuthError("boom"))
+        threading.Timer(0.1, call.release.set).start()
+
+        def do():
+            try:
+                return flight.do("key", call)
+            except AuthError as e:
+                return e
+
+        # When
+        results = run_concurrently(do)
+
+        # Then
+        assert [str(e) for e in results] == ["boom"] * NB_CALLERS
+        assert call.call_count == 1
+
+    def test_should_run_call_again_once_flight_landed(self):
+        # Given
+        flight = SingleFlight()
+        call = MagicMock(return_value="tokens")
+
+        # When
+        flight.do("key", call)
+        flight.do("key", call)
+        flight.do("other", call)
+
+        # Then
+        assert call.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_should_run_coroutine_once_for_concurrent_tasks(self):
+        # Given
+        flight = SingleFlight()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "tokens"
+
+        # When
+        results = await asyncio.gather(*(flight.do_async("key", call) for _ in range(NB_CALLERS)))
+
+        # Then
+        assert results == ["tokens"] * NB_CALLERS
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_should_keep_flight_running_for_others_when_leader_is_cancelled(self):
+        # Given
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await release.wait()
+            return "tokens"
+
+        leader = asyncio.create_task(flight.do_async("key", call))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do_async("key", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        # When
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*followers)
+
+        # Then
+        assert leader.cancelled()
+        assert results == ["tokens"] * 3
+        assert len(calls) == 1
+
+    def test_should_run_call_under_cross_process_lock(self):
+        # Given
+        lock = MagicMock()
+        lock.acquire.return_value = True
+        flight = SingleFlight(lock=lock, lock_timeout=5)
+
+        # When
+        res = flight.do("key", lambda: lock.release.assert_not_called() or "tokens")
+
+        # Then
+        assert res == "tokens"
+        lock.acquire.assert_called_once_with("key", 5)
+        lock.release.assert_called_once_with("key")
+
+    def test_should_raise_retryable_error_when_lock_times_out(self):
+        # Given
+        lock = MagicMock()
+        lock.acquire.return_value = False
+        call = MagicMock()
+
+        # When & Then
+        with pytest.raises(RetryableAuthError, match="Timed out waiting for flight key"):
+            SingleFlight(lock=lock).do("key", call)
+        call.assert_not_called()
+        lock.release.assert_not_called()
+
+
+class TestFileFlightLock:
+    def test_should_exclude_other_holders_until_released(self, tmp_path):
+        # Given
+        lock, other_process_lock = FileFlightLock(str(tmp_path)), FileFlightLock(str(tmp_path))
+        lock.acquire("key", timeout=1)
+
+        # When
+        while_held = other_process_lock.acquire("key", timeout=0.1)
+        other_key = other_process_lock.acquire("other", timeout=0.1)
+        lock.release("key")
+        once_released = other_process_lock.acquire("key", timeout=0.1)
+
+        # Then
+        assert (while_held, other_key, once_released) == (False, True, True)
+
+    def test_should_remove_lock_files_once_released(self, tmp_path):
+        # Given
+        lock = FileFlightLock(str(tmp_path))
+
+        # When
+        for i in range(5):
+            lock.acquire(f"code:{i}", timeout=1)
+            lock.release(f"code:{i}")
+
+        # Then
+        assert list(tmp_path.iterdir()) == []
+
+    def test_should_hand_lock_over_to_waiter_of_removed_file(self, tmp_path):
+        # Given
+        lock, waiting_lock = FileFlightLock(str(tmp_path)), FileFlightLock(str(tmp_path))
+        lock.acquire("key", timeout=1)
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(waiting_lock.acquire("key", timeout=5)))
+        waiter.start()
+
+        # When
+        time.sleep(0.1)
+        lock.release("key")
+        waiter.join(timeout=5)
+        late_comer = lock.acquire("key", timeout=0.1)
+
+        # Then
+        assert acquired == [True]
+        assert late_comer is False
+
+
+class TestGetTokensSingleFlight:
+    def test_should_exchange_code_once_for_concurrent_requests(self, public_key, config):
+        # Given
+        flight = SingleFlight()
+        call = BlockingCall(result={"access_token": "access", "id_token": "id", "refresh_token": "refresh"})
+        threading.Timer(0.1, call.release.set).start()
+
+        # When
+        with (
+            patch("cognito_confidential.authentications.fetch_tokens", side_effect=lambda *a, **kw: call()),
+            patch("cognito_confidential.authentications.parse_token", side_effect=lambda token, **kw: token),
+        ):
+            results = run_concurrently(lambda: get_tokens("code", config, [public_key], flight=flight))
+
+        # Then
+        assert call.call_count == 1
+        assert (
+            results == [{"access_token": "access", "id_token": "id", "refresh_token": {"raw": "refresh"}}] * NB_CALLERS
+        )
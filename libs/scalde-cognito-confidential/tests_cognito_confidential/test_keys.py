@@ -0,0 +1,240 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from cognito_confidential.authentications import get_public_keys
+from cognito_confidential.exceptions import AuthError
+from cognito_confidential.keys import JwksCache
+
+CONFIG = {"issuer": "https://cognito-idp.eu-west-1.amazonaws.com/pool"}
+KEY_1 = {"kid": "key-1", "alg": "RS256", "e": "AQAB", "kty": "RSA", "n": "abc", "use": "sig"}
+KEY_2 = {"kid": "key-2", "alg": "RS256", "e": "AQAB", "kty": "RSA", "n": "def", "use": "sig"}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestJwksCache:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def fetch(self):
+        return MagicMock(return_value=[KEY_1])
+
+    @pytest.fixture
+    def cache(self, fetch, clock):
+        return JwksCache(fetch=fetch, ttl=100, refresh_ahead_ratio=0.8, min_refetch_interval=10, clock=clock)
+
+    def test_should_fetch_keys_once_while_fresh(self, cache, fetch, clock):
+        # When
+        first = cache.get_keys(CONFIG)
+        clock.now = 50
+        second = cache.get_keys(CONFIG)
+
+        # Then
+        assert first == second == [KEY_1]
+        fetch.assert_called_once_with(CONFIG)
+
+    def test_should_fetch_keys_again_once_expired(self, cache, fetch, clock):
+        # Given
+        cache.get_keys(CONFIG)
+        fetch.return_value = [KEY_2]
+        clock.now = 100
+
+        # When
+        res = cache.get_keys(CONFIG)
+
+        # Then
+        assert res == [KEY_2]
+        assert fetch.call_count == 2
+
+    def test_should_refresh_keys_in_background_before_expiry(self, cache, fetch, clock):
+        # Given
+        cache.get_keys(CONFIG)
+        refreshed = threading.Event()
+        fetch.side_effect = lambda config: refreshed.set() or [KEY_2]
+        clock.now = 85
+
+        # When
+        res = cache.get_keys(CONFIG)
+
+        # Then
+        assert res == [KEY_1]
+        assert refreshed.wait(timeout=5)
+        for _ in range(100):
+            if cache.get_keys(CONFIG) == [KEY_2]:
+                break
+            time.sleep(0.01)
+        assert cache.get_keys(CONFIG) == [KEY_2]
+        assert fetch.call_count == 2
+
+    def test_should_index_keys_by_kid(self, cache, fetch):
+        # Given
+        fetch.return_value = [KEY_1, KEY_2]
+
+        # When
+        res = cache.get_key(CONFIG, "key-2")
+
+        # Then
+        assert res == KEY_2
+        assert cache.get_keys_by_kid(CONFIG) == {"key-1": KEY_1, "key-2": KEY_2}
+
+    def test_should_refetch_on_unknown_kid_at_most_once_per_interval(self, cache, fetch, clock):
+        # Given
+        cache.get_keys(CONFIG)
+        clock.now = 20
+
+        # When
+        with pytest.raises(AuthError, match="Invalid token key id"):
+            cache.get_key(CONFIG, "unknown")
+        with pytest.raises(AuthError, match="Invalid token key id"):
+            cache.get_key(CONFIG, "unknown")
+
+        # Then
+        assert fetch.call_count == 2
+
+    def test_should_pick_rotated_key_on_unknown_kid(self, cache, fetch, clock):
+        # Given
+        cache.get_keys(CONFIG)
+        fetch.return_value = [KEY_1, KEY_2]
+        clock.now = 20
+
+        # When
+        res = cache.get_key(CONFIG, "key-2")
+
+        # Then
+        assert res == KEY_2
+
+    def test_should_fetch_once_for_concurrent_cold_callers(self, cache, fetch):
+        # Given
+        release = threading.Event()
+        fetch.side_effect = lambda config: release.wait(timeout=5) and [KEY_1]
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_keys(CONFIG))) for _ in range(20)]
+
+        # When
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # Then
+        assert results == [[KEY_1]] * 20
+        fetch.assert_called_once()
+
+    def test_should_raise_auth_error_when_fetch_fails(self, cache, fetch):
+        # Given
+        fetch.side_effect = ConnectionError("boom")
+
+        # When & Then
+        with pytest.raises(AuthError, match="Failed to fetch public keys"):
+            cache.get_keys(CONFIG)
+
+    def test_should_raise_auth_error_on_empty_response(self, cache, fetch):
+        # Given
+        fetch.return_value = []
+
+        # When & Then
+        with pytest.raises(AuthError, match="empty response"):
+            cache.get_keys(CONFIG)
+
+
+class TestJwksCacheAsync:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def fetch(self):
+        return AsyncMock(return_value=[KEY_1])
+
+    @pytest.fixture
+    def cache(self, clock):
+        return JwksCache(ttl=100, refresh_ahead_ratio=0.8, min_refetch_interval=10, clock=clock)
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_once_for_concurrent_cold_tasks(self, cache, fetch):
+        # Given
+        async def slow_fetch(config):
+            await asyncio.sleep(0.01)
+            return [KEY_1]
+
+        fetch.side_effect = slow_fetch
+
+        # When
+        results = await asyncio.gather(*[cache.get_keys_async(CONFIG, fetch) for _ in range(20)])
+
+        # Then
+        assert results == [[KEY_1]] * 20
+        fetch.assert_awaited_once_with(CONFIG)
+
+    @pytest.mark.asyncio
+    async def test_should_refresh_keys_in_task_before_expiry(self, cache, fetch, clock):
+        # Given
+        await cache.get_keys_async(CONFIG, fetch)
+        fetch.return_value = [KEY_2]
+        clock.now = 80
+
+        # When
+        during_refresh = await cache.get_keys_async(CONFIG, fetch)
+        await asyncio.gather(*cache._refresh_tasks)
+        after_refresh = await cache.get_keys_async(CONFIG, fetch)
+
+        # Then
+        assert during_refresh == [KEY_1]
+        assert after_refresh == [KEY_2]
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_refetch_on_unknown_kid(self, cache, fetch, clock):
+        # Given
+        await cache.get_keys_async(CONFIG, fetch)
+        fetch.return_value = [KEY_1, KEY_2]
+        clock.now = 10
+
+        # When
+        res = await cache.get_key_async(CONFIG, "key-2", fetch)
+
+        # Then
+        assert res == KEY_2
+        assert fetch.await_count == 2
+
+
+class TestGetPublicKeys:
+    def test_should_use_cache_without_store(self):
+        # Given
+        fetch = MagicMock(return_value=[KEY_1])
+        cache = JwksCache(fetch=fetch)
+
+        # When
+        get_public_keys(CONFIG, cache=cache)
+        res = get_public_keys(CONFIG, cache=cache)
+
+        # Then
+        assert res == [KEY_1]
+        fetch.assert_called_once()
+
+    def test_should_prefer_keys_of_store(self):
+        # Given
+        fetch = MagicMock(return_value=[KEY_1])
+        store = MagicMock()
+        store.__contains__.return_value = True
+        store.public_keys = [KEY_2]
+
+        # When
+        res = get_public_keys(CONFIG, store=store, cache=JwksCache(fetch=fetch))
+
+        # Then
+        assert res == [KEY_2]
+        fetch.assert_not_called()
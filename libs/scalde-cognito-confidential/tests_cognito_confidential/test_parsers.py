@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+import pytest
+
+from cognito_confidential.caches import VerifiedTokenCache
+from cognito_confidential.exceptions import AuthError, AuthValidationError, TokenExpired
+from cognito_confidential.parsers import decode_token, map_access_token, parse_token, verify_tokens
+from cognito_confidential.validations import validate_access_token_payload
+
+
+class TestParseToken:
+    def test_should_parse_valid_token(self, make_token, public_key, config):
+        # Given
+        token = make_token()
+
+        # When
+        res = parse_token(token, [public_key], validate_access_token_payload, map_access_token, config)
+
+        # Then
+        assert res["raw"] == token
+        assert res["subject"] == "user"
+        assert res["audiance"] == "client-id"
+
+    def test_should_accept_keys_indexed_by_kid(self, make_token, public_key, config):
+        # Given
+        token = make_token()
+
+        # When
+        res = parse_token(
+            token, {public_key["kid"]: public_key}, validate_access_token_payload, map_access_token, config
+        )
+
+        # Then
+        assert res["subject"] == "user"
+
+    def test_should_raise_auth_error_on_unknown_kid(self, make_token, public_key, config):
+        # Given
+        token = make_token(kid="unknown")
+
+        # When & Then
+        with pytest.raises(AuthError, match="Invalid token key id"):
+            parse_token(token, [public_key], validate_access_token_payload, map_access_token, config)
+
+    def test_should_raise_validation_error_on_invalid_signature(self, make_token, public_key, config):
+        # Given
+        header, payload, signature = make_token().split(".")
+        token = ".".join([header, payload, signature[::-1]])
+
+        # When & Then
+        with pytest.raises(AuthValidationError, match="Invalid token signature"):
+            parse_token(token, [public_key], validate_access_token_payload, map_access_token, config)
+
+
+class TestDecodeToken:
+    def test_should_decode_all_parts_at_once(self, make_token):
+        # Given
+        token = make_token(email="user@example.com")
+
+        # When
+        res = decode_token(token)
+
+        # Then
+        assert res.header == {"alg": "RS256", "kid": "key-1", "typ": "JWT"}
+        assert res.payload["email"] == "user@example.com"
+        assert res.signing_input == token.rsplit(".", 1)[0].encode()
+        assert len(res.signature) == 256
+
+    @pytest.mark.parametrize(
+        "token,error",
+        [
+            (None, "Token is empty"),
+            ("a.b", "expected 3 parts, got 2"),
+            ("e30.!!!.c2ln", "Invalid token payload"),
+            ("e30.W10.c2ln", "Invalid token payload"),
+            ("bm90IGpzb24.e30.c2ln", "Invalid token header"),
+        ],
+    )
+    def test_should_raise_on_malformed_token(self, token, error):
+        # When & Then
+        with pytest.raises((AuthError, AuthValidationError), match=error):
+            decode_token(token)
+
+
+class TestVerifyTokens:
+    @pytest.mark.parametrize("max_workers", [None, 4])
+    def test_should_return_result_or_error_of_each_token(self, make_token, public_key, config, max_workers):
+        # Given
+        valid = [make_token(jti=f"jwt-{i}") for i in range(6)]
+        expired = make_token(exp=1)
+        unknown_kid = make_token(kid="unknown")
+        tokens = [valid[0], "not-a-token", *valid[1:3], expired, unknown_kid, *valid[3:]]
+
+        # When
+        res = verify_tokens(
+            tokens, [public_key], validate_access_token_payload, map_access_token, config, max_workers=max_workers
+        )
+
+        # Then
+        assert [r["jwt_id"] if isinstance(r, dict) else type(r) for r in res] == [
+            "jwt-0",
+            AuthValidationError,
+            "jwt-1",
+            "jwt-2",
+            TokenExpired,
+            AuthError,
+            "jwt-3",
+            "jwt-4",
+            "jwt-5",
+        ]
+
+    def test_should_return_error_of_each_malformed_token(self, make_token, public_key, config):
+        # Given
+        tokens = [make_token(jti="jwt-0"), make_token(kid=["key-1"]), make_token(exp="soon"), make_token(jti="jwt-1")]
+
+        # When
+        res = verify_tokens(tokens, [public_key], validate_access_token_payload, map_access_token, config)
+
+        # Then
+        assert res[0]["jwt_id"] == "jwt-0"
+        assert isinstance(res[1], AuthError) and str(res[1]) == "Invalid token key id"
+        assert isinstance(res[2], TypeError)
+        assert res[3]["jwt_id"] == "jwt-1"
+
+    def test_should_serve_cached_tokens(self, make_token, public_key, config):
+        # Given
+        cache = VerifiedTokenCache()
+        token = make_token()
+        parse_token(token, [public_key], validate_access_token_payload, map_access_token, config, cache)
+
+        # When
+        with patch("cognito_confidential.parsers.verify_token_signature") as verify_token_signature:
+            res = verify_tokens(
+                [token], [public_key], validate_access_token_payload, map_access_token, config, cache=cache
+            )
+
+        # Then
+        assert res[0]["raw"] == token
+        verify_token_signature.assert_not_called()
@@ -0,0 +1,276 @@
+import datetime as dt
+import threading
+import time
+from unittest.mock import patch
+from urllib.parse import parse_qs
+
+import pytest
+
+from cognito_confidential.authentications import get_tokens, refresh_tokens
+from cognito_confidential.clients import HttpClient
+from cognito_confidential.exceptions import AuthError, RetryableAuthError
+from cognito_confidential.refreshers import TokenRefresher
+from cognito_confidential.stores import AuthStore
+
+NOW = dt.datetime(2024, 1, 1, 12)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> dt.datetime:
+        return self.now
+
+
+class InlineExecutor:
+    """Executor running submitted calls right away, in the calling thread."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def submit(self, function, *args) -> None:
+        function(*args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def _stored(name: str) -> property:
+    return property(lambda self: self._values.get(name), lambda self, value: self._values.__setitem__(name, value))
+
+
+class MemoryStore(AuthStore):
+    access_token = _stored("access_token")
+    id_token = _stored("id_token")
+    refresh_token = _stored("refresh_token")
+    public_keys = _stored("public_keys")
+
+    def __init__(self, **values) -> None:
+        object.__setattr__(self, "_values", values)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def __delattr__(self, name: str) -> None:
+        self._values.pop(name, None)
+
+
+def make_store(expire_in: float, raw: str = "access") -> MemoryStore:
+    return MemoryStore(
+        access_token={"raw": raw, "expire_at": NOW + dt.timedelta(seconds=expire_in)},
+        id_token={"raw": "id"},
+        refresh_token={"raw": "refresh-token"},
+    )
+
+
+@pytest.fixture
+def refreshed_tokens_resp(make_token, cognito_config):
+    claims = {"iss": cognito_config["issuer"]}
+    return {
+        "access_token": make_token(jti="refreshed", **claims),
+        "id_token": make_token(aud=cognito_config["google_client_id"], email="user@example.com", **claims),
+    }
+
+
+class TestRefreshTokens:
+    def test_should_refresh_tokens_of_store(self, cognito, cognito_config, public_key, refreshed_tokens_resp):
+        # Given
+        cognito.respond("/oauth2/token", refreshed_tokens_resp)
+        store = make_store(expire_in=-10)
+
+        # When
+        res = refresh_tokens(cognito_config, [public_key], store)
+
+        # Then
+        assert res["access_token"]["jwt_id"] == "refreshed"
+        assert store.access_token == res["access_token"]
+        assert store.refresh_token == {"raw": "refresh-token"}
+        body = parse_qs(cognito.requests[0][2].decode())
+        assert body == {"grant_type": ["refresh_token"], "client_id": ["client-id"], "refresh_token": ["refresh-token"]}
+
+    def test_should_not_log_refresh_token_on_failure(self, cognito, cognito_config, public_key, caplog):
+        # Given
+        cognito.respond("/oauth2/token", {"error": "invalid_grant"}, status=400)
+
+        # When
+        with pytest.raises(AuthError):
+            refresh_tokens(cognito_config, [public_key], make_store(expire_in=-10))
+
+        # Then
+        assert "refresh-token" not in caplog.text
+        assert "'refresh_token': '<redacted>'" in caplog.text
+
+    def test_should_raise_auth_error_without_refresh_token(self, config, public_key):
+        # When & Then
+        with pytest.raises(AuthError, match="no refresh token"):
+            refresh_tokens(config, [public_key], MemoryStore())
+
+    def test_should_refresh_expired_tokens_without_code(
+        self, cognito, cognito_config, public_key, refreshed_tokens_resp
+    ):
+        # Given
+        cognito.respond("/oauth2/token", refreshed_tokens_resp)
+        store = make_store(expire_in=-10)
+
+        # When
+        res = get_tokens(None, cognito_config, [public_key], store)
+
+        # Then
+        assert res["access_token"]["jwt_id"] == "refreshed"
+
+    def test_should_return_no_tokens_when_refresh_is_rejected(self, cognito, cognito_config, public_key):
+        # Given
+        cognito.respond("/oauth2/token", "Bad Request", status=400)
+
+        # When
+        res = get_tokens(None, cognito_config, [public_key], make_store(expire_in=-10))
+
+        # Then
+        assert res == {}
+
+    @pytest.mark.parametrize("claims", [{"iss": "https://other-issuer"}, {"exp": 0}], ids=["invalid", "expired"])
+    def test_should_return_no_tokens_when_refreshed_tokens_are_invalid(
+        self, cognito, cognito_config, public_key, make_token, claims
+    ):
+        # Given
+        token = make_token(**{"iss": cognito_config["issuer"]} | claims)
+        cognito.respond("/oauth2/token", {"access_token": token, "id_token": token})
+
+        # When
+        res = get_tokens(None, cognito_config, [public_key], make_store(expire_in=-10))
+
+        # Then
+        assert res == {}
+
+
+class TestTokenRefresher:
+    @pytest.fixture
+    def refresher(self, config, public_key):
+        refresher = TokenRefresher(config, [public_key], margin=60, jitter=0, max_concurrency=2, clock=lambda: NOW)
+        yield refresher
+        refresher.stop()
+
+    def test_should_refresh_only_stores_expiring_within_margin(self, refresher):
+        # Given
+        expiring, fresh = make_store(expire_in=30), make_store(expire_in=600)
+        refresher.add(expiring)
+        refresher.add(fresh)
+
+        # When
+        with patch("cognito_confidential.refreshers.refresh_tokens") as refresh:
+            nb_due = refresher.refresh_due()
+            refresher.stop()
+
+        # Then
+        assert nb_due == 1
+        assert refresh.call_args.args[2] is expiring
+
+    def test_should_refresh_within_jitter_before_margin(self, config, public_key):
+        # Given
+        refresher = TokenRefresher(config, [public_key], margin=60, jitter=30, clock=lambda: NOW)
+        stores = [make_store(expire_in=89, raw=f"access-{i}") for i in range(20)]
+        for store in stores:
+            refresher.add(store)
+
+        # When
+        with patch("cognito_confidential.refreshers.refresh_tokens"), patch("random.uniform", return_value=30):
+            nb_due = refresher.refresh_due()
+            refresher.stop()
+
+        # Then
+        assert nb_due == 20
+
+    def test_should_limit_concurrent_refreshes(self, refresher):
+        # Given
+        running, max_running, lock = [0], [0], threading.Lock()
+
+        def refresh(*args, **kwargs):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        for i in range(6):
+            refresher.add(make_store(expire_in=30, raw=f"access-{i}"))
+
+        # When
+        with patch("cognito_confidential.refreshers.refresh_tokens", side_effect=refresh) as refresh_mock:
+            refresher.refresh_due()
+            for _ in range(100):
+                if refresh_mock.call_count == 6 and running[0] == 0:
+                    break
+                time.sleep(0.01)
+
+        # Then
+        assert refresh_mock.call_count == 6
+        assert max_running[0] == 2
+
+    @pytest.mark.parametrize("error,nb_registered", [("temporarily_unavailable", 1), ("invalid_grant", 0)])
+    def test_should_unregister_store_only_on_rejected_refresh_token(
+        self, cognito, cognito_config, public_key, error, nb_registered
+    ):
+        # Given
+        cognito.respond("/oauth2/token", {"error": error}, status=400)
+        http = HttpClient(max_retries=0)
+        refresher = TokenRefresher(cognito_config, [public_key], jitter=0, clock=lambda: NOW)
+        refresher.add(make_store(expire_in=30))
+
+        # When
+        with patch("cognito_confidential.clients.default_http_client", http):
+            refresher.refresh_due()
+            refresher.stop()
+
+        # Then
+        assert len(refresher) == nb_registered
+        assert len(cognito.requests) == 1
+
+    def test_should_unregister_store_when_refreshed_tokens_are_invalid(
+        self, cognito, cognito_config, public_key, make_token
+    ):
+        # Given
+        token = make_token(iss="https://other-issuer")
+        cognito.respond("/oauth2/token", {"access_token": token, "id_token": token})
+        refresher = TokenRefresher(cognito_config, [public_key], jitter=0, clock=lambda: NOW)
+        refresher.add(make_store(expire_in=30))
+
+        # When
+        refresher.refresh_due()
+        refresher.stop()
+
+        # Then
+        assert len(refresher) == 0
+
+    def test_should_back_off_on_consecutive_retryable_errors(self, config, public_key):
+        # Given
+        clock = FakeClock()
+        with patch("cognito_confidential.refreshers.ThreadPoolExecutor", InlineExecutor):
+            refresher = TokenRefresher(config, [public_key], jitter=0, interval=5, max_retry_delay=15, clock=clock)
+        refresher.add(make_store(expire_in=30))
+        attempts = []
+
+        # When
+        with patch("cognito_confidential.refreshers.refresh_tokens", side_effect=RetryableAuthError("busy")):
+            for elapsed in range(0, 40):
+                clock.now = NOW + dt.timedelta(seconds=elapsed)
+                if refresher.refresh_due():
+                    attempts.append(elapsed)
+
+        # Then
+        assert attempts == [0, 5, 15, 30]
+
+    def test_should_refresh_in_background(self, config, public_key):
+        # Given
+        refreshed = threading.Event()
+        store = make_store(expire_in=30)
+
+        # When
+        with patch("cognito_confidential.refreshers.refresh_tokens", side_effect=lambda *a, **kw: refreshed.set()):
+            with TokenRefresher(config, [public_key], jitter=0, interval=0.01, clock=lambda: NOW) as refresher:
+                refresher.add(store)
+                res = refreshed.wait(timeout=5)
+
+        # Then
+        assert res
@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+import pytest
+
+from cognito_confidential.parsers import decode_token
+from cognito_confidential.validations import (
+    CryptographyBackend,
+    JoseBackend,
+    _construct_key,
+    construct_key,
+    get_signature_backend,
+    set_signature_backend,
+)
+
+BACKENDS = [CryptographyBackend(), JoseBackend()]
+
+
+class TestSignatureBackends:
+    @pytest.mark.parametrize("backend", BACKENDS, ids=lambda backend: backend.name)
+    def test_should_verify_valid_signature(self, backend, make_token, public_key):
+        # Given
+        token = decode_token(make_token())
+
+        # When
+        res = backend.load_key(public_key).verify(token.signing_input, token.signature)
+
+        # Then
+        assert res is True
+
+    @pytest.mark.parametrize("backend", BACKENDS, ids=lambda backend: backend.name)
+    def test_should_reject_tampered_signature(self, backend, make_token, public_key):
+        # Given
+        token = decode_token(make_token())
+
+        # When
+        res = backend.load_key(public_key).verify(token.signing_input + b"x", token.signature)
+
+        # Then
+        assert res is False
+
+    def test_should_prefer_cryptography_backend(self):
+        # Given
+        set_signature_backend(None)
+
+        # When
+        res = get_signature_backend()
+
+        # Then
+        assert res.name == "cryptography"
+
+    def test_should_select_backend_by_name(self):
+        # When
+        set_signature_backend("python-jose")
+        try:
+            res = get_signature_backend()
+        finally:
+            set_signature_backend(None)
+
+        # Then
+        assert isinstance(res, JoseBackend)
+
+    def test_should_raise_on_unknown_backend(self):
+        # When & Then
+        with pytest.raises(ValueError, match="Unknown signature backend 'unknown'"):
+            set_signature_backend("unknown")
+
+
+class TestConstructKey:
+    def test_should_construct_key_once_per_key_material(self, public_key):
+        # Given
+        backend = CryptographyBackend()
+        _construct_key.cache_clear()
+
+        # When
+        with patch.object(backend, "load_key", wraps=backend.load_key) as load_key:
+            first = construct_key(public_key, backend)
+            second = construct_key(dict(public_key), backend)
+            rotated = construct_key(public_key | {"n": public_key["n"][:-4] + "AAAA"}, backend)
+
+        # Then
+        assert first is second
+        assert rotated is not first
+        assert load_key.call_count == 2
+
+    def test_should_fall_back_to_jose_for_unsupported_keys(self, public_key):
+        # Given
+        backend = CryptographyBackend()
+
+        # When
+        with patch.object(JoseBackend, "load_key") as load_key:
+            construct_key(public_key | {"alg": "PS256"}, backend)
+
+        # Then
+        load_key.assert_called_once()
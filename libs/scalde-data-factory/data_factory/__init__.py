@@ -1,7 +1,9 @@
 from .exceptions import DataFactoryBaseException, DataValidationError, PipelineDefinitionError, PipelineProcessError
 from .exporter import CSVExporter, Exporter
 from .loader import CSVLoader, Loader
+from .memory import MemoryBudget
 from .pipeline import DataPipeline
+from .reporters import LoggingReporter, NullReporter, Reporter, RichReporter
 from .steps import ParallelSteps, Step
 from .validations import DataValidation
 
@@ -14,6 +16,11 @@ __all__ = [
     "CSVLoader",
     "ParallelSteps",
     "DataValidation",
+    "MemoryBudget",
+    "Reporter",
+    "RichReporter",
+    "LoggingReporter",
+    "NullReporter",
     "DataFactoryBaseException",
     "PipelineDefinitionError",
     "PipelineProcessError",
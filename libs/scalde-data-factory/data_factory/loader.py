@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Loader(ABC):
@@ -16,6 +20,8 @@ class CSVLoader(Loader):
         self._read_csv_kwargs = kwargs
 
     def load(self) -> pd.DataFrame:
+        import pandas as pd
+
         data = pd.read_csv(self._filepath, **self._read_csv_kwargs)
         self._logger.log(f"Loaded {len(data)} rows from {self._filepath}")
         return data
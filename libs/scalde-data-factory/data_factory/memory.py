@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import PipelineDefinitionError
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+@dataclass
+class _Entry:
+    nb_bytes: int
+    data: pd.DataFrame | None = None
+    path: Path | None = None
+    is_pickled: bool = False
+
+
+class MemoryBudget:
+    """Track dataframes against a memory budget and spill them to disk under pressure.
+
+    Spilled frames are written as parquet files (requires pyarrow) and read back on demand.
+    Frames parquet would not give back unchanged, like object columns or non-string column names,
+    are pickled instead. Frames are spilled least recently tracked first; the most recently
+    tracked frame always stays in memory.
+    """
+
+    def __init__(self, max_bytes: int, spill_dir: str | Path | None = None) -> None:
+        if max_bytes <= 0:
+            raise PipelineDefinitionError("Memory budget must be a positive number of bytes")
+        if importlib.util.find_spec("pyarrow") is None:
+            raise PipelineDefinitionError("pyarrow is required to spill data to disk")
+
+        self.max_bytes = max_bytes
+        self.spilled_bytes = 0
+        self.spill_count = 0
+        self.peak_bytes = 0
+
+        self._spill_root = Path(spill_dir) if spill_dir else None
+        self._spill_dir: Path | None = None
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._next_key = 0
+
+    @property
+    def used_bytes(self) -> int:
+        return sum(entry.nb_bytes for entry in self._entries.values() if entry.data is not None)
+
+    def track(self, data: pd.DataFrame) -> int:
+        key = self._next_key
+        self._next_key += 1
+        self._entries[key] = _Entry(nb_bytes=frame_size(data), data=data)
+
+        self._enforce()
+        self.peak_bytes = max(self.peak_bytes, self.used_bytes)
+        return key
+
+    def get(self, key: int) -> pd.DataFrame:
+        entry = self._get_entry(key)
+        if entry.data is not None:
+            return entry.data
+
+        import pandas as pd
+
+        return pd.read_pickle(entry.path) if entry.is_pickled else pd.read_parquet(entry.path)
+
+    def pop(self, key: int) -> pd.DataFrame:
+        data = self.get(key)
+        entry = self._entries.pop(key)
+        if entry.path is not None:
+            entry.path.unlink(missing_ok=True)
+        return data
+
+    def concat(self, keys: list[int]) -> pd.DataFrame:
+        """Pop the frames of keys and concatenate them, with a fresh index, like pd.concat would.
+
+        When some were spilled and all share a parquet schema, frames are streamed one at a time into a
+        single parquet file read back at once, so that spilled frames are not all loaded next to the result.
+        """
+        import pandas as pd
+
+        is_spilled = any(self._get_entry(key).data is None for key in keys)
+        if not is_spilled or (schema := self._common_schema(keys)) is None:
+            return pd.concat([self.pop(key) for key in keys], axis=0).reset_index(drop=True)
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self._get_spill_dir() / f"concat_{self._next_key}.parquet"
+        self._next_key += 1
+        try:
+            with pq.ParquetWriter(path, schema) as writer:
+                for key in keys:
+                    entry = self._entries[key]
+                    if entry.data is None:
+                        table = pq.read_table(entry.path, columns=schema.names)
+                    else:
+                        table = pa.Table.from_pandas(entry.data, preserve_index=False)
+                    self._discard(key)
+                    writer.write_table(table.replace_schema_metadata(schema.metadata))
+                    del table
+
+            return pq.read_table(path).to_pandas(self_destruct=True, split_blocks=True)
+        finally:
+            path.unlink(missing_ok=True)
+
+    def reset_stats(self) -> None:
+        self.spilled_bytes = 0
+        self.spill_count = 0
+        self.peak_bytes = 0
+
+    def close(self) -> None:
+        self._entries.clear()
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def _get_entry(self, key: int) -> _Entry:
+        try:
+            return self._entries[key]
+        except KeyError:
+            raise KeyError(f"No data tracked under key {key}")
+
+    def _discard(self, key: int) -> None:
+        entry = self._entries.pop(key)
+        if entry.path is not None:
+            entry.path.unlink(missing_ok=True)
+
+    def _common_schema(self, keys: list[int]) -> pa.Schema | None:
+        schemas = []
+        for key in keys:
+            entry = self._get_entry(key)
+            if entry.is_pickled or (entry.data is not None and not _fits_parquet(entry.data)):
+                return None
+            try:
+                schemas.append(_frame_schema(entry))
+            except (ValueError, TypeError, NotImplementedError):
+                return None
+
+        if not schemas or any(not schema.equals(schemas[0]) for schema in schemas[1:]):
+            return None
+        return schemas[0]
+
+    def _enforce(self) -> None:
+        in_memory = [key for key, entry in self._entries.items() if entry.data is not None]
+        used_bytes = self.used_bytes
+        for key in in_memory[:-1]:
+            if used_bytes <= self.max_bytes:
+                break
+            used_bytes -= self._spill(key)
+
+    def _spill(self, key: int) -> int:
+        entry = self._entries[key]
+        entry.path = self._get_spill_dir() / f"{key}.parquet"
+        try:
+            if not _fits_parquet(entry.data):
+                raise TypeError("Data would not round-trip through parquet")
+            entry.data.to_parquet(entry.path)
+        except (ValueError, TypeError, NotImplementedError):
+            # pyarrow errors derive from these, a frame parquet can't hold as is gets pickled instead
+            entry.path.unlink(missing_ok=True)
+            entry.path = entry.path.with_suffix(".pickle")
+            entry.data.to_pickle(entry.path)
+            entry.is_pickled = True
+        entry.data = None
+
+        self.spilled_bytes += entry.nb_bytes
+        self.spill_count += 1
+        return entry.nb_bytes
+
+    def _get_spill_dir(self) -> Path:
+        if self._spill_dir is None:
+            if self._spill_root is not None:
+                self._spill_root.mkdir(parents=True, exist_ok=True)
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="data_factory_spill_", dir=self._spill_root))
+        return self._spill_dir
+
+
+def frame_size(data: pd.DataFrame) -> int:
+    return int(data.memory_usage(deep=True).sum())
+
+
+def _fits_parquet(data: pd.DataFrame) -> bool:
+    """Whether parquet gives data back unchanged: unique string labels, and numeric, datetime or string columns.
+
+    Object columns are excluded as their cells may come back converted, like lists read as numpy arrays.
+    """
+    import pandas as pd
+
+    columns = data.columns
+    if isinstance(columns, pd.MultiIndex) or not columns.is_unique or not all(isinstance(c, str) for c in columns):
+        return False
+    if not isinstance(data.index, pd.RangeIndex) and not _fits_parquet_dtype(data.index.dtype):
+        return False
+    return all(_fits_parquet_dtype(dtype) for dtype in data.dtypes)
+
+
+def _fits_parquet_dtype(dtype: Any) -> bool:
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(dtype, pd.StringDtype):
+        return True
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufM" and dtype != np.float16
+
+
+def _frame_schema(entry: _Entry) -> pa.Schema:
+    """Return the arrow schema of a tracked frame, without its index."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if entry.data is not None:
+        return pa.Schema.from_pandas(entry.data, preserve_index=False)
+
+    schema = pq.read_schema(entry.path)
+    pandas_metadata = schema.pandas_metadata or {}
+    index_columns = {name for name in pandas_metadata.get("index_columns", []) if isinstance(name, str)}
+    schema = pa.schema([field for field in schema if field.name not in index_columns])
+    if pandas_metadata:
+        pandas_metadata["index_columns"] = []
+        pandas_metadata["columns"] = [
+            column for column in pandas_metadata.get("columns", []) if column["field_name"] not in index_columns
+        ]
+        schema = schema.with_metadata({b"pandas": json.dumps(pandas_metadata).encode()})
+    return schema
@@ -1,13 +1,19 @@
-import pandas as pd
-import rich
-from rich.progress import Progress
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
 
 from .exceptions import DataValidationError
 from .exporter import Exporter
 from .loader import Loader
+from .memory import MemoryBudget, frame_size
+from .reporters import Reporter, RichReporter
 from .steps import Step
 from .validations import DataValidation
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class DataPipeline:
     def __init__(
@@ -17,26 +23,30 @@ class DataPipeline:
         exporter: Exporter,
         name: str = "Unnamed pipeline",
         validations: list[DataValidation] | None = None,
+        memory_budget: MemoryBudget | None = None,
+        reporter: Reporter | None = None,
     ) -> None:
         self.exporter = exporter
         self.loader = loader
         self.name = name
+        self.reporter = reporter or RichReporter()
 
         self._steps = steps
         self._validations = validations or []
+        self._memory_budget = memory_budget
 
-    def run(self) -> None:
-        rich.print(f"\n\nRunning pipeline: [bold green]{self.name}[/bold green]")
-        dataset = self.loader.load()
-
-        with Progress() as progress:
-            for step in progress.track(self._steps, description="Apply steps..."):
-                dataset = step.process(dataset.copy())
+        if memory_budget is not None:
+            for step in steps:
+                step.set_memory_budget(memory_budget)
 
-                progress.console.print(
-                    f"Step [bold]{step.get_name()}[/bold] done with "
-                    f"data shape: {dataset.shape[0]} rows, {dataset.shape[1]} columns"
-                )
+    def run(self) -> None:
+        self.reporter.pipeline_started(self.name)
+        if self._memory_budget is not None:
+            self._memory_budget.reset_stats()
+        try:
+            dataset = self._apply_steps()
+        finally:
+            self._release_memory_budget()
 
         output_data = self._apply_all_dtypes(dataset)
 
@@ -44,18 +54,57 @@ class DataPipeline:
 
         self.exporter.export(output_data)
 
+    def _apply_steps(self) -> pd.DataFrame:
+        # loaded here so that no caller keeps a reference to the data once the first step replaced it
+        dataset = self.loader.load()
+        self.reporter.steps_started(len(self._steps))
+        try:
+            for step in self._steps:
+                start = time.perf_counter()
+                # a copy would double the peak memory a budget is meant to bound, steps then own their input
+                step_input = dataset if self._memory_budget is not None else dataset.copy()
+                del dataset
+                dataset = step.process(step_input)
+                del step_input
+
+                self.reporter.step_done(
+                    step.get_name(), dataset.shape[0], dataset.shape[1], time.perf_counter() - start
+                )
+                self._check_memory_budget(dataset, step)
+        finally:
+            self.reporter.steps_done()
+
+        return dataset
+
     def _validate_data(self, output_data: pd.DataFrame) -> None:
+        self.reporter.validations_started(len(self._validations))
         if not self._validations:
-            rich.print("No validation to apply, skipping...")
             return
 
-        rich.print(f"Validating data with {len(self._validations)} validation(s)...")
-
-        with Progress() as progress:
-            for validation in progress.track(self._validations, description="Apply validations..."):
-                if not validation.is_valid(output_data):
+        try:
+            for validation in self._validations:
+                start = time.perf_counter()
+                is_valid = validation.is_valid(output_data)
+                self.reporter.validation_done(validation.get_name(), is_valid, time.perf_counter() - start)
+                if not is_valid:
                     raise DataValidationError(f"Validation {validation.get_name()} failed")
-                rich.print(f"Validation [bold]{validation.get_name()}[/bold] [green]passed[/green]")
+        finally:
+            self.reporter.validations_done()
+
+    def _check_memory_budget(self, dataset: pd.DataFrame, step: Step) -> None:
+        if self._memory_budget is None:
+            return
+
+        if (nb_bytes := frame_size(dataset)) > self._memory_budget.max_bytes:
+            self.reporter.memory_budget_exceeded(step.get_name(), nb_bytes, self._memory_budget.max_bytes)
+
+    def _release_memory_budget(self) -> None:
+        if self._memory_budget is None:
+            return
+
+        if self._memory_budget.spill_count:
+            self.reporter.data_spilled(self._memory_budget.spill_count, self._memory_budget.spilled_bytes)
+        self._memory_budget.close()
 
     def _apply_all_dtypes(self, data: pd.DataFrame) -> pd.DataFrame:
         dtypes = {}
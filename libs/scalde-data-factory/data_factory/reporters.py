@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
+
+class Reporter:
+    """Receive the events emitted while a pipeline runs.
+
+    Every hook is a no-op by default, so implementations only override the events they need.
+    """
+
+    def pipeline_started(self, name: str) -> None:
+        pass
+
+    def steps_started(self, nb_steps: int) -> None:
+        pass
+
+    def step_done(self, step_name: str, nb_rows: int, nb_columns: int, duration: float) -> None:
+        pass
+
+    def steps_done(self) -> None:
+        pass
+
+    def validations_started(self, nb_validations: int) -> None:
+        pass
+
+    def validation_done(self, validation_name: str, passed: bool, duration: float) -> None:
+        pass
+
+    def validations_done(self) -> None:
+        pass
+
+    def memory_budget_exceeded(self, step_name: str, nb_bytes: int, max_bytes: int) -> None:
+        pass
+
+    def data_spilled(self, nb_frames: int, nb_bytes: int) -> None:
+        pass
+
+
+class NullReporter(Reporter):
+    pass
+
+
+class RichReporter(Reporter):
+    def __init__(self) -> None:
+        self._progress: Progress | None = None
+        self._task: TaskID | None = None
+
+    def pipeline_started(self, name: str) -> None:
+        import rich
+
+        rich.print(f"\n\nRunning pipeline: [bold green]{name}[/bold green]")
+
+    def steps_started(self, nb_steps: int) -> None:
+        self._start_progress("Apply steps...", nb_steps)
+
+    def step_done(self, step_name: str, nb_rows: int, nb_columns: int, duration: float) -> None:
+        self._print(f"Step [bold]{step_name}[/bold] done with data shape: {nb_rows} rows, {nb_columns} columns")
+        self._advance()
+
+    def steps_done(self) -> None:
+        self._stop_progress()
+
+    def validations_started(self, nb_validations: int) -> None:
+        import rich
+
+        if not nb_validations:
+            rich.print("No validation to apply, skipping...")
+            return
+
+        rich.print(f"Validating data with {nb_validations} validation(s)...")
+        self._start_progress("Apply validations...", nb_validations)
+
+    def validation_done(self, validation_name: str, passed: bool, duration: float) -> None:
+        if passed:
+            self._print(f"Validation [bold]{validation_name}[/bold] [green]passed[/green]")
+        else:
+            self._print(f"Validation [bold]{validation_name}[/bold] [red]failed[/red]")
+        self._advance()
+
+    def validations_done(self) -> None:
+        self._stop_progress()
+
+    def memory_budget_exceeded(self, step_name: str, nb_bytes: int, max_bytes: int) -> None:
+        self._print(
+            f"[yellow]Warning[/yellow]: output of step [bold]{step_name}[/bold] uses {_to_mb(nb_bytes)} MB, "
+            f"above the memory budget of {_to_mb(max_bytes)} MB"
+        )
+
+    def data_spilled(self, nb_frames: int, nb_bytes: int) -> None:
+        self._print(f"Spilled {nb_frames} frame(s) to disk for a total of {_to_mb(nb_bytes)} MB")
+
+    def _start_progress(self, description: str, total: int) -> None:
+        from rich.progress import Progress
+
+        self._stop_progress()
+        self._progress = Progress()
+        self._progress.start()
+        self._task = self._progress.add_task(description, total=total)
+
+    def _advance(self) -> None:
+        if self._progress is not None:
+            self._progress.advance(self._task)
+
+    def _stop_progress(self) -> None:
+        if self._progress is not None:
+            self._progress.stop()
+        self._progress, self._task = None, None
+
+    def _print(self, message: str) -> None:
+        if self._progress is not None:
+            self._progress.console.print(message)
+        else:
+            import rich
+
+            rich.print(message)
+
+
+class LoggingReporter(Reporter):
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO) -> None:
+        self._logger = logger or logging.getLogger("data_factory")
+        self._level = level
+
+    def pipeline_started(self, name: str) -> None:
+        self._log("pipeline_started", "Running pipeline %s", name, pipeline=name)
+
+    def step_done(self, step_name: str, nb_rows: int, nb_columns: int, duration: float) -> None:
+        self._log(
+            "step_done",
+            "Step %s done with data shape: %d rows, %d columns",
+            step_name,
+            nb_rows,
+            nb_columns,
+            step=step_name,
+            nb_rows=nb_rows,
+            nb_columns=nb_columns,
+            duration=duration,
+        )
+
+    def validations_started(self, nb_validations: int) -> None:
+        self._log(
+            "validations_started",
+            "Validating data with %d validation(s)",
+            nb_validations,
+            nb_validations=nb_validations,
+        )
+
+    def validation_done(self, validation_name: str, passed: bool, duration: float) -> None:
+        self._log(
+            "validation_done",
+            "Validation %s %s",
+            validation_name,
+            "passed" if passed else "failed",
+            validation=validation_name,
+            passed=passed,
+            duration=duration,
+        )
+
+    def memory_budget_exceeded(self, step_name: str, nb_bytes: int, max_bytes: int) -> None:
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(
+                "Output of step %s uses %d bytes, above the memory budget of %d bytes",
+                step_name,
+                nb_bytes,
+                max_bytes,
+                extra={
+                    "event": "memory_budget_exceeded",
+                    "step": step_name,
+                    "nb_bytes": nb_bytes,
+                    "max_bytes": max_bytes,
+                },
+            )
+
+    def data_spilled(self, nb_frames: int, nb_bytes: int) -> None:
+        self._log(
+            "data_spilled",
+            "Spilled %d frame(s) to disk for a total of %d bytes",
+            nb_frames,
+            nb_bytes,
+            nb_frames=nb_frames,
+            nb_bytes=nb_bytes,
+        )
+
+    def _log(self, event: str, msg: str, *args, **fields) -> None:
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, msg, *args, extra={"event": event} | fields)
+
+
+def _to_mb(nb_bytes: int) -> str:
+    return f"{nb_bytes / 1024 / 1024:.1f}"
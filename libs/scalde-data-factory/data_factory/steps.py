@@ -1,10 +1,15 @@
-from abc import ABC, abstractmethod
-from typing import Any
+from __future__ import annotations
 
-import pandas as pd
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
 
 from .exceptions import PipelineDefinitionError, PipelineProcessError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .memory import MemoryBudget
+
 
 class Step(ABC):
     @abstractmethod
@@ -18,32 +23,58 @@ class Step(ABC):
     def get_name(self) -> str:
         return self.__class__.__name__
 
+    def set_memory_budget(self, memory_budget: MemoryBudget) -> None:
+        pass
+
 
 class ParallelSteps(Step):
-    def __init__(self, *steps: Step) -> None:
+    def __init__(self, *steps: Step, memory_budget: MemoryBudget | None = None) -> None:
         if not steps:
             raise PipelineDefinitionError("At least one step must be provided to Parallel execution")
 
         self._steps = steps
+        self._memory_budget = memory_budget
 
     def process(self, dataset: pd.DataFrame) -> pd.DataFrame:
-        processing_results: list[pd.DataFrame] = []
-        df: pd.DataFrame | None = None
-        for step in self._steps:
-            df = step.process(dataset.copy())
-            processing_results.append(df)
+        import pandas as pd
 
-        first_step_cols = list(processing_results[0].columns)
-        for result in processing_results:
-            if list(result.columns) != first_step_cols:
-                raise PipelineProcessError("Proceed columns are different between steps")
-
-        final_df = pd.concat(processing_results, axis=0).reset_index(drop=True)
+        if self._memory_budget is None:
+            processing_results = [step.process(dataset.copy()) for step in self._steps]
+            for result in processing_results:
+                self._check_columns(list(processing_results[0].columns), result)
+            final_df = pd.concat(processing_results, axis=0).reset_index(drop=True)
+        else:
+            final_df = self._process_within_budget(dataset, self._memory_budget)
 
         return final_df.astype(self.get_dtypes())
 
     def get_dtypes(self) -> dict[str, Any]:
         return self._steps[-1].get_dtypes()
 
+    def set_memory_budget(self, memory_budget: MemoryBudget) -> None:
+        if self._memory_budget is None:
+            self._memory_budget = memory_budget
+        for step in self._steps:
+            step.set_memory_budget(memory_budget)
+
+    def _process_within_budget(self, dataset: pd.DataFrame, memory_budget: MemoryBudget) -> pd.DataFrame:
+        keys, first_step_cols = [], None
+        for step in self._steps:
+            result = step.process(dataset.copy())
+            if first_step_cols is None:
+                first_step_cols = list(result.columns)
+            self._check_columns(first_step_cols, result)
+            keys.append(memory_budget.track(result))
+            del result
+
+        final_df = memory_budget.concat(keys)
+        self._check_columns(first_step_cols, final_df)
+        return final_df
+
+    @staticmethod
+    def _check_columns(first_step_cols: list, result: pd.DataFrame) -> None:
+        if list(result.columns) != first_step_cols:
+            raise PipelineProcessError("Proceed columns are different between steps")
+
     def get_name(self) -> str:
         return "_".join([step.get_name() for step in self._steps])
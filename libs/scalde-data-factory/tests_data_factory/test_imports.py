@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("module", ["pandas", "rich"])
+def test_should_not_import_heavy_dependency_with_package(module):
+    # Given
+    probe = f"import sys, data_factory; sys.exit({module!r} in sys.modules)"
+
+    # When
+    result = subprocess.run([sys.executable, "-c", probe], env=os.environ | {"PYTHONPATH": os.pathsep.join(sys.path)})
+
+    # Then
+    assert result.returncode == 0, f"'import data_factory' eagerly imports {module}"
@@ -0,0 +1,252 @@
+import gc
+import re
+import weakref
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from data_factory import DataPipeline, Exporter, Loader, MemoryBudget, ParallelSteps, PipelineDefinitionError, Step
+
+from easy_testing import DataFrameBuilder, assert_called_once_with_frame, assert_frame_equals
+
+pytest.importorskip("pyarrow")
+
+
+class TestMemoryBudget:
+    @pytest.fixture
+    def small_dataset(self):
+        return DataFrameBuilder().with_columns(["col1", "col2"]).with_row((1, 2)).with_row((3, 4)).build()
+
+    def test_should_raise_definition_error_when_budget_is_not_positive(self):
+        # When & Then
+        with pytest.raises(
+            PipelineDefinitionError, match=re.escape("Memory budget must be a positive number of bytes")
+        ):
+            MemoryBudget(max_bytes=0)
+
+    def test_should_keep_data_in_memory_when_under_budget(self, small_dataset, tmp_path):
+        # Given
+        budget = MemoryBudget(max_bytes=10_000_000, spill_dir=tmp_path)
+
+        # When
+        key = budget.track(small_dataset)
+
+        # Then
+        assert budget.get(key) is small_dataset
+        assert budget.spill_count == 0
+        assert budget.spilled_bytes == 0
+
+    def test_should_spill_oldest_data_to_disk_when_over_budget(self, small_dataset, tmp_path):
+        # Given
+        budget = MemoryBudget(max_bytes=1, spill_dir=tmp_path)
+        other_dataset = DataFrameBuilder().with_columns(["col1", "col2"]).with_row((5, 6)).build()
+
+        # When
+        first_key = budget.track(small_dataset)
+        second_key = budget.track(other_dataset)
+
+        # Then
+        assert budget.spill_count == 1
+        assert budget.spilled_bytes > 0
+        assert budget.get(second_key) is other_dataset
+        assert_frame_equals(budget.get(first_key), small_dataset)
+
+    def test_should_remove_spill_files_when_closed(self, small_dataset, tmp_path):
+        # Given
+        budget = MemoryBudget(max_bytes=1, spill_dir=tmp_path)
+        budget.track(small_dataset)
+        budget.track(small_dataset)
+
+        # When
+        budget.close()
+
+        # Then
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "dataset",
+        [
+            DataFrameBuilder().with_columns(["col1"]).with_row((1,)).with_row(("a",)).build(),
+            DataFrameBuilder().with_columns([0, 1]).with_row((1, 2)).build(),
+        ],
+        ids=["mixed_type_column", "non_string_column_names"],
+    )
+    def test_should_pickle_data_that_parquet_cannot_hold(self, dataset, tmp_path):
+        # Given
+        budget = MemoryBudget(max_bytes=1, spill_dir=tmp_path)
+
+        # When
+        first_key = budget.track(dataset)
+        budget.track(dataset.copy())
+
+        # Then
+        assert budget.spill_count == 1
+        assert_frame_equals(budget.get(first_key), dataset)
+
+    def test_should_concatenate_tracked_data_with_a_fresh_index(self, small_dataset, tmp_path):
+        # Given
+        budget = MemoryBudget(max_bytes=1, spill_dir=tmp_path)
+        other_dataset = DataFrameBuilder().with_columns(["col1", "col2"]).with_row((5, 6)).build()
+        other_dataset.index = [7]
+        keys = [budget.track(small_dataset), budget.track(other_dataset)]
+
+        # When
+        result = budget.concat(keys)
+
+        # Then
+        expected_data = (
+            DataFrameBuilder().with_columns(["col1", "col2"]).with_row((1, 2)).with_row((3, 4)).with_row((5, 6)).build()
+        )
+        assert_frame_equals(result, expected_data)
+        assert budget.used_bytes == 0
+        assert list(tmp_path.rglob("*.parquet")) == []
+
+
+class TestDataPipelineWithMemoryBudget:
+    def test_should_concatenate_spilled_parallel_results(self, tmp_path):
+        # Given
+        input_dataset = DataFrameBuilder().with_columns(["col1", "col2"]).build()
+        mock_loader = MagicMock(spec=Loader)
+        mock_loader.load.return_value = input_dataset
+        mock_exporter = MagicMock(spec=Exporter)
+
+        step1 = MagicMock(spec=Step)
+        step1.process.return_value = DataFrameBuilder().with_columns(["col1", "col2"]).with_row((1, 2)).build()
+        step1.get_dtypes.return_value = {}
+        step1.get_name.return_value = "step1"
+        step2 = MagicMock(spec=Step)
+        step2.process.return_value = DataFrameBuilder().with_columns(["col1", "col2"]).with_row((3, 4)).build()
+        step2.get_dtypes.return_value = {}
+        step2.get_name.return_value = "step2"
+
+        budget = MemoryBudget(max_bytes=1, spill_dir=tmp_path)
+        pipeline = DataPipeline(
+            steps=[ParallelSteps(step1, step2)], loader=mock_loader, exporter=mock_exporter, memory_budget=budget
+        )
+
+        # When
+        pipeline.run()
+
+        # Then
+        expected_data = DataFrameBuilder().with_columns(["col1", "col2"]).with_row((1, 2)).with_row((3, 4)).build()
+        assert_called_once_with_frame(mock_exporter.export, expected_data)
+        assert budget.spill_count == 1
+        assert list(tmp_path.iterdir()) == []
+
+    def test_should_reset_spill_stats_between_runs(self, tmp_path):
+        # Given
+        mock_loader = MagicMock(spec=Loader)
+        mock_loader.load.return_value = DataFrameBuilder().with_columns(["col1"]).build()
+        step1 = MagicMock(spec=Step)
+        step1.process.return_value = DataFrameBuilder().with_columns(["col1"]).with_row((1,)).build()
+        step1.get_dtypes.return_value = {}
+        step1.get_name.return_value = "step1"
+        step2 = MagicMock(spec=Step)
+        step2.process.return_value = DataFrameBuilder().with_columns(["col1"]).with_row((2,)).build()
+        step2.get_dtypes.return_value = {}
+        step2.get_name.return_value = "step2"
+
+        budget = MemoryBudget(max_bytes=1, spill_dir=tmp_path)
+        pipeline = DataPipeline(
+            steps=[ParallelSteps(step1, step2)],
+            loader=mock_loader,
+            exporter=MagicMock(spec=Exporter),
+            memory_budget=budget,
+        )
+        pipeline.run()
+
+        # When
+        pipeline.run()
+
+        # Then
+        assert budget.spill_count == 1
+
+    def test_should_release_loaded_data_once_first_step_is_done(self, tmp_path):
+        # Given
+        loaded_refs = []
+
+        def load():
+            data = DataFrameBuilder().with_columns(["col1"]).with_row((1,)).build()
+            loaded_refs.append(weakref.ref(data))
+            return data
+
+        class FirstStep(Step):
+            def process(self, data):
+                return data.assign(col2=2)
+
+            def get_dtypes(self):
+                return {}
+
+        class SecondStep(FirstStep):
+            is_loaded_data_alive = None
+
+            def process(self, data):
+                gc.collect()
+                SecondStep.is_loaded_data_alive = loaded_refs[0]() is not None
+                return data
+
+        mock_loader = MagicMock(spec=Loader)
+        mock_loader.load.side_effect = load
+        pipeline = DataPipeline(
+            steps=[FirstStep(), SecondStep()],
+            loader=mock_loader,
+            exporter=MagicMock(spec=Exporter),
+            memory_budget=MemoryBudget(max_bytes=10_000_000, spill_dir=tmp_path),
+        )
+
+        # When
+        pipeline.run()
+
+        # Then
+        assert SecondStep.is_loaded_data_alive is False
+
+
+class TestParallelStepsWithMemoryBudget:
+    class ReturnStep(Step):
+        def __init__(self, data: dict) -> None:
+            self._data = data
+
+        def process(self, data):
+            return pd.DataFrame(self._data)
+
+        def get_dtypes(self):
+            return {}
+
+    @pytest.mark.parametrize("max_bytes", [10**9, 1], ids=["within_budget", "over_budget"])
+    @pytest.mark.parametrize(
+        "first_result,second_result",
+        [
+            ({0: [1], 1: [[1]]}, {0: [2], 1: [[2]]}),
+            (
+                {"a": [1], "b": [1.5], "c": ["x"], "d": pd.to_datetime(["2024-01-01"])},
+                {"a": [2], "b": [2.5], "c": ["y"], "d": pd.to_datetime(["2024-01-02"])},
+            ),
+        ],
+        ids=["object_cells_and_int_labels", "parquet_friendly"],
+    )
+    def test_should_return_same_data_as_without_budget(self, first_result, second_result, max_bytes, tmp_path):
+        # Given
+        steps = (self.ReturnStep(first_result), self.ReturnStep(second_result))
+        input_dataset = DataFrameBuilder().with_columns(["col1"]).build()
+        budget = MemoryBudget(max_bytes=max_bytes, spill_dir=tmp_path)
+
+        # When
+        without_budget = ParallelSteps(*steps).process(input_dataset)
+        with_budget = ParallelSteps(*steps, memory_budget=budget).process(input_dataset)
+
+        # Then
+        assert list(with_budget.columns) == list(without_budget.columns)
+        assert_frame_equals(with_budget, without_budget)
+        assert type(with_budget.iloc[0, 1]) is type(without_budget.iloc[0, 1])
+        assert budget.spill_count == (1 if max_bytes == 1 else 0)
+
+    def test_should_not_write_to_disk_when_nothing_is_spilled(self, tmp_path):
+        # Given
+        step = self.ReturnStep({"a": [1]})
+        budget = MemoryBudget(max_bytes=10**9, spill_dir=tmp_path)
+
+        # When
+        ParallelSteps(step, step, memory_budget=budget).process(DataFrameBuilder().with_columns(["a"]).build())
+
+        # Then
+        assert list(tmp_path.iterdir()) == []
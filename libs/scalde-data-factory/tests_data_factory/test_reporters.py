@@ -0,0 +1,132 @@
+import logging
+import re
+from unittest.mock import MagicMock
+
+import pytest
+from data_factory import (
+    DataPipeline,
+    DataValidation,
+    DataValidationError,
+    Exporter,
+    Loader,
+    LoggingReporter,
+    NullReporter,
+    Reporter,
+    Step,
+)
+
+from easy_testing import DataFrameBuilder
+
+
+class TestReporting:
+    @pytest.fixture
+    def mock_loader(self):
+        mock = MagicMock(spec=Loader)
+        mock.load.return_value = DataFrameBuilder().with_columns(["a"]).with_row((1,)).build()
+        return mock
+
+    @pytest.fixture
+    def mock_step(self):
+        mock = MagicMock(spec=Step)
+        mock.get_name.return_value = "my_step"
+        mock.get_dtypes.return_value = {}
+        mock.process.return_value = DataFrameBuilder().with_columns(["a", "b"]).with_row((1, 2)).build()
+        return mock
+
+    @pytest.fixture
+    def mock_validation(self):
+        mock = MagicMock(spec=DataValidation)
+        mock.get_name.return_value = "my_validation"
+        mock.is_valid.return_value = True
+        return mock
+
+    def test_should_send_step_and_validation_events_to_reporter(self, mock_loader, mock_step, mock_validation):
+        # Given
+        reporter = MagicMock(spec=Reporter)
+        pipeline = DataPipeline(
+            steps=[mock_step],
+            loader=mock_loader,
+            exporter=MagicMock(spec=Exporter),
+            name="my_pipeline",
+            validations=[mock_validation],
+            reporter=reporter,
+        )
+
+        # When
+        pipeline.run()
+
+        # Then
+        reporter.pipeline_started.assert_called_once_with("my_pipeline")
+        reporter.steps_started.assert_called_once_with(1)
+        assert reporter.step_done.call_args.args[:3] == ("my_step", 1, 2)
+        reporter.steps_done.assert_called_once_with()
+        reporter.validations_started.assert_called_once_with(1)
+        assert reporter.validation_done.call_args.args[:2] == ("my_validation", True)
+        reporter.validations_done.assert_called_once_with()
+
+    def test_should_report_failed_validation_before_raising(self, mock_loader, mock_step, mock_validation):
+        # Given
+        mock_validation.is_valid.return_value = False
+        reporter = MagicMock(spec=Reporter)
+        pipeline = DataPipeline(
+            steps=[mock_step],
+            loader=mock_loader,
+            exporter=MagicMock(spec=Exporter),
+            validations=[mock_validation],
+            reporter=reporter,
+        )
+
+        # When & Then
+        with pytest.raises(DataValidationError, match=re.escape("Validation my_validation failed")):
+            pipeline.run()
+
+        assert reporter.validation_done.call_args.args[:2] == ("my_validation", False)
+        reporter.validations_done.assert_called_once_with()
+
+    def test_should_not_print_anything_with_null_reporter(self, mock_loader, mock_step, capsys):
+        # Given
+        pipeline = DataPipeline(
+            steps=[mock_step], loader=mock_loader, exporter=MagicMock(spec=Exporter), reporter=NullReporter()
+        )
+
+        # When
+        pipeline.run()
+
+        # Then
+        assert capsys.readouterr().out == ""
+
+    def test_should_log_structured_events_with_logging_reporter(self, mock_loader, mock_step, caplog):
+        # Given
+        pipeline = DataPipeline(
+            steps=[mock_step],
+            loader=mock_loader,
+            exporter=MagicMock(spec=Exporter),
+            name="my_pipeline",
+            reporter=LoggingReporter(),
+        )
+
+        # When
+        with caplog.at_level(logging.INFO, logger="data_factory"):
+            pipeline.run()
+
+        # Then
+        events = [record.event for record in caplog.records]
+        assert events == ["pipeline_started", "step_done", "validations_started"]
+        step_record = caplog.records[1]
+        assert step_record.getMessage() == "Step my_step done with data shape: 1 rows, 2 columns"
+        assert (step_record.step, step_record.nb_rows, step_record.nb_columns) == ("my_step", 1, 2)
+
+    def test_should_log_memory_budget_with_logging_reporter(self, caplog):
+        # When
+        with caplog.at_level(logging.WARNING, logger="data_factory"):
+            LoggingReporter().memory_budget_exceeded("my_step", 2048, 1024)
+
+        # Then
+        record = caplog.records[0]
+        assert record.getMessage() == "Output of step my_step uses 2048 bytes, above the memory budget of 1024 bytes"
+        assert (record.event, record.step, record.nb_bytes, record.max_bytes) == (
+            "memory_budget_exceeded",
+            "my_step",
+            2048,
+            1024,
+        )
@@ -1,12 +1,19 @@
 from .builders import DataFrameBuilder
+from .caches import FrameCache
 from .dataframes import (
     AssertFrame,
+    assert_any_call_with_frame,
     assert_called_once_with_frame,
     assert_contains_line,
     assert_contains_lines,
     assert_frame_equals,
     assert_frame_partially_equals,
 )
+from .diffs import DiffKeyError, FrameDiff, diff_frames
+from .generators import ColumnSpec, DatasetGenerator
+from .snapshots import assert_frame_matches_snapshot
+from .streaming import assert_files_equal, diff_files
+from .tolerances import Tolerance, assert_frame_almost_equals, deviation_summary
 
 __all__ = [
     "assert_contains_line",
@@ -15,5 +22,18 @@ __all__ = [
     "DataFrameBuilder",
     "assert_frame_equals",
     "assert_called_once_with_frame",
+    "assert_any_call_with_frame",
     "AssertFrame",
+    "FrameDiff",
+    "DiffKeyError",
+    "diff_frames",
+    "ColumnSpec",
+    "DatasetGenerator",
+    "FrameCache",
+    "assert_frame_matches_snapshot",
+    "Tolerance",
+    "assert_frame_almost_equals",
+    "deviation_summary",
+    "assert_files_equal",
+    "diff_files",
 ]
@@ -1,11 +1,21 @@
+import hashlib
+import itertools
+import pickle
+from typing import Any, Callable, Iterable
+
+import numpy as np
 import pandas as pd
 
+ColumnGenerator = Callable[[int], Iterable] | Iterable
+
 
 class DataFrameBuilder:
     def __init__(self):
         self.columns = []
         self.rows = []
         self.dtypes = {}
+        self._chunks: list[list[tuple] | dict[str, Any]] = []
+        self._column_values: dict[str, Any] = {}
 
     @classmethod
     def a_dataframe(cls):
@@ -23,12 +33,112 @@ class DataFrameBuilder:
 
         return self
 
+    def with_rows(self, rows: Iterable[tuple] | np.ndarray) -> "DataFrameBuilder":
+        """Add many rows at once, from an iterable of tuples or a 2D NumPy array."""
+        if isinstance(rows, np.ndarray):
+            if rows.ndim != 2 or rows.shape[1] != len(self.columns):
+                raise ValueError(f"Rows array shape mismatch: expected (n, {len(self.columns)}), got {rows.shape}")
+            self._add_chunk({column: rows[:, i] for i, column in enumerate(self.columns)})
+        else:
+            self.rows.extend(rows)
+
+        return self
+
+    def with_column(self, name: str, values: Iterable) -> "DataFrameBuilder":
+        """Set all the values of a column at once. Can't be mixed with rows."""
+        if name not in self.columns:
+            self.columns = [*self.columns, name]
+        self._column_values[name] = values if hasattr(values, "__len__") else list(values)
+        return self
+
+    def with_generated_rows(self, nb_rows: int, **generators: ColumnGenerator) -> "DataFrameBuilder":
+        """Add nb_rows rows, each column being generated by a function of the number of rows or an iterable."""
+        if missing_columns := [column for column in self.columns if column not in generators]:
+            raise ValueError(f"Missing generator for column(s) {', '.join(map(repr, missing_columns))}")
+
+        self._add_chunk({column: _generate(generators[column], nb_rows) for column in self.columns})
+        return self
+
     def with_dtypes(self, **kwargs) -> "DataFrameBuilder":
         self.dtypes |= kwargs
         return self
 
+    def fingerprint(self) -> str:
+        """Hash of everything the built dataframe depends on."""
+        inputs = (self.columns, self.dtypes, self._chunks, self.rows, self._column_values)
+        return hashlib.sha256(pickle.dumps(inputs, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
     def build(self) -> pd.DataFrame:
-        df = pd.DataFrame(columns=self.columns, data=self.rows)
-        if self.dtypes:
-            df = df.astype(self.dtypes)
+        if self._column_values:
+            if self._chunks or self.rows:
+                raise ValueError("Columns values can't be mixed with rows")
+            if missing_columns := [column for column in self.columns if column not in self._column_values]:
+                raise ValueError(f"Missing values for column(s) {', '.join(map(repr, missing_columns))}")
+            if len({len(values) for values in self._column_values.values()}) > 1:
+                raise ValueError("All columns values must have the same length")
+            chunks = [self._column_values]
+        else:
+            chunks = [chunk for chunk in [*self._chunks, self.rows] if len(chunk)]
+
+        if not chunks:
+            return self._build_columns({column: [] for column in self.columns}, self.dtypes)
+        if len(chunks) == 1:
+            return self._build_chunk(chunks[0], self.dtypes)
+
+        # dtypes are cast once on the whole frame: chunks cast on their own would not concatenate back to them,
+        # like categories differing from one chunk to another
+        df = pd.concat([self._build_chunk(chunk, {}) for chunk in chunks], ignore_index=True)
+        return self._cast(df, self.dtypes)
+
+    def _add_chunk(self, chunk: dict[str, Any]) -> None:
+        if self.rows:
+            self._chunks.append(self.rows)
+            self.rows = []
+        self._chunks.append(chunk)
+
+    def _build_chunk(self, chunk: list[tuple] | dict[str, Any], dtypes: dict[str, Any]) -> pd.DataFrame:
+        return self._build_columns(chunk, dtypes) if isinstance(chunk, dict) else self._build_rows(chunk, dtypes)
+
+    def _build_columns(self, columns_values: dict[str, Any], dtypes: dict[str, Any]) -> pd.DataFrame:
+        return pd.DataFrame(
+            {column: _to_series(columns_values[column], dtypes.get(column)) for column in self.columns},
+            columns=self.columns,
+        )
+
+    def _build_rows(self, rows: list[tuple], dtypes: dict[str, Any]) -> pd.DataFrame:
+        expected = len(self.columns)
+        for row in rows:
+            if (got := len(row)) != expected:
+                raise ValueError(f"Row size mismatch: expected {expected}, got {got}")
+
+        # pandas transposes tuples faster than any per-column construction, even with the dtypes cast afterwards
+        return self._cast(pd.DataFrame(columns=self.columns, data=rows), dtypes)
+
+    @staticmethod
+    def _cast(df: pd.DataFrame, dtypes: dict[str, Any]) -> pd.DataFrame:
+        if dtypes := {column: dtype for column, dtype in dtypes.items() if column in df.columns}:
+            df = df.astype(dtypes)
         return df
+
+
+def _generate(generator: ColumnGenerator, nb_rows: int) -> Iterable:
+    if callable(generator):
+        values = generator(nb_rows)
+    elif isinstance(generator, (np.ndarray, pd.Series, list, tuple)):
+        values = generator
+    else:
+        values = list(itertools.islice(generator, nb_rows))
+
+    if len(values) != nb_rows:
+        raise ValueError(f"Generated column size mismatch: expected {nb_rows}, got {len(values)}")
+    return values
+
+
+def _to_series(values: Iterable, dtype: Any) -> pd.Series:
+    if dtype is None:
+        return pd.Series(values, dtype=object if not len(values) else None)
+
+    try:
+        return pd.Series(values, dtype=dtype)
+    except (TypeError, ValueError):
+        return pd.Series(values).astype(dtype)
@@ -0,0 +1,104 @@
+import hashlib
+import os
+import tempfile
+import warnings
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from .builders import DataFrameBuilder
+
+CACHE_DIR_ENV_VAR = "EASY_TESTING_CACHE_DIR"
+DEFAULT_CACHE_DIR = ".easy_testing_cache"
+
+# bump to invalidate every entry written with a previous storage format
+_FORMAT_VERSION = "1"
+
+
+class FrameCache:
+    """Cache built dataframes on disk as Arrow IPC files, memory-mapped back on later calls.
+
+    Entries are written atomically, so several processes, like pytest-xdist workers, can share the
+    same directory. Requires pyarrow.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = Path(directory or os.environ.get(CACHE_DIR_ENV_VAR, DEFAULT_CACHE_DIR))
+
+    def get_or_build(self, key: str, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        return self._get_or_build(_hash(key), build)
+
+    def from_builder(self, builder: DataFrameBuilder) -> pd.DataFrame:
+        return self._get_or_build(f"builder-{builder.fingerprint()}", builder.build)
+
+    def from_csv(self, filepath: str | Path, **read_csv_kwargs) -> pd.DataFrame:
+        filepath = Path(filepath)
+        source_prefix = f"csv-{_hash(str(filepath.resolve()))[:16]}"
+        stat = filepath.stat()
+        source_version = _hash(f"{stat.st_mtime_ns}-{stat.st_size}-{_hash_file(filepath)}")[:16]
+        kwargs_hash = _hash(repr(sorted(read_csv_kwargs.items())))
+
+        # entries of the same file read with other read_csv arguments stay, only older versions are evicted
+        self._remove_stale_entries(source_prefix, keep=f"{source_prefix}-{source_version}")
+        name = f"{source_prefix}-{source_version}-{kwargs_hash}"
+        return self._get_or_build(name, lambda: pd.read_csv(filepath, **read_csv_kwargs))
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.arrow"):
+            path.unlink(missing_ok=True)
+
+    def _get_or_build(self, name: str, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        path = self.directory / f"{name}-v{_FORMAT_VERSION}.arrow"
+        if path.exists():
+            return _read(path)
+
+        data = build()
+        try:
+            _write(data, path)
+        except (TypeError, ValueError) as e:  # pyarrow errors derive from both
+            warnings.warn(f"Dataframe can't be cached: {e}")
+            return data
+
+        return _read(path)
+
+    def _remove_stale_entries(self, prefix: str, keep: str) -> None:
+        for path in self.directory.glob(f"{prefix}-*.arrow"):
+            if not path.name.startswith(f"{keep}-"):
+                path.unlink(missing_ok=True)
+
+
+def _read(path: Path) -> pd.DataFrame:
+    import pyarrow as pa
+
+    # the mapping stays open as long as the returned columns reference it
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def _write(data: pd.DataFrame, path: Path) -> None:
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(data)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _hash(value: str) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def _hash_file(filepath: Path) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
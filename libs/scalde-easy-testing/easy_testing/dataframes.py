@@ -1,8 +1,13 @@
-from typing import Any, Iterable
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Iterable
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 
+from .diffs import DiffKeyError, FrameDiff, diff_frames, diff_rows, hash_rows
+
 
 class AssertFrame:
     def __init__(self, data: pd.DataFrame, **kwargs) -> None:
@@ -15,35 +20,44 @@ def assert_called_once_with_frame(mock: MagicMock, *args, **kwargs) -> None:
         raise AssertionError(f"Expected to be called once but was called {mock.call_count} times")
 
     call_args, call_kwargs = mock.call_args
+    _assert_call_with_frame(call_args, call_kwargs, args, kwargs)
 
-    if len(call_args) != len(args):
-        raise AssertionError(f"Expected {len(args)} argument(s) but got {len(call_args)}")
 
-    if (expected_kwargs := kwargs.keys()) != (actual_kwargs := call_kwargs.keys()):
-        raise AssertionError(
-            f"Expected keyword argument(s) {', '.join(expected_kwargs)} but got {', '.join(actual_kwargs)}"
-        )
+def assert_any_call_with_frame(mock: MagicMock, *args, **kwargs) -> None:
+    """Check that at least one call of the mock received the given arguments.
 
-    for arg, call_arg in zip(args, call_args):
-        _assert_frame_equals_in_args(arg, call_arg)
+    Dataframes are compared in place, never copied. Calls whose dataframes don't have the expected
+    shape and columns are discarded before any value is compared.
 
-    for (actual_kwarg, actual_value), (expected_kwarg, expected_value) in zip(call_kwargs.items(), kwargs.items()):
-        _assert_frame_equals_in_kwargs(actual_kwarg, actual_value, expected_kwarg, expected_value)
+    Raises:
+        AssertionError: when no call matches, with the reason each call was rejected
+    """
+    if not mock.call_args_list:
+        raise AssertionError("Expected to be called but was never called")
+
+    reasons = []
+    for index, (call_args, call_kwargs) in enumerate(mock.call_args_list):
+        try:
+            _check_call_fingerprint(call_args, call_kwargs, args, kwargs)
+            _assert_call_with_frame(call_args, call_kwargs, args, kwargs)
+        except AssertionError as e:
+            reasons.append(f"  call {index}: {str(e).splitlines()[0]}")
+        else:
+            return
+
+    raise AssertionError("No call matches the expected arguments\n" + "\n".join(reasons))
 
 
 def assert_contains_line(data: pd.DataFrame, line: Iterable) -> None:
     columns = data.columns
 
-    if not _is_contains_line(data, line):
+    if _find_missing_lines(data, [line]):
         msg = f"Expected line {_render_line(columns, line)} not found in dataframe"
         raise AssertionError(msg)
 
 
 def assert_contains_lines(data: pd.DataFrame, lines: Iterable[Iterable]) -> None:
-    mismatches = []
-    for line in lines:
-        if not _is_contains_line(data, line):
-            mismatches.append(line)
+    mismatches = _find_missing_lines(data, list(lines))
 
     if not mismatches:
         return None
@@ -62,18 +76,18 @@ def assert_frame_partially_equals(
     dataframe_right: pd.DataFrame,
     columns: Iterable[str],
     check_row_order: bool = True,
+    workers: int | Executor | None = None,
     **kwargs,
 ) -> None:
     _check_columns(dataframe_left, columns, "left")
     _check_columns(dataframe_right, columns, "right")
 
-    df_left, df_right = dataframe_left[columns].copy(), dataframe_right[columns].copy()
+    df_left, df_right = dataframe_left[columns], dataframe_right[columns]
     if not check_row_order:
-        df_left, df_right = df_left.sort_values(columns).reset_index(drop=True), df_right.sort_values(
-            columns
-        ).reset_index(drop=True)
+        _assert_frame_equal_ignoring_row_order(df_left, df_right, workers=workers, **kwargs)
+        return
 
-    pd.testing.assert_frame_equal(df_left, df_right, **kwargs)
+    assert_frame_equal_with_diff(df_left, df_right, workers=workers, **kwargs)
 
 
 def assert_frame_equals(
@@ -81,6 +95,8 @@ def assert_frame_equals(
     dataframe_right: pd.DataFrame,
     check_row_order: bool = True,
     check_columns_order: bool = True,
+    diff_key: str | Iterable[str] | None = None,
+    workers: int | Executor | None = None,
     **kwargs,
 ) -> None:
     """Compare two dataframes acording to their values.
@@ -90,35 +106,168 @@ def assert_frame_equals(
         dataframe_right (pd.DataFrame)
         check_row_order (bool, optional): Defaults to True.
         check_columns_order (bool, optional): Defaults to True.
+        diff_key (str | Iterable[str], optional): unique columns used to align rows in the
+            failure report. Rows are aligned on position when not given. Defaults to None.
+        workers (int | Executor, optional): number of processes, or executor, comparing groups of
+            columns concurrently. Comparisons hold the GIL, so only a process pool speeds them up.
+            Columns are compared one after the other when not given. Defaults to None.
         **kwargs: pd.testing.assert_frame_equal kwargs
 
     Raises:
-        AssertionError: when dataframes are not equals
+        AssertionError: when dataframes are not equals, with a summary of the differences
     """
 
     if not (left_cols := sorted(list(dataframe_left.columns))) == (right_cols := sorted(list(dataframe_right.columns))):
         raise AssertionError(
             f"Columns are different. "
-            f"left ones are {_format_columns_as_string(left_cols)} "
-            f"and right ones are {_format_columns_as_string(right_cols)}"
+            f"left ones are {format_columns_as_string(left_cols)} "
+            f"and right ones are {format_columns_as_string(right_cols)}"
         )
 
     columns = list(dataframe_left.columns)
 
-    df_left, df_right = dataframe_left.copy(), dataframe_right.copy()
+    df_left, df_right = dataframe_left, dataframe_right
 
     if not check_columns_order:
         df_left = df_left[columns]
         df_right = df_right[columns]
 
     if not check_row_order:
-        df_left = df_left.sort_values(columns).reset_index(drop=True)
-        df_right = df_right.sort_values(columns).reset_index(drop=True)
+        _assert_frame_equal_ignoring_row_order(df_left, df_right, workers=workers, **kwargs)
+        return
+
+    assert_frame_equal_with_diff(df_left, df_right, diff_key=diff_key, workers=workers, **kwargs)
 
-    pd.testing.assert_frame_equal(df_left, df_right, **kwargs)
 
+def assert_frame_equal_with_diff(
+    df_left: pd.DataFrame,
+    df_right: pd.DataFrame,
+    diff_key: str | Iterable[str] | None = None,
+    workers: int | Executor | None = None,
+    **kwargs,
+) -> None:
+    """Compare frames with pandas, adding a rendered diff of their values to the assertion message."""
+    try:
+        if workers is None:
+            pd.testing.assert_frame_equal(df_left, df_right, **kwargs)
+        else:
+            _assert_frame_equal_by_column_groups(df_left, df_right, workers, **kwargs)
+    except AssertionError as e:
+        raise AssertionError(f"{e}\n\n{_render_diff(lambda: _diff_frames(df_left, df_right, diff_key))}") from None
+
+
+def _diff_frames(df_left: pd.DataFrame, df_right: pd.DataFrame, diff_key: str | Iterable[str] | None) -> FrameDiff:
+    try:
+        return diff_frames(df_left, df_right, key=diff_key)
+    except DiffKeyError:
+        return diff_frames(df_left, df_right)
+
+
+def _render_diff(compute_diff: Callable[[], FrameDiff]) -> str:
+    try:
+        return compute_diff().render()
+    except Exception as e:  # a diff that can't be computed must not hide the assertion error
+        return f"Diff unavailable: {e.__class__.__name__}: {e}"
+
+
+def _assert_frame_equal_ignoring_row_order(
+    df_left: pd.DataFrame, df_right: pd.DataFrame, workers: int | Executor | None = None, **kwargs
+) -> None:
+    try:
+        left_hashes, right_hashes = hash_rows(df_left), hash_rows(df_right)
+    except TypeError:
+        assert_frame_equal_with_diff(_sort_rows(df_left), _sort_rows(df_right), workers=workers, **kwargs)
+        return
+
+    left_order, right_order = _order_rows(df_left, left_hashes), _order_rows(df_right, right_hashes)
+    if np.array_equal(left_hashes[left_order], right_hashes[right_order]):
+        # same rows on both sides: ordering them by hash aligns them, only metadata like dtypes is left to check
+        assert_frame_equal_with_diff(
+            df_left.take(left_order).reset_index(drop=True),
+            df_right.take(right_order).reset_index(drop=True),
+            workers=workers,
+            **kwargs,
+        )
+        return
+
+    # hashes are exact, values may still be equal according to pandas tolerances (dtype, rtol...)
+    try:
+        pd.testing.assert_frame_equal(_sort_rows(df_left), _sort_rows(df_right), **kwargs)
+    except (AssertionError, TypeError) as e:
+        cause = str(e) if isinstance(e, AssertionError) else "DataFrame rows are different"
+        raise AssertionError(f"{cause}\n\n{_render_diff(lambda: diff_rows(df_left, df_right))}") from None
+
+
+def _assert_frame_equal_by_column_groups(
+    df_left: pd.DataFrame, df_right: pd.DataFrame, workers: int | Executor, **kwargs
+) -> None:
+    if (
+        df_left.shape != df_right.shape
+        or not df_left.columns.equals(df_right.columns)
+        or df_left.shape[1] < 2
+        or kwargs.get("check_like", False)
+        or not _is_frame_equal(df_left.iloc[:, :0], df_right.iloc[:, :0], kwargs)
+    ):
+        pd.testing.assert_frame_equal(df_left, df_right, **kwargs)
+        return
+
+    nb_workers = workers if isinstance(workers, int) else os.cpu_count() or 1
+    bounds = np.linspace(0, df_left.shape[1], min(df_left.shape[1], 2 * nb_workers) + 1).astype(int)
+    executor = ProcessPoolExecutor(workers) if isinstance(workers, int) else workers
+    try:
+        # the index is compared once above, groups are sent to workers without it
+        futures = [
+            executor.submit(
+                _is_frame_equal,
+                df_left.iloc[:, start:stop].reset_index(drop=True),
+                df_right.iloc[:, start:stop].reset_index(drop=True),
+                kwargs,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        all_equal = all(future.result() for future in futures)
+    finally:
+        if isinstance(workers, int):
+            executor.shutdown()
+
+    if not all_equal:
+        # compared again as a whole, so that the message is the same as without workers
+        pd.testing.assert_frame_equal(df_left, df_right, **kwargs)
+
+
+def _is_frame_equal(df_left: pd.DataFrame, df_right: pd.DataFrame, kwargs: dict) -> bool:
+    try:
+        pd.testing.assert_frame_equal(df_left, df_right, **kwargs)
+    except AssertionError:
+        return False
+    return True
+
+
+def _order_rows(data: pd.DataFrame, hashes: np.ndarray) -> np.ndarray:
+    """Order rows by hash, rows sharing a hash being ordered by their exact values.
+
+    Object values are hashed through their string, so that 1 and "1" share a hash.
+    """
+    tied = pd.Series(hashes).duplicated(keep=False).to_numpy()
+    if not tied.any():
+        return hashes.argsort(kind="stable")
 
-def _format_columns_as_string(columns: Iterable[str]) -> str:
+    tied_rows = [
+        tuple((type(value).__name__, repr(value)) for value in row)
+        for row in data.iloc[tied].itertuples(index=False, name=None)
+    ]
+    ranks = {row: rank for rank, row in enumerate(sorted(set(tied_rows)))}
+    tie_breaks = np.zeros(len(data), dtype=np.int64)
+    tie_breaks[tied] = [ranks[row] for row in tied_rows]
+    return np.lexsort((tie_breaks, hashes))
+
+
+def _sort_rows(data: pd.DataFrame) -> pd.DataFrame:
+    return data.sort_values(list(data.columns)).reset_index(drop=True)
+
+
+def format_columns_as_string(columns: Iterable[str]) -> str:
+    """Format column names for assertion messages, like ['a', 'b']."""
     col_list = ", ".join([f"'{col}'" for col in columns])
     return f"[{col_list}]"
 
@@ -128,6 +277,34 @@ def _render_line(columns: Iterable[str], line: Iterable) -> str:
     return f"<{line_str}>"
 
 
+def _find_missing_lines(data: pd.DataFrame, lines: list[Iterable]) -> list[Iterable]:
+    columns = list(data.columns)
+    for line in lines:
+        if (expected := len(columns)) != (got := len(line)):
+            raise ValueError(f"Line size mismatch: expected {expected}, got {got}")
+
+    if not lines:
+        return []
+
+    try:
+        found = _match_lines(data, pd.DataFrame(list(map(list, lines)), columns=columns))
+    except (TypeError, ValueError):
+        found = [_is_contains_line(data, line) for line in lines]
+
+    return [line for line, is_found in zip(lines, found) if not is_found]
+
+
+def _match_lines(data: pd.DataFrame, expected: pd.DataFrame) -> np.ndarray:
+    """Look up all expected lines at once with a single join against the deduplicated data."""
+    if data.empty:
+        return np.zeros(len(expected), dtype=bool)
+
+    columns = list(data.columns)
+    matches = expected.merge(data.drop_duplicates(), on=columns, how="left", indicator=True)
+    # missing values never equal anything, as with the == operator
+    return (matches["_merge"] == "both").to_numpy() & ~expected.isna().any(axis=1).to_numpy()
+
+
 def _is_contains_line(data: pd.DataFrame, line: Iterable) -> bool:
     columns = data.columns
     if (expected := len(columns)) != (got := len(line)):
@@ -152,9 +329,51 @@ def _check_columns(dataframe: pd.DataFrame, columns: Iterable[str], side: str) -
         raise ValueError(f"Column(s) {missing_columns_msg} not found in {side} dataframe")
 
 
+def _assert_call_with_frame(call_args: tuple, call_kwargs: dict, args: tuple, kwargs: dict) -> None:
+    if len(call_args) != len(args):
+        raise AssertionError(f"Expected {len(args)} argument(s) but got {len(call_args)}")
+
+    if (expected_kwargs := kwargs.keys()) != (actual_kwargs := call_kwargs.keys()):
+        raise AssertionError(
+            f"Expected keyword argument(s) {', '.join(expected_kwargs)} but got {', '.join(actual_kwargs)}"
+        )
+
+    for arg, call_arg in zip(args, call_args):
+        _assert_frame_equals_in_args(arg, call_arg)
+
+    for (actual_kwarg, actual_value), (expected_kwarg, expected_value) in zip(call_kwargs.items(), kwargs.items()):
+        _assert_frame_equals_in_kwargs(actual_kwarg, actual_value, expected_kwarg, expected_value)
+
+
+def _check_call_fingerprint(call_args: tuple, call_kwargs: dict, args: tuple, kwargs: dict) -> None:
+    """Reject a call on the shape and columns of its dataframes, which costs nothing compared to their values."""
+    if len(call_args) != len(args) or call_kwargs.keys() != kwargs.keys():
+        return  # reported by _assert_call_with_frame
+
+    expected_values = [*args, *kwargs.values()]
+    actual_values = [*call_args, *(call_kwargs[kwarg] for kwarg in kwargs)]
+    for expected, actual in zip(expected_values, actual_values):
+        if not isinstance(expected, (pd.DataFrame, AssertFrame)):
+            continue
+
+        expected_data = expected.data if isinstance(expected, AssertFrame) else expected
+        if not isinstance(actual, pd.DataFrame):
+            raise AssertionError(f"Expected a dataframe but got {type(actual).__name__}")
+        if actual.shape != expected_data.shape:
+            raise AssertionError(f"Expected a dataframe of shape {expected_data.shape} but got {actual.shape}")
+        if set(actual.columns) != set(expected_data.columns):
+            raise AssertionError(
+                f"Columns are different. "
+                f"left ones are {format_columns_as_string(actual.columns)} "
+                f"and right ones are {format_columns_as_string(expected_data.columns)}"
+            )
+
+
 def _assert_frame_equals_in_kwargs(
     actual_kwarg: dict, actual_value: Any, expected_kwarg: dict, expected_value: Any
 ) -> None:
+    if expected_value is actual_value:
+        return
     if isinstance(expected_value, pd.DataFrame):
         assert_frame_equals(actual_value, expected_value)
     elif isinstance(expected_value, AssertFrame):
@@ -165,6 +384,8 @@ def _assert_frame_equals_in_kwargs(
 
 
 def _assert_frame_equals_in_args(arg: list, call_arg: list) -> None:
+    if arg is call_arg:
+        return
     if isinstance(arg, pd.DataFrame):
         assert_frame_equals(call_arg, arg)
     elif isinstance(arg, AssertFrame):
@@ -0,0 +1,234 @@
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_SAMPLES = 10
+
+
+class DiffKeyError(ValueError):
+    """Raised when the key columns used to align rows are missing or not unique."""
+
+
+@dataclass
+class FrameDiff:
+    """Differences between a left and a right dataframe.
+
+    Added rows are only present in the right dataframe, removed rows only in the left one.
+    """
+
+    nb_left_rows: int
+    nb_right_rows: int
+    nb_added_rows: int = 0
+    nb_removed_rows: int = 0
+    changed: dict[str, int] = field(default_factory=dict)
+    left_only_columns: list[str] = field(default_factory=list)
+    right_only_columns: list[str] = field(default_factory=list)
+    samples: pd.DataFrame | None = None
+
+    @property
+    def nb_changed_values(self) -> int:
+        return sum(self.changed.values())
+
+    def is_empty(self) -> bool:
+        return not (
+            self.nb_added_rows
+            or self.nb_removed_rows
+            or self.changed
+            or self.left_only_columns
+            or self.right_only_columns
+        )
+
+    def render(self) -> str:
+        if self.is_empty():
+            return "No difference found in values"
+
+        lines = [f"Dataframes differ (left: {self.nb_left_rows} rows, right: {self.nb_right_rows} rows)"]
+        if self.left_only_columns:
+            lines.append(f"  columns only in left: {', '.join(map(str, self.left_only_columns))}")
+        if self.right_only_columns:
+            lines.append(f"  columns only in right: {', '.join(map(str, self.right_only_columns))}")
+        if self.nb_added_rows:
+            lines.append(f"  rows only in right (added): {self.nb_added_rows}")
+        if self.nb_removed_rows:
+            lines.append(f"  rows only in left (removed): {self.nb_removed_rows}")
+        if self.changed:
+            lines.append("  changed values per column:")
+            lines.extend(f"    {column}: {nb_changed}" for column, nb_changed in self.changed.items())
+        if self.samples is not None and not self.samples.empty:
+            lines.append(f"  sample of differences (first {len(self.samples)}):")
+            lines.extend(f"    {line}" for line in self.samples.to_string(index=False).splitlines())
+
+        return "\n".join(lines)
+
+
+def diff_frames(
+    dataframe_left: pd.DataFrame,
+    dataframe_right: pd.DataFrame,
+    key: str | Iterable[str] | None = None,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+) -> FrameDiff:
+    """Compute the differences between two dataframes in a single vectorized pass.
+
+    Args:
+        dataframe_left (pd.DataFrame)
+        dataframe_right (pd.DataFrame)
+        key (str | Iterable[str], optional): columns used to align rows. Rows are aligned
+            on position when not given. Defaults to None.
+        max_samples (int, optional): maximum number of differing values reported. Defaults to 10.
+
+    Raises:
+        DiffKeyError: when key columns are missing or not unique
+
+    Returns:
+        FrameDiff
+    """
+    left_columns, right_columns = list(dataframe_left.columns), list(dataframe_right.columns)
+    right_column_set, left_column_set = set(right_columns), set(left_columns)
+    diff = FrameDiff(
+        nb_left_rows=len(dataframe_left),
+        nb_right_rows=len(dataframe_right),
+        left_only_columns=[col for col in left_columns if col not in right_column_set],
+        right_only_columns=[col for col in right_columns if col not in left_column_set],
+    )
+
+    if key is None:
+        left, right, row_labels = _align_on_position(dataframe_left, dataframe_right, diff)
+        label_name = "row"
+    else:
+        key = [key] if isinstance(key, str) else list(key)
+        left, right, row_labels = _align_on_key(dataframe_left, dataframe_right, key, diff)
+        label_name = ", ".join(map(str, key))
+
+    samples = []
+    for column in (col for col in left_columns if col in right_column_set and col not in (key or [])):
+        changed_mask = _changed_mask(left[column], right[column])
+        if not (nb_changed := int(changed_mask.sum())):
+            continue
+
+        diff.changed[column] = nb_changed
+        if (nb_missing_samples := max_samples - sum(len(sample) for sample in samples)) > 0:
+            positions = np.flatnonzero(changed_mask)[:nb_missing_samples]
+            samples.append(
+                pd.DataFrame(
+                    {
+                        label_name: row_labels[positions],
+                        "column": column,
+                        "left": left[column].to_numpy()[positions],
+                        "right": right[column].to_numpy()[positions],
+                    }
+                )
+            )
+
+    if samples:
+        diff.samples = pd.concat(samples, ignore_index=True)
+
+    return diff
+
+
+def diff_rows(
+    dataframe_left: pd.DataFrame, dataframe_right: pd.DataFrame, max_samples: int = DEFAULT_MAX_SAMPLES
+) -> FrameDiff:
+    """Compare two dataframes with the same columns as multisets of rows, whatever their order.
+
+    Rows are compared through their hash, in linear time.
+
+    Args:
+        dataframe_left (pd.DataFrame)
+        dataframe_right (pd.DataFrame)
+        max_samples (int, optional): maximum number of unmatched rows reported. Defaults to 10.
+
+    Raises:
+        TypeError: when a value can't be hashed
+
+    Returns:
+        FrameDiff
+    """
+    left_hashes, right_hashes = hash_rows(dataframe_left), hash_rows(dataframe_right)
+    surplus = unmatched_hashes(left_hashes, right_hashes)
+
+    left_only_mask = np.isin(left_hashes, surplus.index[surplus > 0])
+    right_only_mask = np.isin(right_hashes, surplus.index[surplus < 0])
+    samples = pd.concat(
+        [
+            dataframe_left[left_only_mask].head(max_samples).assign(side="left"),
+            dataframe_right[right_only_mask].head(max_samples).assign(side="right"),
+        ],
+        ignore_index=True,
+    ).head(max_samples)
+
+    return FrameDiff(
+        nb_left_rows=len(dataframe_left),
+        nb_right_rows=len(dataframe_right),
+        nb_removed_rows=int(surplus[surplus > 0].sum()),
+        nb_added_rows=int(-surplus[surplus < 0].sum()),
+        samples=samples[["side", *dataframe_left.columns]] if not samples.empty else None,
+    )
+
+
+def hash_rows(data: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(data, index=False).to_numpy()
+
+
+def unmatched_hashes(left_hashes: np.ndarray, right_hashes: np.ndarray) -> pd.Series:
+    """Count, for each row hash, how many more times it appears on the left than on the right."""
+    surplus = pd.Series(left_hashes).value_counts().sub(pd.Series(right_hashes).value_counts(), fill_value=0)
+    return surplus[surplus != 0].astype("int64")
+
+
+def _align_on_position(
+    dataframe_left: pd.DataFrame, dataframe_right: pd.DataFrame, diff: FrameDiff
+) -> tuple[pd.DataFrame, pd.DataFrame, np.ndarray]:
+    nb_common_rows = min(len(dataframe_left), len(dataframe_right))
+    diff.nb_removed_rows = len(dataframe_left) - nb_common_rows
+    diff.nb_added_rows = len(dataframe_right) - nb_common_rows
+
+    return (
+        dataframe_left.iloc[:nb_common_rows],
+        dataframe_right.iloc[:nb_common_rows],
+        np.arange(nb_common_rows),
+    )
+
+
+def _align_on_key(
+    dataframe_left: pd.DataFrame, dataframe_right: pd.DataFrame, key: list[str], diff: FrameDiff
+) -> tuple[pd.DataFrame, pd.DataFrame, np.ndarray]:
+    for side, dataframe in (("left", dataframe_left), ("right", dataframe_right)):
+        if missing_columns := [col for col in key if col not in dataframe.columns]:
+            raise DiffKeyError(f"Key column(s) {', '.join(map(repr, missing_columns))} not found in {side} dataframe")
+
+    left, right = dataframe_left.set_index(key), dataframe_right.set_index(key)
+    for side, dataframe in (("left", left), ("right", right)):
+        if not dataframe.index.is_unique:
+            raise DiffKeyError(f"Key values are not unique in {side} dataframe")
+
+    common_keys = left.index.intersection(right.index, sort=False)
+    diff.nb_removed_rows = len(left) - len(common_keys)
+    diff.nb_added_rows = len(right) - len(common_keys)
+
+    return left.loc[common_keys], right.loc[common_keys], common_keys.to_numpy()
+
+
+def _changed_mask(left: pd.Series, right: pd.Series) -> np.ndarray:
+    left, right = left.reset_index(drop=True), right.reset_index(drop=True)
+    left_missing, right_missing = left.isna().to_numpy(), right.isna().to_numpy()
+    try:
+        equal = left.eq(right).fillna(False).to_numpy(dtype=bool)
+    except (TypeError, ValueError):
+        # copies, as the arrays are read-only views under copy-on-write
+        left_values, right_values = left.to_numpy(dtype=object, copy=True), right.to_numpy(dtype=object, copy=True)
+        left_values[left_missing], right_values[right_missing] = None, None
+        equal = np.array(
+            [_is_equal_cell(left_value, right_value) for left_value, right_value in zip(left_values, right_values)],
+            dtype=bool,
+        )
+
+    return ~(equal | (left_missing & right_missing))
+
+
+def _is_equal_cell(left_value: object, right_value: object) -> bool:
+    try:
+        return bool(left_value == right_value)
+    except (TypeError, ValueError):  # array-like cells compare element-wise
+        return np.array_equal(np.asarray(left_value, dtype=object), np.asarray(right_value, dtype=object))
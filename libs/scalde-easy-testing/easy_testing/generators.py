@@ -0,0 +1,242 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+DISTRIBUTIONS = ("uniform", "normal", "zipf")
+DEFAULT_CHUNK_SIZE = 100_000
+
+_INTEGER_DTYPES = ("int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64")
+_FLOAT_DTYPES = ("float32", "float64")
+_TEXT_DTYPES = ("object", "str", "string", "category")
+_DATETIME_DTYPES = ("datetime64[ns]", "datetime64[us]", "datetime64[ms]", "datetime64[s]")
+
+
+@dataclass
+class ColumnSpec:
+    """Describe how the values of a generated column are drawn.
+
+    Args:
+        dtype (str, optional): integer, float, bool, datetime64, object, string or category dtype. Defaults to "int64".
+        null_ratio (float, optional): share of missing values. Integer and bool columns become nullable. Defaults to 0.
+        cardinality (int, optional): number of distinct values. Required for text dtypes (defaults to 1000) and for
+            columns other columns are correlated with. Defaults to None.
+        distribution (str, optional): "uniform", "normal" or "zipf". Defaults to "uniform".
+        skew (float, optional): exponent of the zipf distribution, greater than 1. Defaults to 1.5.
+        low (float | str, optional): lowest value of numeric and datetime columns. Defaults to 0 or 2020-01-01.
+        high (float | str, optional): highest value of numeric and datetime columns. Defaults to 1000, 1. or 2021-01-01.
+        correlated_with (str, optional): column, declared before this one, this column's value depends on.
+            Defaults to None.
+        correlation (float, optional): share of rows following the correlated column, the others being
+            drawn independently. Defaults to 1.
+    """
+
+    dtype: str = "int64"
+    null_ratio: float = 0.0
+    cardinality: int | None = None
+    distribution: str = "uniform"
+    skew: float = 1.5
+    low: float | str | None = None
+    high: float | str | None = None
+    correlated_with: str | None = None
+    correlation: float = 1.0
+
+
+class DatasetGenerator:
+    """Generate seeded synthetic dataframes of any size from a schema.
+
+    The same seed, schema, number of rows and chunk size always give the same data.
+    """
+
+    def __init__(self, schema: dict[str, ColumnSpec], seed: int = 0) -> None:
+        _check_schema(schema)
+        self.schema = schema
+        self.seed = seed
+
+    def generate(self, nb_rows: int) -> pd.DataFrame:
+        return self._generate_chunk(nb_rows, chunk_index=0)
+
+    def iter_chunks(self, nb_rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        for chunk_index, start in enumerate(range(0, nb_rows, chunk_size)):
+            chunk = self._generate_chunk(min(chunk_size, nb_rows - start), chunk_index)
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            yield chunk
+
+    def to_csv(self, filepath: str | Path, nb_rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE, **to_csv_kwargs) -> None:
+        filepath = Path(filepath)
+        os.makedirs(filepath.parent, exist_ok=True)
+        to_csv_kwargs.setdefault("index", False)
+
+        header, mode = True, "w"
+        for chunk in self.iter_chunks(nb_rows, chunk_size):
+            chunk.to_csv(filepath, mode=mode, header=header, **to_csv_kwargs)
+            header, mode = False, "a"
+        if header:
+            self._generate_chunk(0, 0).to_csv(filepath, **to_csv_kwargs)
+
+    def to_parquet(self, filepath: str | Path, nb_rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        filepath = Path(filepath)
+        os.makedirs(filepath.parent, exist_ok=True)
+
+        writer = None
+        try:
+            for chunk in self.iter_chunks(nb_rows, chunk_size):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(filepath, table.schema)
+                writer.write_table(table)
+            if writer is None:
+                pq.write_table(pa.Table.from_pandas(self._generate_chunk(0, 0), preserve_index=False), filepath)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _generate_chunk(self, nb_rows: int, chunk_index: int) -> pd.DataFrame:
+        rng = np.random.default_rng([self.seed, chunk_index])
+        codes: dict[str, np.ndarray] = {}
+        columns = {}
+        for name, spec in self.schema.items():
+            columns[name] = _generate_column(name, spec, nb_rows, rng, codes)
+
+        return pd.DataFrame(columns, columns=list(self.schema))
+
+
+def _check_schema(schema: dict[str, ColumnSpec]) -> None:
+    declared = set()
+    for name, spec in schema.items():
+        if spec.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution '{spec.distribution}' for column '{name}'")
+        if not 0 <= spec.null_ratio <= 1:
+            raise ValueError(f"Null ratio of column '{name}' must be between 0 and 1")
+        if spec.distribution == "zipf" and spec.skew <= 1:
+            raise ValueError(f"Zipf skew of column '{name}' must be greater than 1")
+        if spec.correlated_with is not None:
+            if spec.correlated_with not in declared:
+                raise ValueError(f"Column '{name}' is correlated with '{spec.correlated_with}' declared after it")
+            if schema[spec.correlated_with].cardinality is None:
+                raise ValueError(f"Column '{spec.correlated_with}' needs a cardinality to be correlated with")
+        declared.add(name)
+
+
+def _generate_column(
+    name: str, spec: ColumnSpec, nb_rows: int, rng: np.random.Generator, codes: dict[str, np.ndarray]
+) -> pd.Series | pd.Categorical | np.ndarray:
+    cardinality = spec.cardinality or (1000 if spec.dtype in _TEXT_DTYPES else None)
+
+    if cardinality is not None:
+        column_codes = _draw_codes(spec, cardinality, nb_rows, rng, codes)
+        codes[name] = column_codes
+        values = _codes_to_values(name, spec, column_codes, cardinality)
+    else:
+        values = _draw_values(spec, nb_rows, rng)
+
+    if spec.null_ratio:
+        return _with_nulls(values, spec, rng.random(nb_rows) < spec.null_ratio)
+    return values
+
+
+def _draw_codes(
+    spec: ColumnSpec, cardinality: int, nb_rows: int, rng: np.random.Generator, codes: dict[str, np.ndarray]
+) -> np.ndarray:
+    if spec.distribution == "zipf":
+        column_codes = (rng.zipf(spec.skew, nb_rows) - 1) % cardinality
+    elif spec.distribution == "normal":
+        column_codes = np.clip(np.rint(rng.normal(cardinality / 2, cardinality / 6, nb_rows)), 0, cardinality - 1)
+    else:
+        column_codes = rng.integers(0, cardinality, nb_rows)
+    column_codes = column_codes.astype("int64")
+
+    if spec.correlated_with is not None:
+        # a fixed multiplicative hash maps each key of the other column to one value of this column
+        followed = (codes[spec.correlated_with] * 2654435761 + 97) % cardinality
+        follows_mask = rng.random(nb_rows) < spec.correlation
+        column_codes = np.where(follows_mask, followed, column_codes)
+
+    return column_codes
+
+
+def _codes_to_values(name: str, spec: ColumnSpec, codes: np.ndarray, cardinality: int) -> pd.Categorical | np.ndarray:
+    if spec.dtype in _TEXT_DTYPES:
+        categories = np.array([f"{name}_{i}" for i in range(cardinality)], dtype=object)
+        if spec.dtype == "category":
+            return pd.Categorical.from_codes(codes, categories=categories)
+        return pd.array(categories[codes], dtype=spec.dtype if spec.dtype != "object" else object)
+
+    if spec.dtype in _DATETIME_DTYPES:
+        low, high = _datetime_bounds(spec)
+        step = (high - low) // max(cardinality - 1, 1)
+        return _to_datetimes(low + codes * step, spec.dtype)
+
+    if spec.dtype == "bool":
+        return codes % 2 == 1
+
+    low = _numeric_bounds(spec)[0]
+    return (low + codes).astype(spec.dtype)
+
+
+def _draw_values(spec: ColumnSpec, nb_rows: int, rng: np.random.Generator) -> np.ndarray:
+    if spec.dtype == "bool":
+        return rng.random(nb_rows) < 0.5
+
+    if spec.dtype in _DATETIME_DTYPES:
+        low, high = _datetime_bounds(spec)
+        offsets = _draw_unit_values(spec, nb_rows, rng) * (high - low)
+        return _to_datetimes(low + offsets.astype("int64"), spec.dtype)
+
+    low, high = _numeric_bounds(spec)
+    values = low + _draw_unit_values(spec, nb_rows, rng) * (high - low)
+    if spec.dtype in _INTEGER_DTYPES:
+        values = np.floor(values)
+    return values.astype(spec.dtype)
+
+
+def _draw_unit_values(spec: ColumnSpec, nb_rows: int, rng: np.random.Generator) -> np.ndarray:
+    """Draw values between 0 and 1 following the column distribution."""
+    if spec.distribution == "normal":
+        return np.clip(rng.normal(0.5, 1 / 6, nb_rows), 0, 1)
+    if spec.distribution == "zipf":
+        return 1 - 1 / rng.zipf(spec.skew, nb_rows)
+    return rng.random(nb_rows)
+
+
+def _numeric_bounds(spec: ColumnSpec) -> tuple[float, float]:
+    if spec.dtype not in _INTEGER_DTYPES + _FLOAT_DTYPES:
+        raise ValueError(f"Unsupported dtype '{spec.dtype}'")
+
+    default_high = 1000 if spec.dtype in _INTEGER_DTYPES else 1.0
+    low = 0 if spec.low is None else spec.low
+    high = default_high if spec.high is None else spec.high
+    return float(low), float(high)
+
+
+def _datetime_bounds(spec: ColumnSpec) -> tuple[int, int]:
+    low = pd.Timestamp(spec.low if spec.low is not None else "2020-01-01")
+    high = pd.Timestamp(spec.high if spec.high is not None else "2021-01-01")
+    return low.value, high.value
+
+
+def _to_datetimes(nanoseconds: np.ndarray, dtype: str) -> np.ndarray:
+    return nanoseconds.astype("int64").view("datetime64[ns]").astype(dtype)
+
+
+def _with_nulls(
+    values: pd.Categorical | np.ndarray, spec: ColumnSpec, null_mask: np.ndarray
+) -> pd.Series | pd.Categorical:
+    if isinstance(values, pd.Categorical):
+        return pd.Categorical.from_codes(np.where(null_mask, -1, values.codes), categories=values.categories)
+
+    series = pd.Series(values)
+    if spec.dtype in _INTEGER_DTYPES:
+        series = series.astype(spec.dtype.capitalize().replace("Uint", "UInt"))
+    elif spec.dtype == "bool":
+        series = series.astype("boolean")
+    return series.mask(null_mask)
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from .dataframes import assert_frame_equal_with_diff, format_columns_as_string
+
+UPDATE_SNAPSHOTS_ENV_VAR = "EASY_TESTING_UPDATE_SNAPSHOTS"
+
+_METADATA_KEY = b"easy_testing"
+_FORMAT_VERSION = 1
+
+
+def assert_frame_matches_snapshot(
+    data: pd.DataFrame, snapshot_path: str | Path, update: bool | None = None, **kwargs
+) -> None:
+    """Compare a dataframe with its golden snapshot, recording it when it doesn't exist yet.
+
+    Snapshots are zstd-compressed parquet files holding the schema and a hash of each column. Only the
+    columns whose hash differs, or which can't be hashed like list columns, are read back and compared
+    value by value. Dtypes are compared with the ones recorded in the snapshot, as parquet may read
+    values back with another dtype. The index is ignored. Requires pyarrow.
+
+    Args:
+        data (pd.DataFrame)
+        snapshot_path (str | Path)
+        update (bool, optional): rewrite the snapshot instead of comparing. Defaults to the
+            EASY_TESTING_UPDATE_SNAPSHOTS environment variable.
+        **kwargs: pd.testing.assert_frame_equal kwargs used to compare differing columns
+
+    Raises:
+        AssertionError: when the dataframe doesn't match the snapshot
+    """
+    snapshot_path = Path(snapshot_path)
+    if update is None:
+        update = os.environ.get(UPDATE_SNAPSHOTS_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+    if update or not snapshot_path.exists():
+        write_snapshot(data, snapshot_path)
+        return
+
+    metadata = read_snapshot_metadata(snapshot_path)
+    expected_columns = [column["name"] for column in metadata["columns"]]
+    if (actual_columns := [str(col) for col in data.columns]) != expected_columns:
+        raise AssertionError(
+            f"Columns are different from snapshot {snapshot_path}. "
+            f"actual ones are {format_columns_as_string(actual_columns)} "
+            f"and snapshot ones are {format_columns_as_string(expected_columns)}"
+        )
+    if len(data) != metadata["nb_rows"]:
+        raise AssertionError(
+            f"Number of rows is different from snapshot {snapshot_path}: "
+            f"actual is {len(data)} and snapshot is {metadata['nb_rows']}"
+        )
+
+    actual_metadata = {column["name"]: column for column in _columns_metadata(data)}
+    differing_columns = [
+        column["name"]
+        for column in metadata["columns"]
+        if column["hash"] is None or actual_metadata[column["name"]] != column
+    ]
+    if not differing_columns:
+        return
+
+    errors = []
+    if kwargs.get("check_dtype", True) and (
+        dtype_changes := [
+            f"{column['name']}: actual {actual_metadata[column['name']]['dtype']}, snapshot {column['dtype']}"
+            for column in metadata["columns"]
+            if actual_metadata[column["name"]]["dtype"] != column["dtype"]
+        ]
+    ):
+        errors.append(f"Column dtypes are different: {', '.join(dtype_changes)}")
+
+    expected = pd.read_parquet(snapshot_path, columns=differing_columns)
+    actual = data.set_axis(actual_columns, axis=1)[differing_columns].reset_index(drop=True)
+    try:
+        assert_frame_equal_with_diff(actual, expected, **(kwargs | {"check_dtype": False}))
+    except AssertionError as e:
+        errors.append(str(e))
+
+    if errors:
+        raise AssertionError(f"Dataframe doesn't match snapshot {snapshot_path}: " + "\n\n".join(errors))
+
+
+def write_snapshot(data: pd.DataFrame, snapshot_path: str | Path) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    data = data.set_axis([str(col) for col in data.columns], axis=1)
+    metadata = {"version": _FORMAT_VERSION, "nb_rows": len(data), "columns": _columns_metadata(data)}
+
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    table = table.replace_schema_metadata(table.schema.metadata | {_METADATA_KEY: json.dumps(metadata).encode()})
+
+    snapshot_path = Path(snapshot_path)
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, snapshot_path, compression="zstd")
+
+
+def read_snapshot_metadata(snapshot_path: str | Path) -> dict:
+    import pyarrow.parquet as pq
+
+    schema_metadata = pq.read_schema(snapshot_path).metadata or {}
+    if _METADATA_KEY not in schema_metadata:
+        raise ValueError(f"{snapshot_path} is not an easy_testing snapshot")
+
+    return json.loads(schema_metadata[_METADATA_KEY])
+
+
+def _columns_metadata(data: pd.DataFrame) -> list[dict]:
+    return [
+        {"name": str(column), "dtype": str(data[column].dtype), "hash": _hash_column(data[column])}
+        for column in data.columns
+    ]
+
+
+def _hash_column(column: pd.Series) -> str | None:
+    try:
+        hashes = pd.util.hash_pandas_object(column, index=False)
+    except TypeError:  # unhashable cells, like lists, the column is always compared in full
+        return None
+    return hashlib.sha256(hashes.to_numpy().tobytes()).hexdigest()
@@ -0,0 +1,247 @@
+import itertools
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from .dataframes import format_columns_as_string
+from .diffs import DEFAULT_MAX_SAMPLES, FrameDiff, diff_frames, hash_rows, unmatched_hashes
+
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_NB_BUCKETS = 64
+
+_PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def assert_files_equal(
+    filepath_left: str | Path,
+    filepath_right: str | Path,
+    check_row_order: bool = True,
+    check_columns_order: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **read_csv_kwargs,
+) -> None:
+    """Compare two CSV or Parquet files chunk by chunk, without loading them in memory.
+
+    Values are compared, not dtypes, since CSV dtypes are inferred per chunk.
+
+    Args:
+        filepath_left (str | Path)
+        filepath_right (str | Path)
+        check_row_order (bool, optional): Defaults to True.
+        check_columns_order (bool, optional): Defaults to True.
+        chunk_size (int, optional): number of rows read at once from each file. Defaults to 100000.
+        **read_csv_kwargs: pd.read_csv kwargs used for CSV files
+
+    Raises:
+        AssertionError: when files are not equals, with a summary of the differences
+    """
+    left_columns = _read_columns(filepath_left, **read_csv_kwargs)
+    right_columns = _read_columns(filepath_right, **read_csv_kwargs)
+    if sorted(left_columns) != sorted(right_columns) or (check_columns_order and left_columns != right_columns):
+        raise AssertionError(
+            f"Columns are different. "
+            f"left ones are {format_columns_as_string(left_columns)} "
+            f"and right ones are {format_columns_as_string(right_columns)}"
+        )
+
+    diff = diff_files(filepath_left, filepath_right, check_row_order, chunk_size, **read_csv_kwargs)
+    if not diff.is_empty():
+        raise AssertionError(diff.render())
+
+
+def diff_files(
+    filepath_left: str | Path,
+    filepath_right: str | Path,
+    check_row_order: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    nb_buckets: int = DEFAULT_NB_BUCKETS,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    **read_csv_kwargs,
+) -> FrameDiff:
+    """Compute the differences between two CSV or Parquet files with a bounded memory use.
+
+    With row order, chunks at the same position are compared. Without it, row hashes are spilled
+    to disk in buckets which are compared one at a time, then the files are read again to sample
+    unmatched rows. Integers are compared as floats in that case, since a CSV chunk with missing values
+    infers floats where another one infers integers.
+
+    Args:
+        filepath_left (str | Path)
+        filepath_right (str | Path)
+        check_row_order (bool, optional): Defaults to True.
+        chunk_size (int, optional): number of rows read at once from each file. Defaults to 100000.
+        nb_buckets (int, optional): number of hash buckets without row order. Defaults to 64.
+        max_samples (int, optional): maximum number of differences reported. Defaults to 10.
+        **read_csv_kwargs: pd.read_csv kwargs used for CSV files
+
+    Raises:
+        ValueError: when chunk_size or nb_buckets is not positive
+
+    Returns:
+        FrameDiff
+    """
+    if chunk_size <= 0 or nb_buckets <= 0:
+        raise ValueError("Chunk size and number of buckets must be positive")
+
+    left_columns = _read_columns(filepath_left, **read_csv_kwargs)
+    right_columns = _read_columns(filepath_right, **read_csv_kwargs)
+    right_column_set, left_column_set = set(right_columns), set(left_columns)
+    diff = FrameDiff(
+        nb_left_rows=0,
+        nb_right_rows=0,
+        left_only_columns=[col for col in left_columns if col not in right_column_set],
+        right_only_columns=[col for col in right_columns if col not in left_column_set],
+    )
+    common_columns = [col for col in left_columns if col in right_column_set]
+
+    def read(filepath: str | Path) -> Iterator[pd.DataFrame]:
+        for chunk in _iter_chunks(filepath, chunk_size, **read_csv_kwargs):
+            yield chunk[common_columns]
+
+    if check_row_order:
+        _diff_aligned_chunks(read(filepath_left), read(filepath_right), chunk_size, max_samples, diff)
+    else:
+        _diff_hash_buckets(lambda: read(filepath_left), lambda: read(filepath_right), nb_buckets, max_samples, diff)
+
+    return diff
+
+
+def _diff_aligned_chunks(
+    left_chunks: Iterator[pd.DataFrame],
+    right_chunks: Iterator[pd.DataFrame],
+    chunk_size: int,
+    max_samples: int,
+    diff: FrameDiff,
+) -> None:
+    samples = []
+    for left, right in itertools.zip_longest(_rechunk(left_chunks, chunk_size), _rechunk(right_chunks, chunk_size)):
+        if left is None or right is None:
+            diff.nb_removed_rows += len(left) if left is not None else 0
+            diff.nb_added_rows += len(right) if right is not None else 0
+            diff.nb_left_rows += len(left) if left is not None else 0
+            diff.nb_right_rows += len(right) if right is not None else 0
+            continue
+
+        nb_missing_samples = max_samples - sum(len(sample) for sample in samples)
+        chunk_diff = diff_frames(
+            left.reset_index(drop=True), right.reset_index(drop=True), max_samples=max(nb_missing_samples, 0)
+        )
+        for column, nb_changed in chunk_diff.changed.items():
+            diff.changed[column] = diff.changed.get(column, 0) + nb_changed
+        if chunk_diff.samples is not None:
+            samples.append(chunk_diff.samples.assign(row=chunk_diff.samples["row"] + diff.nb_left_rows))
+
+        diff.nb_removed_rows += chunk_diff.nb_removed_rows
+        diff.nb_added_rows += chunk_diff.nb_added_rows
+        diff.nb_left_rows += len(left)
+        diff.nb_right_rows += len(right)
+
+    if samples:
+        diff.samples = pd.concat(samples, ignore_index=True)
+
+
+def _diff_hash_buckets(read_left, read_right, nb_buckets: int, max_samples: int, diff: FrameDiff) -> None:
+    with tempfile.TemporaryDirectory(prefix="easy_testing_") as directory:
+        diff.nb_left_rows = _spill_hashes(read_left(), Path(directory) / "left", nb_buckets)
+        diff.nb_right_rows = _spill_hashes(read_right(), Path(directory) / "right", nb_buckets)
+
+        left_only_hashes, right_only_hashes = [], []
+        for bucket in range(nb_buckets):
+            surplus = unmatched_hashes(
+                np.fromfile(Path(directory) / "left" / f"{bucket}.bin", dtype="uint64"),
+                np.fromfile(Path(directory) / "right" / f"{bucket}.bin", dtype="uint64"),
+            )
+            diff.nb_removed_rows += int(surplus[surplus > 0].sum())
+            diff.nb_added_rows += int(-surplus[surplus < 0].sum())
+            left_only_hashes.extend(surplus.index[surplus > 0][: max_samples - len(left_only_hashes)])
+            right_only_hashes.extend(surplus.index[surplus < 0][: max_samples - len(right_only_hashes)])
+
+    samples = [
+        rows.assign(side=side)
+        for side, read, hashes in (("left", read_left, left_only_hashes), ("right", read_right, right_only_hashes))
+        if hashes
+        for rows in _collect_rows(read(), np.array(hashes, dtype="uint64"), max_samples)
+    ]
+    if samples:
+        samples = pd.concat(samples, ignore_index=True).head(max_samples)
+        diff.samples = samples[["side", *samples.columns.drop("side")]]
+
+
+def _spill_hashes(chunks: Iterator[pd.DataFrame], directory: Path, nb_buckets: int) -> int:
+    directory.mkdir()
+    files = [open(directory / f"{bucket}.bin", "wb") for bucket in range(nb_buckets)]
+    nb_rows = 0
+    try:
+        for chunk in chunks:
+            hashes = hash_rows(_normalize(chunk))
+            buckets = (hashes % nb_buckets).astype("int64")
+            order = np.argsort(buckets, kind="stable")
+            bounds = np.cumsum(np.bincount(buckets, minlength=nb_buckets))[:-1]
+            for file, bucket_hashes in zip(files, np.split(hashes[order], bounds)):
+                bucket_hashes.tofile(file)
+            nb_rows += len(chunk)
+    finally:
+        for file in files:
+            file.close()
+
+    return nb_rows
+
+
+def _collect_rows(chunks: Iterator[pd.DataFrame], hashes: np.ndarray, max_rows: int) -> list[pd.DataFrame]:
+    rows, nb_rows = [], 0
+    for chunk in chunks:
+        if nb_rows >= max_rows:
+            break
+        matching = chunk[np.isin(hash_rows(_normalize(chunk)), hashes)].head(max_rows - nb_rows)
+        rows.append(matching)
+        nb_rows += len(matching)
+
+    return rows
+
+
+def _normalize(chunk: pd.DataFrame) -> pd.DataFrame:
+    integer_columns = [
+        col
+        for col, dtype in chunk.dtypes.items()
+        if pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_extension_array_dtype(dtype)
+    ]
+    return chunk.astype(dict.fromkeys(integer_columns, "float64")) if integer_columns else chunk
+
+
+def _rechunk(chunks: Iterator[pd.DataFrame], chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Yield chunks of exactly chunk_size rows, but the last one."""
+    buffer: list[pd.DataFrame] = []
+    nb_buffered = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        nb_buffered += len(chunk)
+        while nb_buffered >= chunk_size:
+            data = pd.concat(buffer) if len(buffer) > 1 else buffer[0]
+            yield data.iloc[:chunk_size]
+            buffer = [data.iloc[chunk_size:]]
+            nb_buffered -= chunk_size
+
+    if nb_buffered:
+        yield pd.concat(buffer) if len(buffer) > 1 else buffer[0]
+
+
+def _iter_chunks(filepath: str | Path, chunk_size: int, **read_csv_kwargs) -> Iterator[pd.DataFrame]:
+    if Path(filepath).suffix in _PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(filepath).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(filepath, chunksize=chunk_size, **read_csv_kwargs)
+
+
+def _read_columns(filepath: str | Path, **read_csv_kwargs) -> list[str]:
+    if Path(filepath).suffix in _PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+
+        # goes through pandas so that stored index columns are left out
+        return list(pq.read_schema(filepath).empty_table().to_pandas().columns)
+    return list(pd.read_csv(filepath, nrows=0, **read_csv_kwargs).columns)
@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .dataframes import assert_frame_equal_with_diff, format_columns_as_string
+
+DEFAULT_RTOL = 1e-5
+DEFAULT_ATOL = 1e-8
+
+
+@dataclass(frozen=True)
+class Tolerance:
+    """Values are close when |left - right| <= atol + rtol * |right|, like numpy.isclose."""
+
+    rtol: float = DEFAULT_RTOL
+    atol: float = DEFAULT_ATOL
+
+
+def assert_frame_almost_equals(
+    dataframe_left: pd.DataFrame,
+    dataframe_right: pd.DataFrame,
+    rtol: float = DEFAULT_RTOL,
+    atol: float = DEFAULT_ATOL,
+    tolerances: dict[str, Tolerance] | None = None,
+    check_dtype: bool = True,
+) -> None:
+    """Compare two dataframes, float columns being compared all at once within tolerances.
+
+    NaN values only match NaN values, infinite values only match the same infinite values.
+    Other columns, integer and boolean ones included, are compared exactly.
+
+    Args:
+        dataframe_left (pd.DataFrame)
+        dataframe_right (pd.DataFrame)
+        rtol (float, optional): relative tolerance. Defaults to 1e-5.
+        atol (float, optional): absolute tolerance. Defaults to 1e-8.
+        tolerances (dict[str, Tolerance], optional): tolerances of specific columns. Defaults to None.
+        check_dtype (bool, optional): Defaults to True.
+
+    Raises:
+        ValueError: when tolerances are given for columns which are not float
+        AssertionError: when dataframes are not equals, with the deviations of the columns out of tolerance
+    """
+    if list(dataframe_left.columns) != list(dataframe_right.columns):
+        raise AssertionError(
+            f"Columns are different. "
+            f"left ones are {format_columns_as_string(dataframe_left.columns)} "
+            f"and right ones are {format_columns_as_string(dataframe_right.columns)}"
+        )
+    if len(dataframe_left) != len(dataframe_right):
+        raise AssertionError(
+            f"Number of rows is different: left is {len(dataframe_left)} and right is {len(dataframe_right)}"
+        )
+    pd.testing.assert_index_equal(dataframe_left.index, dataframe_right.index)
+
+    float_columns = _float_columns(dataframe_left, dataframe_right)
+    if unknown_columns := [col for col in tolerances or {} if col not in float_columns]:
+        raise ValueError(f"Tolerances given for non float column(s) {format_columns_as_string(unknown_columns)}")
+    if check_dtype:
+        if dtype_mismatches := [
+            f"{col} ({dataframe_left[col].dtype} != {dataframe_right[col].dtype})"
+            for col in dataframe_left.columns
+            if dataframe_left[col].dtype != dataframe_right[col].dtype
+        ]:
+            raise AssertionError(f"Dtypes are different for column(s) {', '.join(dtype_mismatches)}")
+
+    float_column_set = set(float_columns)
+    if other_columns := [col for col in dataframe_left.columns if col not in float_column_set]:
+        assert_frame_equal_with_diff(
+            dataframe_left[other_columns], dataframe_right[other_columns], check_dtype=check_dtype
+        )
+
+    if not float_columns:
+        return
+
+    summary = deviation_summary(dataframe_left[float_columns], dataframe_right[float_columns], rtol, atol, tolerances)
+    if not (failures := summary[summary["nb_mismatches"] > 0]).empty:
+        raise AssertionError(
+            f"Values are different in {len(failures)} column(s) out of tolerance\n\n{failures.to_string()}"
+        )
+
+
+def deviation_summary(
+    dataframe_left: pd.DataFrame,
+    dataframe_right: pd.DataFrame,
+    rtol: float = DEFAULT_RTOL,
+    atol: float = DEFAULT_ATOL,
+    tolerances: dict[str, Tolerance] | None = None,
+) -> pd.DataFrame:
+    """Summarize, per float column, how far left values are from right values.
+
+    Columns are aligned on name and rows on position. Deviations are absolute and ignore
+    the rows where any side is missing or infinite.
+
+    Returns:
+        pd.DataFrame: indexed by column with max_deviation, mean_deviation, nb_mismatches
+            and nb_nan_mismatches
+    """
+    columns = _float_columns(dataframe_left, dataframe_right)
+    tolerances = tolerances or {}
+    rtols = np.array([tolerances.get(col, Tolerance(rtol, atol)).rtol for col in columns])
+    atols = np.array([tolerances.get(col, Tolerance(rtol, atol)).atol for col in columns])
+
+    left, right = _to_float_block(dataframe_left[columns]), _to_float_block(dataframe_right[columns])
+    left_nan, right_nan = np.isnan(left), np.isnan(right)
+    comparable = ~(left_nan | right_nan)
+
+    finite = np.isfinite(left) & np.isfinite(right)
+    with np.errstate(invalid="ignore", over="ignore"):
+        deviations = np.abs(left - right)
+        within_tolerance = np.where(finite, deviations <= atols + rtols * np.abs(right), left == right)
+    deviations = np.where(finite & np.isfinite(deviations), deviations, 0.0)
+
+    nb_finite = finite.sum(axis=0)
+    nb_nan_mismatches = (left_nan != right_nan).sum(axis=0)
+    return pd.DataFrame(
+        {
+            "max_deviation": deviations.max(axis=0, initial=0.0),
+            "mean_deviation": np.divide(
+                deviations.sum(axis=0), nb_finite, out=np.zeros(len(columns)), where=nb_finite > 0
+            ),
+            "nb_mismatches": (comparable & ~within_tolerance).sum(axis=0) + nb_nan_mismatches,
+            "nb_nan_mismatches": nb_nan_mismatches,
+        },
+        index=pd.Index(columns, name="column"),
+    )
+
+
+def _float_columns(dataframe_left: pd.DataFrame, dataframe_right: pd.DataFrame) -> list:
+    # integers are compared exactly: as floats, large ones would lose precision and small gaps would pass rtol
+    return [
+        col
+        for col in dataframe_left.columns
+        if col in dataframe_right.columns
+        and pd.api.types.is_float_dtype(dataframe_left[col].dtype)
+        and pd.api.types.is_float_dtype(dataframe_right[col].dtype)
+    ]
+
+
+def _to_float_block(data: pd.DataFrame) -> np.ndarray:
+    # a single 2D array, so every float column is compared in one vectorized pass
+    return data.to_numpy(dtype="float64", na_value=np.nan).reshape(len(data), len(data.columns))
@@ -1,3 +1,9 @@
+import itertools
+import re
+
+import numpy as np
+import pytest
+
 from easy_testing.builders import DataFrameBuilder
 
 
@@ -39,3 +45,81 @@ class TestDataFrameBuilder:
         df = DataFrameBuilder.a_dataframe().with_columns(["a", "b"]).with_row(b=2, a=1).build()
         assert df.values.tolist() == [[1, 2]]
         assert df.shape == (1, 2)
+
+    def test_should_build_dataframe_from_rows_iterable(self):
+        df = DataFrameBuilder.a_dataframe().with_columns(["a", "b"]).with_rows([(1, 2), (3, 4)]).build()
+        assert df.values.tolist() == [[1, 2], [3, 4]]
+
+    def test_should_build_dataframe_from_numpy_rows_with_dtypes(self):
+        df = (
+            DataFrameBuilder.a_dataframe()
+            .with_columns(["a", "b"])
+            .with_rows(np.array([[1, 2], [3, 4]]))
+            .with_dtypes(b="float64")
+            .build()
+        )
+        assert df.values.tolist() == [[1, 2], [3, 4]]
+        assert df.dtypes.tolist() == ["int64", "float64"]
+
+    def test_should_keep_rows_order_when_mixing_row_apis(self):
+        df = (
+            DataFrameBuilder.a_dataframe()
+            .with_columns(["a", "b"])
+            .with_row((1, 2))
+            .with_rows(np.array([[3, 4]]))
+            .with_row(a=5, b=6)
+            .build()
+        )
+        assert df.values.tolist() == [[1, 2], [3, 4], [5, 6]]
+        assert df.index.tolist() == [0, 1, 2]
+
+    def test_should_build_dataframe_from_columns_values(self):
+        df = DataFrameBuilder.a_dataframe().with_column("a", range(3)).with_column("b", ["x", "y", "z"]).build()
+        assert df.columns.tolist() == ["a", "b"]
+        assert df.values.tolist() == [[0, "x"], [1, "y"], [2, "z"]]
+
+    def test_should_raise_when_columns_values_are_missing(self):
+        builder = DataFrameBuilder.a_dataframe().with_columns(["a", "b", "c"]).with_column("a", [1])
+        with pytest.raises(ValueError, match=re.escape("Missing values for column(s) 'b', 'c'")):
+            builder.build()
+
+    def test_should_cast_dtypes_once_rows_of_all_apis_are_concatenated(self):
+        df = (
+            DataFrameBuilder.a_dataframe()
+            .with_columns(["a", "b"])
+            .with_row((1, "x"))
+            .with_generated_rows(2, a=np.arange, b=["y", "x"])
+            .with_row((3, "z"))
+            .with_dtypes(a="int16", b="category")
+            .build()
+        )
+        assert df.dtypes.tolist() == ["int16", "category"]
+        assert df["b"].cat.categories.tolist() == ["x", "y", "z"]
+        assert df.values.tolist() == [[1, "x"], [0, "y"], [1, "x"], [3, "z"]]
+
+    def test_should_raise_when_mixing_columns_values_and_rows(self):
+        builder = DataFrameBuilder.a_dataframe().with_column("a", [1]).with_row((2,))
+        with pytest.raises(ValueError, match=re.escape("Columns values can't be mixed with rows")):
+            builder.build()
+
+    def test_should_build_dataframe_with_generated_rows(self):
+        df = (
+            DataFrameBuilder.a_dataframe()
+            .with_columns(["a", "b"])
+            .with_generated_rows(3, a=np.arange, b=itertools.cycle(["x", "y"]))
+            .with_dtypes(a="int32", b="category")
+            .build()
+        )
+        assert df.values.tolist() == [[0, "x"], [1, "y"], [2, "x"]]
+        assert df.dtypes.tolist() == ["int32", "category"]
+
+    def test_should_raise_when_generator_is_missing(self):
+        with pytest.raises(ValueError, match=re.escape("Missing generator for column(s) 'b'")):
+            DataFrameBuilder.a_dataframe().with_columns(["a", "b"]).with_generated_rows(3, a=np.arange)
+
+    def test_should_change_fingerprint_when_inputs_change(self):
+        builder = DataFrameBuilder.a_dataframe().with_columns(["a", "b"]).with_row((1, 2))
+        fingerprint = builder.fingerprint()
+
+        assert DataFrameBuilder.a_dataframe().with_columns(["a", "b"]).with_row((1, 2)).fingerprint() == fingerprint
+        assert builder.with_dtypes(a="float64").fingerprint() != fingerprint
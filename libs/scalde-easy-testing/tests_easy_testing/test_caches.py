@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from easy_testing.builders import DataFrameBuilder
+from easy_testing.caches import FrameCache
+from easy_testing.dataframes import assert_frame_equals
+
+pytest.importorskip("pyarrow")
+
+
+class TestFrameCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return FrameCache(tmp_path / "cache")
+
+    @pytest.fixture
+    def df(self):
+        return (
+            DataFrameBuilder()
+            .with_columns(["name", "age"])
+            .with_row(("toto", 12))
+            .with_row(("lolo", 13))
+            .with_dtypes(age="float64")
+            .build()
+        )
+
+    def test_should_build_once_and_read_from_cache_afterwards(self, cache, df):
+        # Given
+        build = MagicMock(return_value=df)
+
+        # When
+        first = cache.get_or_build("my_frame", build)
+        second = cache.get_or_build("my_frame", build)
+
+        # Then
+        assert build.call_count == 1
+        assert_frame_equals(first, df)
+        assert_frame_equals(second, df)
+
+    def test_should_share_entries_between_cache_instances(self, cache, df):
+        # Given
+        cache.get_or_build("my_frame", lambda: df)
+        build = MagicMock(return_value=df)
+
+        # When
+        res = FrameCache(cache.directory).get_or_build("my_frame", build)
+
+        # Then
+        build.assert_not_called()
+        assert_frame_equals(res, df)
+
+    def test_should_key_builder_entries_on_builder_inputs(self, cache):
+        # Given
+        builder = DataFrameBuilder().with_columns(["a"]).with_row((1,))
+
+        # When
+        first = cache.from_builder(builder)
+        second = cache.from_builder(builder.with_row((2,)))
+
+        # Then
+        assert first["a"].tolist() == [1]
+        assert second["a"].tolist() == [1, 2]
+
+    def test_should_invalidate_csv_entry_when_file_changes(self, cache, tmp_path, df):
+        # Given
+        filepath = tmp_path / "data.csv"
+        df.to_csv(filepath, index=False)
+        cache.from_csv(filepath)
+
+        # When
+        pd.DataFrame({"name": ["tata"], "age": [45.0]}).to_csv(filepath, index=False)
+        res = cache.from_csv(filepath)
+
+        # Then
+        assert res.to_dict("records") == [{"name": "tata", "age": 45.0}]
+        assert len(list(cache.directory.glob("*.arrow"))) == 1
+
+    def test_should_keep_csv_entries_read_with_other_arguments(self, cache, tmp_path, df):
+        # Given
+        filepath = tmp_path / "data.csv"
+        df.to_csv(filepath, index=False)
+        cache.from_csv(filepath)
+
+        # When
+        res = cache.from_csv(filepath, usecols=["name"])
+
+        # Then
+        assert res.columns.tolist() == ["name"]
+        assert len(list(cache.directory.glob("*.arrow"))) == 2
+
+    def test_should_return_built_frame_when_it_cant_be_stored(self, cache):
+        # Given
+        df = pd.DataFrame({"mixed": [1, "a"]})
+
+        # When
+        with pytest.warns(UserWarning, match="Dataframe can't be cached"):
+            res = cache.get_or_build("mixed", lambda: df)
+
+        # Then
+        assert res is df
@@ -1,5 +1,6 @@
 import re
-from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
@@ -7,6 +8,7 @@ import pytest
 from easy_testing.builders import DataFrameBuilder
 from easy_testing.dataframes import (
     AssertFrame,
+    assert_any_call_with_frame,
     assert_called_once_with_frame,
     assert_contains_line,
     assert_contains_lines,
@@ -190,6 +192,84 @@ class TestAssertCalledOnceWithFrame:
             assert_called_once_with_frame(mock.my_method, 1, x=df, y=1, z=2)
 
 
+class TestAssertAnyCallWithFrame:
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame(
+            [
+                ("toto", 12, "developer"),
+                ("lolo", 13, "photograph"),
+            ],
+            columns=["name", "age", "job"],
+        )
+
+    def test_should_find_matching_call_among_all_calls(self, df):
+        # Given
+        mock = MagicMock()
+
+        # When
+        mock.my_method(df.head(1), "titi")
+        mock.my_method(df.copy(), "toto")
+        mock.my_method(df[["name"]], "toto")
+
+        # Then
+        assert_any_call_with_frame(mock.my_method, df, "toto")
+        assert_any_call_with_frame(mock.my_method, AssertFrame(df.iloc[::-1], check_row_order=False), "toto")
+
+    def test_should_not_compare_values_of_calls_with_other_shapes(self, df):
+        # Given
+        mock = MagicMock()
+        mock.my_method(data=df.head(1))
+        mock.my_method(data=df[["name", "age"]])
+
+        # When
+        with patch("easy_testing.dataframes.assert_frame_equals") as assert_frame_equals:
+            with pytest.raises(AssertionError):
+                assert_any_call_with_frame(mock.my_method, data=df)
+
+        # Then
+        assert_frame_equals.assert_not_called()
+
+    def test_should_not_compare_values_of_the_same_dataframe(self, df):
+        # Given
+        mock = MagicMock()
+        mock.my_method(df)
+
+        # When
+        with patch("easy_testing.dataframes.assert_frame_equals") as assert_frame_equals:
+            assert_any_call_with_frame(mock.my_method, df)
+
+        # Then
+        assert_frame_equals.assert_not_called()
+
+    def test_should_raise_assertion_error_with_reason_of_each_call(self, df):
+        # Given
+        mock = MagicMock()
+
+        # When
+        mock.my_method(df.head(1))
+        mock.my_method(df.assign(age=[12, 14]))
+        mock.my_method("toto")
+
+        # Then
+        with pytest.raises(AssertionError) as e:
+            assert_any_call_with_frame(mock.my_method, df)
+        assert str(e.value).splitlines() == [
+            "No call matches the expected arguments",
+            "  call 0: Expected a dataframe of shape (2, 3) but got (1, 3)",
+            '  call 1: DataFrame.iloc[:, 1] (column name="age") are different',
+            "  call 2: Expected a dataframe but got str",
+        ]
+
+    def test_should_raise_assertion_error_when_mock_not_called(self, df):
+        # Given
+        mock = MagicMock()
+
+        # When & Then
+        with pytest.raises(AssertionError, match="Expected to be called but was never called"):
+            assert_any_call_with_frame(mock.my_method, df)
+
+
 class TestAssertContainsLine:
     def test_should_return_none_when_given_line_is_present(self):
         # Given
@@ -334,6 +414,53 @@ class TestAssertContainsLines:
         ):
             assert_contains_lines(df, [("tata", 45, "seller"), ("joe", 34, "driver")])
 
+    def test_should_report_missing_lines_in_expected_order_when_duplicates_and_mixed_types(self):
+        # Given
+        df = pd.DataFrame(
+            [
+                ("toto", 12, "developer"),
+                ("toto", 12, "developer"),
+                ("lolo", 13.0, "photograph"),
+            ],
+            columns=["name", "age", "job"],
+        )
+
+        # When & Then
+        with pytest.raises(
+            AssertionError,
+            match=re.escape(
+                "Expected lines <name=joe, age=34, job=driver>, <name=lolo, age=14, job=photograph> "
+                "not found in dataframe"
+            ),
+        ):
+            assert_contains_lines(
+                df,
+                [
+                    ("joe", 34, "driver"),
+                    ("lolo", 13, "photograph"),
+                    ("lolo", 14, "photograph"),
+                    ("toto", 12, "developer"),
+                ],
+            )
+
+    def test_should_not_match_lines_with_missing_values(self):
+        # Given
+        df = pd.DataFrame([("toto", None)], columns=["name", "job"])
+
+        # When & Then
+        with pytest.raises(
+            AssertionError, match=re.escape("Expected line <name=toto, job=None> not found in dataframe")
+        ):
+            assert_contains_lines(df, [("toto", None)])
+
+    def test_should_raise_value_error_when_line_size_mismatch(self):
+        # Given
+        df = pd.DataFrame([("toto", 12)], columns=["name", "age"])
+
+        # When & Then
+        with pytest.raises(ValueError, match=re.escape("Line size mismatch: expected 2, got 3")):
+            assert_contains_lines(df, [("toto", 12), ("toto", 12, "developer")])
+
 
 class TestAssertPartialFrameEquals:
     def test_should_assert_2_df_are_equals_for_given_columns(self):
@@ -536,6 +663,16 @@ class TestAssertPartialFrameEquals:
         # When & Then
         assert_frame_partially_equals(df1, df2, ["name", "age"])
 
+    def test_should_compare_given_columns_with_workers(self):
+        # Given
+        df1 = pd.DataFrame({f"col_{i}": range(i, i + 50) for i in range(10)})
+        df2 = df1.assign(col_9=0)
+
+        # When & Then
+        assert_frame_partially_equals(df1, df2, [f"col_{i}" for i in range(9)], workers=3)
+        with pytest.raises(AssertionError, match="col_9"):
+            assert_frame_partially_equals(df1, df2, [f"col_{i}" for i in range(10)], workers=3)
+
 
 class TestAssertFrameEquals:
     def test_should_assert_2_df_are_equals(self):
@@ -627,6 +764,14 @@ class TestAssertFrameEquals:
         # When & Then
         assert_frame_equals(df1, df2, check_row_order=False)
 
+    def test_should_align_rows_sharing_a_hash_by_their_values(self):
+        # Given
+        df1 = DataFrameBuilder().with_columns(["id", "name"]).with_row((1, "toto")).with_row(("1", "toto")).build()
+        df2 = DataFrameBuilder().with_columns(["id", "name"]).with_row(("1", "toto")).with_row((1, "toto")).build()
+
+        # When & Then
+        assert_frame_equals(df1, df2, check_row_order=False)
+
     def test_should_raise_when_df_columns_are_different(self):
         # Given
         df1 = (
@@ -739,3 +884,45 @@ class TestAssertFrameEquals:
             AssertionError,
         ):
             assert_frame_equals(df1, df2, check_columns_order=True)
+
+    @pytest.mark.parametrize("check_row_order", [True, False])
+    def test_should_compare_column_groups_with_workers(self, check_row_order):
+        # Given
+        df1 = pd.DataFrame({f"col_{i}": range(i, i + 50) for i in range(20)})
+        df2 = df1.copy()
+
+        # When & Then
+        assert_frame_equals(df1, df2, check_row_order=check_row_order, workers=4)
+        with ThreadPoolExecutor(2) as executor:
+            assert_frame_equals(df1, df2, check_row_order=check_row_order, workers=executor)
+
+    def test_should_raise_same_message_with_workers(self):
+        # Given
+        df1 = pd.DataFrame({f"col_{i}": range(i, i + 50) for i in range(20)})
+        df2 = df1.assign(col_13=df1["col_13"] + 1, col_17=df1["col_17"].astype("float64"))
+
+        with pytest.raises(AssertionError) as sequential:
+            assert_frame_equals(df1, df2)
+
+        # When
+        with pytest.raises(AssertionError) as parallel:
+            assert_frame_equals(df1, df2, workers=4)
+
+        # Then
+        assert str(parallel.value) == str(sequential.value)
+
+    def test_should_raise_same_message_on_index_difference_with_workers(self):
+        # Given
+        df1 = pd.DataFrame({f"col_{i}": range(i, i + 50) for i in range(20)}, index=range(100, 150))
+        df2 = df1.set_axis(range(50), axis=0)
+
+        with pytest.raises(AssertionError) as sequential:
+            assert_frame_equals(df1, df2)
+
+        # When
+        with pytest.raises(AssertionError) as parallel:
+            assert_frame_equals(df1, df2, workers=2)
+
+        # Then
+        assert "index" in str(parallel.value)
+        assert str(parallel.value) == str(sequential.value)
@@ -0,0 +1,191 @@
+import re
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from easy_testing.builders import DataFrameBuilder
+from easy_testing.dataframes import assert_frame_equals
+from easy_testing.diffs import DiffKeyError, diff_frames, diff_rows
+
+
+class TestDiffFrames:
+    def test_should_return_empty_diff_when_frames_are_equal(self):
+        # Given
+        df = DataFrameBuilder().with_columns(["name", "age"]).with_row(("toto", 12)).build()
+
+        # When
+        diff = diff_frames(df, df.copy())
+
+        # Then
+        assert diff.is_empty()
+        assert diff.render() == "No difference found in values"
+
+    def test_should_count_changed_values_per_column_on_position(self):
+        # Given
+        df1 = pd.DataFrame({"name": ["toto", "lolo", "tata"], "age": [12, 13, 14]})
+        df2 = pd.DataFrame({"name": ["toto", "lili", "tutu"], "age": [12, 13, 15]})
+
+        # When
+        diff = diff_frames(df1, df2)
+
+        # Then
+        assert diff.changed == {"name": 2, "age": 1}
+        assert diff.nb_added_rows == 0
+        assert diff.nb_removed_rows == 0
+        assert diff.samples.to_dict("records") == [
+            {"row": 1, "column": "name", "left": "lolo", "right": "lili"},
+            {"row": 2, "column": "name", "left": "tata", "right": "tutu"},
+            {"row": 2, "column": "age", "left": 14, "right": 15},
+        ]
+
+    def test_should_count_added_and_removed_rows_when_aligned_on_key(self):
+        # Given
+        df1 = pd.DataFrame({"id": [1, 2, 3], "job": ["cop", "doctor", "driver"]})
+        df2 = pd.DataFrame({"id": [4, 3, 2], "job": ["seller", "driver", "nurse"]})
+
+        # When
+        diff = diff_frames(df1, df2, key="id")
+
+        # Then
+        assert diff.nb_removed_rows == 1
+        assert diff.nb_added_rows == 1
+        assert diff.changed == {"job": 1}
+        assert diff.samples.to_dict("records") == [{"id": 2, "column": "job", "left": "doctor", "right": "nurse"}]
+
+    def test_should_consider_missing_values_on_both_sides_as_equal(self):
+        # Given
+        df1 = pd.DataFrame({"value": [1.0, None, None]})
+        df2 = pd.DataFrame({"value": [1.0, None, 3.0]})
+
+        # When
+        diff = diff_frames(df1, df2)
+
+        # Then
+        assert diff.changed == {"value": 1}
+
+    def test_should_cap_samples(self):
+        # Given
+        df1 = pd.DataFrame({"value": range(100)})
+        df2 = pd.DataFrame({"value": range(1, 101)})
+
+        # When
+        diff = diff_frames(df1, df2, max_samples=3)
+
+        # Then
+        assert diff.changed == {"value": 100}
+        assert len(diff.samples) == 3
+
+    def test_should_count_changed_array_cells(self):
+        # Given
+        df1 = pd.DataFrame({"values": [np.array([1, 2]), np.array([3])]})
+        df2 = pd.DataFrame({"values": [np.array([1, 2]), np.array([4])]})
+
+        # When
+        diff = diff_frames(df1, df2)
+
+        # Then
+        assert diff.changed == {"values": 1}
+
+    def test_should_raise_key_error_when_key_is_not_unique(self):
+        # Given
+        df = pd.DataFrame({"id": [1, 1], "job": ["cop", "doctor"]})
+
+        # When & Then
+        with pytest.raises(DiffKeyError, match=re.escape("Key values are not unique in left dataframe")):
+            diff_frames(df, df, key="id")
+
+
+class TestAssertFrameEqualsReport:
+    def test_should_report_differences_summary_on_failure(self):
+        # Given
+        df1 = pd.DataFrame({"id": [1, 2, 3], "job": ["cop", "doctor", "driver"]})
+        df2 = pd.DataFrame({"id": [1, 2, 3, 4], "job": ["cop", "nurse", "driver", "seller"]})
+
+        # When & Then
+        with pytest.raises(AssertionError) as error:
+            assert_frame_equals(df1, df2, diff_key="id")
+
+        assert "rows only in right (added): 1" in str(error.value)
+        assert "job: 1" in str(error.value)
+
+    def test_should_raise_assertion_error_when_array_cells_differ(self):
+        # Given
+        df1 = pd.DataFrame({"values": [np.array([1, 2]), np.array([3])]})
+        df2 = pd.DataFrame({"values": [np.array([1, 2]), np.array([4])]})
+
+        # When & Then
+        with pytest.raises(AssertionError, match="changed values per column"):
+            assert_frame_equals(df1, df2)
+
+    def test_should_keep_assertion_error_when_diff_fails(self):
+        # Given
+        df1 = pd.DataFrame({"id": [1], "job": ["cop"]})
+        df2 = pd.DataFrame({"id": [1], "job": ["doctor"]})
+
+        # When & Then
+        with patch("easy_testing.dataframes.diff_frames", side_effect=RuntimeError("boom")):
+            with pytest.raises(AssertionError, match="Diff unavailable: RuntimeError: boom"):
+                assert_frame_equals(df1, df2)
+
+
+class TestDiffRows:
+    def test_should_return_empty_diff_when_rows_are_the_same_in_another_order(self):
+        # Given
+        df1 = pd.DataFrame({"name": ["toto", "lolo", "toto"], "age": [12, 13, 12]})
+        df2 = pd.DataFrame({"name": ["lolo", "toto", "toto"], "age": [13, 12, 12]})
+
+        # When
+        diff = diff_rows(df1, df2)
+
+        # Then
+        assert diff.is_empty()
+
+    def test_should_count_rows_only_present_on_one_side(self):
+        # Given
+        df1 = pd.DataFrame({"name": ["toto", "lolo", "toto"], "age": [12, 13, 12]})
+        df2 = pd.DataFrame({"name": ["lolo", "toto", "tata"], "age": [13, 12, 45]})
+
+        # When
+        diff = diff_rows(df1, df2)
+
+        # Then
+        assert diff.nb_removed_rows == 1
+        assert diff.nb_added_rows == 1
+        assert diff.samples.to_dict("records") == [
+            {"side": "left", "name": "toto", "age": 12},
+            {"side": "left", "name": "toto", "age": 12},
+            {"side": "right", "name": "tata", "age": 45},
+        ]
+
+
+class TestAssertFrameEqualsIgnoringRowOrder:
+    def test_should_not_raise_when_rows_have_unorderable_mixed_types(self):
+        # Given
+        df1 = pd.DataFrame({"value": [1, "a", None, 2.5]})
+        df2 = pd.DataFrame({"value": ["a", 2.5, 1, None]})
+
+        # When & Then
+        assert_frame_equals(df1, df2, check_row_order=False)
+
+    def test_should_still_check_dtypes_when_rows_match(self):
+        # Given
+        df1 = pd.DataFrame({"name": ["toto", "lolo"], "age": [12, 13]})
+        df2 = pd.DataFrame({"name": ["lolo", "toto"], "age": [13, 12]}).astype({"age": "int32"})
+
+        # When & Then
+        with pytest.raises(AssertionError):
+            assert_frame_equals(df1, df2, check_row_order=False)
+
+    def test_should_report_unmatched_rows_when_rows_differ(self):
+        # Given
+        df1 = pd.DataFrame({"value": [1, "a", 2.5]})
+        df2 = pd.DataFrame({"value": ["a", 2.5, 3]})
+
+        # When & Then
+        with pytest.raises(AssertionError) as error:
+            assert_frame_equals(df1, df2, check_row_order=False)
+
+        assert "rows only in left (removed): 1" in str(error.value)
+        assert "rows only in right (added): 1" in str(error.value)
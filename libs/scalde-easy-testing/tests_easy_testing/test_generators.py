@@ -0,0 +1,92 @@
+import re
+
+import pandas as pd
+import pytest
+
+from easy_testing.dataframes import assert_frame_equals
+from easy_testing.generators import ColumnSpec, DatasetGenerator
+
+
+class TestDatasetGenerator:
+    @pytest.fixture
+    def schema(self):
+        return {
+            "customer_id": ColumnSpec(cardinality=100, distribution="zipf"),
+            "country": ColumnSpec(dtype="category", cardinality=10, correlated_with="customer_id"),
+            "amount": ColumnSpec(dtype="float64", distribution="normal", low=10, high=20, null_ratio=0.2),
+            "quantity": ColumnSpec(dtype="int32", null_ratio=0.5),
+            "created_at": ColumnSpec(dtype="datetime64[ns]", low="2023-01-01", high="2023-02-01"),
+        }
+
+    def test_should_generate_frame_with_schema_dtypes(self, schema):
+        # When
+        df = DatasetGenerator(schema, seed=1).generate(1000)
+
+        # Then
+        assert df.shape == (1000, 5)
+        assert df.dtypes.astype(str).tolist() == ["int64", "category", "float64", "Int32", "datetime64[ns]"]
+
+    def test_should_respect_bounds_null_ratios_and_cardinality(self, schema):
+        # When
+        df = DatasetGenerator(schema, seed=1).generate(10_000)
+
+        # Then
+        assert df["customer_id"].between(0, 99).all()
+        assert df["amount"].dropna().between(10, 20).all()
+        assert 0.15 < df["amount"].isna().mean() < 0.25
+        assert 0.45 < df["quantity"].isna().mean() < 0.55
+        assert df["created_at"].between("2023-01-01", "2023-02-01").all()
+        assert df["country"].nunique() <= 10
+
+    def test_should_skew_zipf_distribution_towards_first_values(self, schema):
+        # When
+        df = DatasetGenerator(schema, seed=1).generate(10_000)
+
+        # Then
+        assert df["customer_id"].value_counts().index[0] == 0
+
+    def test_should_map_each_key_to_a_single_correlated_value(self, schema):
+        # When
+        df = DatasetGenerator(schema, seed=1).generate(10_000)
+
+        # Then
+        assert (df.groupby("customer_id", observed=True)["country"].nunique() == 1).all()
+
+    def test_should_generate_same_data_with_same_seed(self, schema):
+        # When
+        df1 = DatasetGenerator(schema, seed=1).generate(100)
+        df2 = DatasetGenerator(schema, seed=1).generate(100)
+
+        # Then
+        assert_frame_equals(df1, df2)
+
+    def test_should_write_csv_in_chunks(self, schema, tmp_path):
+        # Given
+        generator = DatasetGenerator(schema, seed=1)
+
+        # When
+        generator.to_csv(tmp_path / "data.csv", nb_rows=250, chunk_size=100)
+
+        # Then
+        df = pd.read_csv(tmp_path / "data.csv")
+        expected = pd.concat(generator.iter_chunks(250, chunk_size=100))
+        assert df.shape == (250, 5)
+        assert df["customer_id"].tolist() == expected["customer_id"].tolist()
+
+    def test_should_write_parquet_in_chunks(self, schema, tmp_path):
+        # Given
+        pytest.importorskip("pyarrow")
+        generator = DatasetGenerator(schema, seed=1)
+
+        # When
+        generator.to_parquet(tmp_path / "data.parquet", nb_rows=250, chunk_size=100)
+
+        # Then
+        df = pd.read_parquet(tmp_path / "data.parquet")
+        expected = pd.concat(generator.iter_chunks(250, chunk_size=100), ignore_index=True)
+        assert_frame_equals(df, expected)
+
+    def test_should_raise_when_correlated_column_is_declared_after(self):
+        # When & Then
+        with pytest.raises(ValueError, match=re.escape("Column 'a' is correlated with 'b' declared after it")):
+            DatasetGenerator({"a": ColumnSpec(correlated_with="b"), "b": ColumnSpec(cardinality=10)})
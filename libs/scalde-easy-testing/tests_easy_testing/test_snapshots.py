@@ -0,0 +1,164 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from easy_testing.builders import DataFrameBuilder
+from easy_testing.snapshots import (
+    UPDATE_SNAPSHOTS_ENV_VAR,
+    assert_frame_matches_snapshot,
+    read_snapshot_metadata,
+    write_snapshot,
+)
+
+pytest.importorskip("pyarrow")
+
+
+class TestAssertFrameMatchesSnapshot:
+    @pytest.fixture
+    def snapshot_path(self, tmp_path):
+        return tmp_path / "snapshots" / "output.parquet"
+
+    @pytest.fixture
+    def df(self):
+        return (
+            DataFrameBuilder()
+            .with_columns(["name", "age", "score"])
+            .with_row(("toto", 12, 1.5))
+            .with_row(("lolo", 13, 2.5))
+            .with_dtypes(age="int64", score="float64")
+            .build()
+        )
+
+    def test_should_record_snapshot_on_first_run(self, snapshot_path, df):
+        # When
+        assert_frame_matches_snapshot(df, snapshot_path)
+
+        # Then
+        metadata = read_snapshot_metadata(snapshot_path)
+        assert metadata["nb_rows"] == 2
+        assert [column["name"] for column in metadata["columns"]] == ["name", "age", "score"]
+        assert [column["dtype"] for column in metadata["columns"]][1:] == ["int64", "float64"]
+
+    def test_should_pass_without_reading_data_when_hashes_match(self, snapshot_path, df):
+        # Given
+        write_snapshot(df, snapshot_path)
+
+        # When
+        with patch("easy_testing.snapshots.pd.read_parquet") as read_parquet:
+            assert_frame_matches_snapshot(df.copy(), snapshot_path)
+
+        # Then
+        read_parquet.assert_not_called()
+
+    def test_should_ignore_index(self, snapshot_path, df):
+        # Given
+        write_snapshot(df, snapshot_path)
+
+        # When / Then
+        assert_frame_matches_snapshot(df.set_axis([10, 11]), snapshot_path)
+
+    def test_should_fail_with_a_diff_of_differing_columns_only(self, snapshot_path, df):
+        # Given
+        write_snapshot(df, snapshot_path)
+        changed = df.assign(score=[1.5, 3.5])
+
+        # When
+        with patch("easy_testing.snapshots.pd.read_parquet", wraps=pd.read_parquet) as read_parquet:
+            with pytest.raises(AssertionError) as e:
+                assert_frame_matches_snapshot(changed, snapshot_path)
+
+        # Then
+        assert read_parquet.call_args.kwargs["columns"] == ["score"]
+        assert "doesn't match snapshot" in str(e.value)
+        assert "score: 1" in str(e.value)
+
+    def test_should_fail_when_dtype_changes(self, snapshot_path, df):
+        # Given
+        write_snapshot(df, snapshot_path)
+
+        # When / Then
+        with pytest.raises(AssertionError, match="dtype"):
+            assert_frame_matches_snapshot(df.astype({"age": "int32"}), snapshot_path)
+
+    def test_should_only_report_value_changes_of_object_columns(self, snapshot_path):
+        # Given
+        df = pd.DataFrame({"name": pd.Series(["toto", "lolo"], dtype=object)})
+        write_snapshot(df, snapshot_path)
+
+        # When
+        with pytest.raises(AssertionError) as e:
+            assert_frame_matches_snapshot(df.assign(name=pd.Series(["toto", "tata"], dtype=object)), snapshot_path)
+
+        # Then
+        assert "name: 1" in str(e.value)
+        assert 'Attribute "dtype" are different' not in str(e.value)
+        assert "Column dtypes are different" not in str(e.value)
+
+    def test_should_compare_unhashable_columns_in_full(self, snapshot_path):
+        # Given
+        df = pd.DataFrame({"values": [[1, 2], [3]]})
+        write_snapshot(df, snapshot_path)
+
+        # When
+        assert_frame_matches_snapshot(df, snapshot_path)
+        with pytest.raises(AssertionError) as e:
+            assert_frame_matches_snapshot(pd.DataFrame({"values": [[1, 2], [4]]}), snapshot_path)
+
+        # Then
+        assert "values: 1" in str(e.value)
+
+    def test_should_pass_on_differing_columns_within_tolerance(self, snapshot_path, df):
+        # Given
+        write_snapshot(df, snapshot_path)
+
+        # When / Then
+        assert_frame_matches_snapshot(df.assign(score=[1.5, 2.5 + 1e-9]), snapshot_path, rtol=1e-6)
+
+    def test_should_fail_when_columns_are_different(self, snapshot_path, df):
+        # Given
+        write_snapshot(df, snapshot_path)
+
+        # When / Then
+        with pytest.raises(AssertionError, match="Columns are different"):
+            assert_frame_matches_snapshot(df.drop(columns="score"), snapshot_path)
+
+    def test_should_fail_when_number_of_rows_is_different(self, snapshot_path, df):
+        # Given
+        write_snapshot(df, snapshot_path)
+
+        # When / Then
+        with pytest.raises(AssertionError, match="actual is 1 and snapshot is 2"):
+            assert_frame_matches_snapshot(df.head(1), snapshot_path)
+
+    def test_should_rewrite_snapshot_in_update_mode(self, snapshot_path, df):
+        # Given
+        write_snapshot(df, snapshot_path)
+        changed = df.assign(score=[1.5, 3.5])
+
+        # When
+        assert_frame_matches_snapshot(changed, snapshot_path, update=True)
+
+        # Then
+        assert_frame_matches_snapshot(changed, snapshot_path)
+
+    def test_should_rewrite_snapshot_when_update_env_var_is_set(self, snapshot_path, df, monkeypatch):
+        # Given
+        write_snapshot(df, snapshot_path)
+        changed = df.assign(score=[1.5, 3.5])
+        monkeypatch.setenv(UPDATE_SNAPSHOTS_ENV_VAR, "1")
+
+        # When
+        assert_frame_matches_snapshot(changed, snapshot_path)
+
+        # Then
+        assert_frame_matches_snapshot(changed, snapshot_path, update=False)
+
+    def test_should_reject_files_which_are_not_snapshots(self, tmp_path, df):
+        # Given
+        path = tmp_path / "plain.parquet"
+        df.to_parquet(path)
+
+        # When / Then
+        with pytest.raises(ValueError, match="not an easy_testing snapshot"):
+            assert_frame_matches_snapshot(df, path)
@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from easy_testing.streaming import assert_files_equal, diff_files
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "id": np.arange(1000),
+            "name": [f"name_{i % 7}" for i in range(1000)],
+            "score": np.where(np.arange(1000) % 100 == 0, np.nan, np.arange(1000) / 4),
+        }
+    )
+
+
+def write(data: pd.DataFrame, filepath) -> str:
+    if str(filepath).endswith(".parquet"):
+        data.to_parquet(filepath)
+    else:
+        data.to_csv(filepath, index=False)
+    return str(filepath)
+
+
+class TestAssertFilesEqual:
+    @pytest.fixture(params=["csv", "parquet"])
+    def suffix(self, request):
+        if request.param == "parquet":
+            pytest.importorskip("pyarrow")
+        return request.param
+
+    def test_should_pass_on_same_content_read_by_chunks(self, tmp_path, df, suffix):
+        # Given
+        left = write(df, tmp_path / f"left.{suffix}")
+        right = write(df, tmp_path / f"right.{suffix}")
+
+        # When / Then
+        assert_files_equal(left, right, chunk_size=64)
+
+    def test_should_compare_csv_with_parquet(self, tmp_path, df):
+        # Given
+        pytest.importorskip("pyarrow")
+        left = write(df, tmp_path / "left.csv")
+        right = write(df, tmp_path / "right.parquet")
+
+        # When / Then
+        assert_files_equal(left, right, chunk_size=300)
+
+    def test_should_report_changed_values_with_their_row(self, tmp_path, df, suffix):
+        # Given
+        left = write(df, tmp_path / f"left.{suffix}")
+        right = write(df.assign(name=df["name"].where(df["id"] != 700, "changed")), tmp_path / f"right.{suffix}")
+
+        # When
+        with pytest.raises(AssertionError) as e:
+            assert_files_equal(left, right, chunk_size=64)
+
+        # Then
+        assert "name: 1" in str(e.value)
+        assert "700" in str(e.value)
+
+    def test_should_report_missing_rows(self, tmp_path, df, suffix):
+        # Given
+        left = write(df, tmp_path / f"left.{suffix}")
+        right = write(df.head(990), tmp_path / f"right.{suffix}")
+
+        # When
+        with pytest.raises(AssertionError) as e:
+            assert_files_equal(left, right, chunk_size=64)
+
+        # Then
+        assert "rows only in left (removed): 10" in str(e.value)
+
+    def test_should_ignore_row_order(self, tmp_path, df, suffix):
+        # Given
+        left = write(df, tmp_path / f"left.{suffix}")
+        right = write(df.sample(frac=1, random_state=0), tmp_path / f"right.{suffix}")
+
+        # When / Then
+        assert_files_equal(left, right, check_row_order=False, chunk_size=64)
+        with pytest.raises(AssertionError):
+            assert_files_equal(left, right, chunk_size=64)
+
+    def test_should_check_columns_order(self, tmp_path, df, suffix):
+        # Given
+        left = write(df, tmp_path / f"left.{suffix}")
+        right = write(df[["score", "id", "name"]], tmp_path / f"right.{suffix}")
+
+        # When / Then
+        assert_files_equal(left, right, check_columns_order=False)
+        with pytest.raises(AssertionError, match="Columns are different"):
+            assert_files_equal(left, right)
+
+    def test_should_forward_read_csv_kwargs(self, tmp_path, df):
+        # Given
+        df.to_csv(left := tmp_path / "left.csv", index=False, sep=";")
+        df.to_csv(right := tmp_path / "right.csv", index=False, sep=";")
+
+        # When / Then
+        assert_files_equal(left, right, sep=";")
+
+
+class TestDiffFiles:
+    def test_should_sample_unmatched_rows_without_row_order(self, tmp_path, df):
+        # Given
+        left = write(df, tmp_path / "left.csv")
+        right = write(pd.concat([df.iloc[::-1].iloc[2:], df.tail(1).assign(name="new")]), tmp_path / "right.csv")
+
+        # When
+        diff = diff_files(left, right, check_row_order=False, chunk_size=100, nb_buckets=4)
+
+        # Then
+        assert (diff.nb_left_rows, diff.nb_right_rows) == (1000, 999)
+        assert (diff.nb_removed_rows, diff.nb_added_rows) == (2, 1)
+        assert list(diff.samples.columns) == ["side", "id", "name", "score"]
+        assert sorted(diff.samples["id"]) == [998, 999, 999]
+        assert sorted(diff.samples["side"]) == ["left", "left", "right"]
+
+    def test_should_compare_common_columns_only(self, tmp_path, df):
+        # Given
+        left = write(df, tmp_path / "left.csv")
+        right = write(df.drop(columns="score").assign(extra=1), tmp_path / "right.csv")
+
+        # When
+        diff = diff_files(left, right, chunk_size=100)
+
+        # Then
+        assert diff.left_only_columns == ["score"]
+        assert diff.right_only_columns == ["extra"]
+        assert diff.changed == {}
+
+    def test_should_limit_samples(self, tmp_path, df):
+        # Given
+        left = write(df, tmp_path / "left.csv")
+        right = write(df.assign(id=df["id"] + 1), tmp_path / "right.csv")
+
+        # When
+        diff = diff_files(left, right, chunk_size=100, max_samples=3)
+
+        # Then
+        assert diff.changed == {"id": 1000}
+        assert list(diff.samples["row"]) == [0, 1, 2]
+
+    def test_should_reject_non_positive_chunk_size(self, tmp_path, df):
+        # Given
+        left = write(df, tmp_path / "left.csv")
+
+        # When / Then
+        with pytest.raises(ValueError, match="must be positive"):
+            diff_files(left, left, chunk_size=0)
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from easy_testing.tolerances import Tolerance, assert_frame_almost_equals, deviation_summary
+
+
+class TestAssertFrameAlmostEquals:
+    @pytest.fixture
+    def df(self):
+        return pd.DataFrame({"name": ["toto", "lolo", "momo"], "x": [1.0, 2.0, 3.0], "y": [10, 20, 30]})
+
+    def test_should_pass_when_values_are_within_default_tolerance(self, df):
+        # Given
+        other = df.assign(x=df["x"] + 1e-9)
+
+        # When / Then
+        assert_frame_almost_equals(df, other)
+
+    def test_should_fail_with_deviations_of_columns_out_of_tolerance(self, df):
+        # Given
+        other = df.assign(x=[1.0, 2.5, 3.0])
+
+        # When
+        with pytest.raises(AssertionError) as e:
+            assert_frame_almost_equals(df, other)
+
+        # Then
+        message = str(e.value)
+        assert "Values are different in 1 column(s) out of tolerance" in message
+        assert "max_deviation" in message
+        assert "\nx " in message
+        assert "\ny " not in message
+
+    def test_should_use_per_column_tolerances(self, df):
+        # Given
+        df = df.astype({"y": "float64"})
+        other = df.assign(x=df["x"] + 0.01, y=df["y"] + 1)
+
+        # When / Then
+        assert_frame_almost_equals(df, other, tolerances={"x": Tolerance(atol=0.1), "y": Tolerance(rtol=0.1)})
+        with pytest.raises(AssertionError, match="1 column"):
+            assert_frame_almost_equals(df, other, tolerances={"x": Tolerance(atol=0.1)})
+
+    def test_should_match_nan_with_nan_only(self, df):
+        # Given
+        left = df.assign(x=[np.nan, 2.0, np.inf])
+
+        # When / Then
+        assert_frame_almost_equals(left, left.copy())
+        with pytest.raises(AssertionError):
+            assert_frame_almost_equals(left, df.assign(x=[1.0, 2.0, np.inf]))
+        with pytest.raises(AssertionError):
+            assert_frame_almost_equals(left, df.assign(x=[np.nan, 2.0, -np.inf]))
+
+    def test_should_compare_other_columns_exactly(self, df):
+        # Given
+        other = df.assign(name=["toto", "lolo", "bobo"])
+
+        # When / Then
+        with pytest.raises(AssertionError, match="name"):
+            assert_frame_almost_equals(df, other)
+
+    @pytest.mark.parametrize("left,right", [(1_000_000, 1_000_005), (2**53 + 1, 2**53)])
+    def test_should_compare_integer_columns_exactly(self, df, left, right):
+        # When / Then
+        with pytest.raises(AssertionError, match="y"):
+            assert_frame_almost_equals(df.assign(y=[left, 2, 3]), df.assign(y=[right, 2, 3]), rtol=0.1)
+
+    def test_should_compare_boolean_columns_exactly(self, df):
+        # When / Then
+        with pytest.raises(AssertionError, match="flag"):
+            assert_frame_almost_equals(df.assign(flag=True), df.assign(flag=False), atol=1)
+
+    def test_should_fail_when_dtypes_are_different(self, df):
+        # When / Then
+        with pytest.raises(AssertionError, match="Dtypes are different for column\\(s\\) y"):
+            assert_frame_almost_equals(df, df.astype({"y": "float64"}))
+        assert_frame_almost_equals(df, df.astype({"y": "float64"}), check_dtype=False)
+
+    def test_should_fail_when_columns_are_different(self, df):
+        # When / Then
+        with pytest.raises(AssertionError, match="Columns are different"):
+            assert_frame_almost_equals(df, df[["x", "name", "y"]])
+
+    @pytest.mark.parametrize("column", ["name", "y"])
+    def test_should_reject_tolerances_of_non_float_columns(self, df, column):
+        # When / Then
+        with pytest.raises(ValueError, match=f"'{column}'"):
+            assert_frame_almost_equals(df, df, tolerances={column: Tolerance()})
+
+
+class TestDeviationSummary:
+    def test_should_summarize_deviations_per_float_column(self):
+        # Given
+        left = pd.DataFrame({"x": [1.0, 2.0, np.nan, 4.0], "y": [1, 2, 3, 4], "z": ["a", "b", "c", "d"]})
+        right = pd.DataFrame({"x": [1.0, 3.0, 3.0, 4.5], "y": [1, 2, 3, 4], "z": ["a", "b", "c", "e"]})
+
+        # When
+        summary = deviation_summary(left, right)
+
+        # Then
+        assert list(summary.index) == ["x"]
+        assert summary.loc["x", "max_deviation"] == 1.0
+        assert summary.loc["x", "mean_deviation"] == pytest.approx(0.5)
+        assert summary.loc["x", "nb_mismatches"] == 3
+        assert summary.loc["x", "nb_nan_mismatches"] == 1
+
+    def test_should_handle_nullable_columns(self):
+        # Given
+        left = pd.DataFrame({"x": pd.array([1.5, None, 3.0], dtype="Float64")})
+
+        # When
+        summary = deviation_summary(left, left.copy())
+
+        # Then
+        assert summary.loc["x", "nb_mismatches"] == 0
@@ -0,0 +1,115 @@
+"""Time the easy_testing assertions and builder across a grid of dataframe sizes.
+
+Usage:
+    python scripts/benchmark_easy_testing.py [--rows N ...] [--columns N ...] [--repeat N]
+        [--output FILE] [--baseline FILE] [--max-slowdown RATIO]
+
+With --output, results are appended as a JSON line tagged with the current commit so they can be
+tracked over time. With --baseline, results are compared with the last line of that file and the
+script fails when a case got slower than the given ratio.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "libs" / "scalde-easy-testing"))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from easy_testing import (  # noqa: E402
+    DataFrameBuilder,
+    assert_contains_lines,
+    assert_frame_equals,
+    assert_frame_partially_equals,
+)
+
+NB_EXPECTED_LINES = 100
+
+
+def build_frame(nb_rows: int, nb_columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    columns = {}
+    for i in range(nb_columns):
+        if i % 3 == 0:
+            columns[f"col_{i}"] = rng.integers(0, 1_000_000, nb_rows)
+        elif i % 3 == 1:
+            columns[f"col_{i}"] = rng.random(nb_rows)
+        else:
+            columns[f"col_{i}"] = np.array([f"value_{v}" for v in rng.integers(0, 1000, nb_rows)], dtype=object)
+    return pd.DataFrame(columns)
+
+
+def cases(data: pd.DataFrame) -> dict[str, Callable[[], object]]:
+    other = data.copy()
+    shuffled = data.sample(frac=1, random_state=0)
+    columns = list(data.columns)
+    rows = list(data.itertuples(index=False, name=None))
+    lines = rows[:: max(len(rows) // NB_EXPECTED_LINES, 1)][:NB_EXPECTED_LINES]
+
+    return {
+        "assert_frame_equals": lambda: assert_frame_equals(data, other),
+        "assert_frame_equals_ignoring_row_order": lambda: assert_frame_equals(data, shuffled, check_row_order=False),
+        "assert_frame_partially_equals": lambda: assert_frame_partially_equals(
+            data, other, columns[: max(len(columns) // 2, 1)]
+        ),
+        "assert_contains_lines": lambda: assert_contains_lines(data, lines),
+        "builder_build": lambda: DataFrameBuilder().with_columns(columns).with_rows(rows).build(),
+    }
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--columns", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--max-slowdown", type=float, default=1.25, metavar="RATIO")
+    args = parser.parse_args()
+
+    results = {}
+    for nb_rows in args.rows:
+        for nb_columns in args.columns:
+            data = build_frame(nb_rows, nb_columns)
+            for name, function in cases(data).items():
+                key = f"{name}[{nb_rows}x{nb_columns}]"
+                results[key] = round(measure(function, args.repeat), 3)
+                print(f"{key}: {results[key]:.1f} ms (median of {args.repeat})")
+
+    failures = []
+    if args.baseline and args.baseline.exists() and (lines := args.baseline.read_text().splitlines()):
+        baseline = json.loads(lines[-1])["timings_ms"]
+        for key, elapsed_ms in results.items():
+            if key in baseline and elapsed_ms > baseline[key] * args.max_slowdown:
+                failures.append(f"{key} takes {elapsed_ms:.1f} ms, {elapsed_ms / baseline[key]:.2f}x the baseline")
+
+    if args.output:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        with open(args.output, "a") as f:
+            f.write(json.dumps({"commit": commit, "timings_ms": results}) + "\n")
+
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
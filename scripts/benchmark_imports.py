@@ -0,0 +1,76 @@
+"""Measure the import time of each scalde library in fresh interpreters.
+
+Usage:
+    python scripts/benchmark_imports.py [--repeat N] [--max-ms PACKAGE=MS ...] [--output FILE]
+
+Fails when a package pulls one of its heavy dependencies at import time, or when its median
+import time is above the given budget. With --output, results are appended as a JSON line
+tagged with the current commit so they can be tracked over time.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+LAZY_DEPENDENCIES = {
+    "data_factory": ["pandas", "rich"],
+    "cognito_confidential": ["requests", "jose"],
+}
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {package}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--max-ms", action="append", default=[], metavar="PACKAGE=MS")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    budgets = {package: float(ms) for package, ms in (item.split("=", 1) for item in args.max_ms)}
+    env = os.environ | {"PYTHONPATH": os.pathsep.join(str(lib) for lib in sorted((ROOT / "libs").iterdir()))}
+
+    results, failures = {}, []
+    for package, heavy in LAZY_DEPENDENCIES.items():
+        timings, loaded = [], set()
+        for _ in range(args.repeat):
+            probe = PROBE.format(package=package, heavy=heavy)
+            output = subprocess.run([sys.executable, "-c", probe], env=env, capture_output=True, check=True, text=True)
+            result = json.loads(output.stdout)
+            timings.append(result["elapsed"] * 1000)
+            loaded.update(result["modules"])
+
+        median_ms = statistics.median(timings)
+        results[package] = round(median_ms, 3)
+        print(f"{package}: {median_ms:.1f} ms (median of {args.repeat})")
+
+        if loaded:
+            failures.append(f"{package} imports {', '.join(sorted(loaded))} eagerly")
+        if package in budgets and median_ms > budgets[package]:
+            failures.append(f"{package} import takes {median_ms:.1f} ms, above the {budgets[package]:.1f} ms budget")
+
+    if args.output:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        with open(args.output, "a") as f:
+            f.write(json.dumps({"commit": commit, "import_ms": results}) + "\n")
+
+    for failure in failures:
+        print(f"FAILED: {failure}", file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Measure the token verification throughput of cognito_confidential.
+
+Usage:
+    python scripts/benchmark_tokens.py [--number N] [--output FILE]
+
+Tokens are signed with a freshly generated RS256 key. Each case reports the mean time per token.
+With --output, results are appended as a JSON line tagged with the current commit so they can be
+tracked over time.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "libs" / "scalde-cognito-confidential"))
+
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import rsa  # noqa: E402
+from jose import jwk, jws  # noqa: E402
+
+from cognito_confidential.parsers import decode_token, map_access_token, parse_token, verify_tokens  # noqa: E402
+from cognito_confidential.validations import (  # noqa: E402
+    CryptographyBackend,
+    JoseBackend,
+    SignatureBackend,
+    get_signature_backend,
+    validate_access_token_payload,
+)
+
+CONFIG = {
+    "issuer": "https://cognito-idp.eu-west-1.amazonaws.com/benchmark",
+    "google_client_id": "benchmark",
+    "algorithm": "RS256",
+}
+BATCH_SIZE = 100
+
+
+def make_token_and_key() -> tuple[str, dict]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_key = jwk.construct(pem, "RS256").public_key().to_dict() | {"kid": "benchmark", "use": "sig"}
+
+    now = int(time.time())
+    payload = {
+        "sub": "user",
+        "iss": CONFIG["issuer"],
+        "client_id": CONFIG["google_client_id"],
+        "exp": now + 3600,
+        "iat": now - 10,
+        "jti": "benchmark",
+    }
+    return jws.sign(payload, pem, headers={"kid": "benchmark"}, algorithm="RS256"), public_key
+
+
+class PureRsaBackend(SignatureBackend):
+    """python-jose on its pure python rsa backend, its fallback when cryptography is missing."""
+
+    name = "python-jose-rsa"
+
+    def load_key(self, public_key: dict):
+        from jose.backends.rsa_backend import RSAKey
+
+        return RSAKey(public_key, public_key.get("alg", "RS256"))
+
+
+def signature_backends() -> list[SignatureBackend]:
+    backends = [CryptographyBackend(), JoseBackend()]
+    try:
+        import rsa as _  # noqa: F401
+    except ImportError:
+        return backends
+    return backends + [PureRsaBackend()]
+
+
+def cases(token: str, public_key: dict) -> dict:
+    """Functions to time, with the number of tokens each call verifies."""
+    batch = [token] * BATCH_SIZE
+    decoded = decode_token(token)
+    verify_signature_cases = {
+        f"verify_signature[{backend.name}]": (
+            lambda key=backend.load_key(public_key): key.verify(decoded.signing_input, decoded.signature),
+            1,
+        )
+        for backend in signature_backends()
+    }
+    return verify_signature_cases | {
+        "decode_token": (lambda: decode_token(token), 1),
+        "parse_token": (
+            lambda: parse_token(token, [public_key], validate_access_token_payload, map_access_token, CONFIG),
+            1,
+        ),
+        "verify_tokens": (
+            lambda: verify_tokens(batch, [public_key], validate_access_token_payload, map_access_token, CONFIG),
+            BATCH_SIZE,
+        ),
+        "verify_tokens_threads": (
+            lambda: verify_tokens(
+                batch, [public_key], validate_access_token_payload, map_access_token, CONFIG, max_workers=4
+            ),
+            BATCH_SIZE,
+        ),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    token, public_key = make_token_and_key()
+    print(f"signature backend: {get_signature_backend().name}")
+    results = {}
+    for name, (function, nb_tokens) in cases(token, public_key).items():
+        function()  # warm up the caches
+        number = max(args.number // nb_tokens, 1)
+        elapsed_us = min(timeit.repeat(function, number=number, repeat=3)) / (number * nb_tokens) * 1e6
+        results[name] = round(elapsed_us, 3)
+        print(f"{name}: {elapsed_us:.1f} us per token ({1e6 / elapsed_us:.0f} tokens/s)")
+
+    if args.output:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        with open(args.output, "a") as f:
+            record = {"commit": commit, "backend": get_signature_backend().name, "timings_us": results}
+            f.write(json.dumps(record) + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
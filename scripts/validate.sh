@@ -5,3 +5,4 @@ set -e
 pants tailor --check update-build-files --check ::
 pants lint ::
 pants test ::
+python scripts/benchmark_imports.py --max-ms data_factory=50 --max-ms cognito_confidential=100